@@ -0,0 +1,35 @@
+from io import TextIOBase
+
+
+class ChunkReader(TextIOBase):
+    """
+    Read-only text stream over an iterator of string chunks
+
+    Only the chunk being consumed is kept in memory, so a stream of any
+    length can be handed to a parser that reads it piece by piece.
+
+    Parameters:
+      chunks: iterable of strings
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.buffer = ""
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            text = self.buffer + "".join(self.chunks)
+            self.buffer = ""
+            return text
+
+        while len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
+
+        text, self.buffer = self.buffer[:size], self.buffer[size:]
+        return text
@@ -1,13 +1,23 @@
 import re
 
 from base64 import b64decode
-from zlib import decompress
-from urllib.parse import unquote
-from bs4 import BeautifulSoup as bs
+from binascii import Error as Base64Error
+from codecs import getincrementaldecoder
+from zlib import decompressobj, error as ZlibError
+from urllib.parse import unquote_to_bytes
+from lxml import etree
+from decode.chunk_reader import ChunkReader
+from decode.embedded_diagram_reader import EmbeddedDiagramReader
 
 
 class DecodeAndDecompress:
 
+    MAX_INFLATED_SIZE = 256 * 1024 * 1024  # pages that inflate beyond this are rejected
+    CHUNK_SIZE = 64 * 1024
+
+    FIRST_CHAR = re.compile(r"\S")
+    BASE64_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")
+
     @staticmethod
     def convert(drawio_filepath):
         """
@@ -25,32 +35,210 @@ class DecodeAndDecompress:
         """
 
         try:
-            with open(drawio_filepath, "r") as f:
-                drawio_document = bs(f.read(), "lxml")
-
-            diagram_tag = drawio_document.find("diagram")
-            diagram_tag_text = DecodeAndDecompress.get_tag_text(diagram_tag)
+            diagram_tag = next(DecodeAndDecompress.iter_diagram_tags(drawio_filepath), None)
+            if diagram_tag is None:
+                raise ValueError(f"No diagram found in {drawio_filepath}")
 
-            if DecodeAndDecompress.is_base64(diagram_tag_text):
-                decoded_xml = unquote(decompress(b64decode(diagram_tag_text), -15).decode('utf8'))
-            else:
-                decoded_xml = diagram_tag_text.replace("\n", "")
-
-            return decoded_xml
+            return DecodeAndDecompress.decode_tag_text(DecodeAndDecompress.get_tag_text(diagram_tag))
 
         except Exception as e:
             print(f"DecodeAndDecompress.convert ERROR: {e}")
             return False
 
     @staticmethod
-    def is_base64(s):
-        return len(s) % 4 == 0 and re.match('^[A-Za-z0-9+/]*={0,2}$', s)
+    def iter_pages(drawio_filepath, pages=None, max_size=MAX_INFLATED_SIZE):
+        """
+        Lazily decode every page of a multi-page DrawIO file
+
+        A page is only inflated when the caller asks for it,
+        pages excluded by the filter are skipped without being decoded.
+
+        Parameters:
+          drawio_filepath: file path to the .drawio file
+          pages: optional collection of page names or ids to decode, all pages are decoded if omitted
+          max_size: maximum size of an inflated page, in bytes
+
+        Returns:
+          pages: a generator of (page_name, page_id, decoded_xml) tuples
+        """
+
+        for page_name, page_id, tag_text in DecodeAndDecompress.iter_page_texts(drawio_filepath, pages):
+            yield page_name, page_id, DecodeAndDecompress.decode_tag_text(tag_text, max_size)
+
+    @staticmethod
+    def iter_page_texts(drawio_filepath, pages=None):
+        """
+        Extract the raw, still encoded, text of every page of a DrawIO file
+
+        Parameters:
+          drawio_filepath: file path to the .drawio file
+          pages: optional collection of page names or ids to extract, all pages are extracted if omitted
+
+        Returns:
+          pages: a generator of (page_name, page_id, tag_text) tuples
+        """
+
+        for diagram_tag in DecodeAndDecompress.iter_diagram_tags(drawio_filepath):
+            page_name, page_id = diagram_tag.get("name"), diagram_tag.get("id")
+
+            if pages is None or page_name in pages or page_id in pages:
+                yield page_name, page_id, DecodeAndDecompress.get_tag_text(diagram_tag)
+
+    @staticmethod
+    def iter_diagram_tags(drawio_filepath):
+        """
+        Stream the <diagram> elements of a .drawio file without loading the whole document
+
+        Each element is cleared, along with its preceding siblings,
+        as soon as the caller asks for the next one.
+
+        Parameters:
+          drawio_filepath: file path to the .drawio, .drawio.svg or .drawio.png file
+
+        Returns:
+          diagram_tags: a generator of lxml <diagram> elements
+        """
+
+        context = etree.iterparse(EmbeddedDiagramReader.open(drawio_filepath), events=("end",), tag="diagram", remove_blank_text=True,
+                                  resolve_entities=False, huge_tree=True)
+
+        for _, diagram_tag in context:
+            yield diagram_tag
+
+            diagram_tag.clear(keep_tail=True)
+            while diagram_tag.getprevious() is not None:
+                del diagram_tag.getparent()[0]
+
+    @staticmethod
+    def decode_tag_text(tag_text, max_size=MAX_INFLATED_SIZE):
+        """
+        Inflate the text of a <diagram> element if it is compressed
+
+        Parameters:
+          tag_text: the text of the <diagram> element
+          max_size: maximum size of the inflated page, in bytes
+
+        Returns:
+          decoded_xml: decoded and decompressed xml
+        """
+
+        return "".join(DecodeAndDecompress.iter_decoded_chunks(tag_text, max_size))
+
+    @staticmethod
+    def open_tag_text(tag_text, max_size=MAX_INFLATED_SIZE):
+        """
+        Open the text of a <diagram> element as a stream of decoded xml
+
+        Parameters:
+          tag_text: the text of the <diagram> element
+          max_size: maximum size of the inflated page, in bytes
+
+        Returns:
+          stream: a read-only text stream that inflates the page as it is read
+        """
+
+        return ChunkReader(DecodeAndDecompress.iter_decoded_chunks(tag_text, max_size))
+
+    @staticmethod
+    def iter_decoded_chunks(tag_text, max_size=MAX_INFLATED_SIZE, chunk_size=CHUNK_SIZE):
+        """
+        Incrementally decode, inflate and unquote the text of a <diagram> element
+
+        At most chunk_size bytes are inflated at a time, and the page is
+        rejected as soon as its inflated size goes beyond max_size.
+
+        Parameters:
+          tag_text: the text of the <diagram> element
+          max_size: maximum size of the inflated page, in bytes, None for no limit
+          chunk_size: size of the chunks to decode and inflate at a time
+
+        Returns:
+          chunks: a generator of decoded xml strings
+        """
+
+        if not DecodeAndDecompress.is_compressed(tag_text):
+            tag_text = tag_text.replace("\n", "")
+            for start in range(0, len(tag_text), chunk_size):
+                yield tag_text[start:start + chunk_size]
+            return
+
+        inflater = decompressobj(-15)
+        utf8_decoder = getincrementaldecoder("utf8")("replace")
+        b64_chunk_size = max(4, chunk_size - chunk_size % 4)
+        inflated_size = 0
+        pending = b""
+
+        def inflated_chunks():
+            for start in range(0, len(tag_text), b64_chunk_size):
+                try:
+                    data = b64decode(tag_text[start:start + b64_chunk_size], validate=True)
+                except Base64Error as e:
+                    raise ValueError(f"Malformed compressed diagram: invalid base64 near offset {start} ({e})") from e
+
+                try:
+                    while data:
+                        yield inflater.decompress(data, chunk_size)
+                        data = inflater.unconsumed_tail
+                except ZlibError as e:
+                    raise ValueError(f"Malformed compressed diagram: invalid deflate data ({e})") from e
+
+            yield inflater.flush()
+
+            if not inflater.eof:
+                raise ValueError("Malformed compressed diagram: truncated deflate data")
+
+        for inflated in inflated_chunks():
+            inflated_size += len(inflated)
+            if max_size is not None and inflated_size > max_size:
+                raise ValueError(f"Diagram page inflates to more than {max_size} bytes")
+
+            pending += inflated
+
+            # keep an escape sequence split across chunks for the next round
+            cut = pending.rfind(b"%", -2)
+            if cut < 0:
+                cut = len(pending)
+
+            chunk = utf8_decoder.decode(unquote_to_bytes(pending[:cut]))
+            pending = pending[cut:]
+
+            if chunk:
+                yield chunk
+
+        chunk = utf8_decoder.decode(unquote_to_bytes(pending), final=True)
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def is_compressed(tag_text):
+        """
+        Tell a compressed page from a plain XML one by its first non-whitespace character
+
+        The rest of a compressed page is only validated while it is being decoded.
+
+        Parameters:
+          tag_text: the text of the <diagram> element
+
+        Returns:
+          compressed: True if the page is base64 encoded, False if it is plain XML
+        """
+
+        first_char = DecodeAndDecompress.FIRST_CHAR.search(tag_text)
+
+        if first_char is None:
+            raise ValueError("Empty diagram")
+        if first_char.group() == "<":
+            return False
+        if first_char.group() in DecodeAndDecompress.BASE64_CHARS:
+            return True
+
+        raise ValueError(f"Malformed diagram: unexpected {first_char.group()!r} at offset {first_char.start()}")
 
     @staticmethod
     def get_tag_text(tag):
-        tag_text = str(tag)
-        start = tag_text.find(">") + 1
-        end = tag_text.rfind("<")
-        tag_text = tag_text[start:end]
+        if len(tag) > 0:  # uncompressed diagram, serialize the embedded graph model
+            tag_text = "".join(etree.tostring(child, encoding="unicode", with_tail=False) for child in tag)
+        else:
+            tag_text = tag.text or ""
 
-        return tag_text.encode('ascii', 'ignore').decode().strip()
+        return tag_text.strip()
@@ -0,0 +1,100 @@
+import gzip
+
+from hashlib import sha256
+from os import path, makedirs, listdir, remove, replace, stat, utime, getpid
+
+
+class DiagramCache:
+    """
+    On-disk cache of decoded diagram pages, keyed by a hash of their raw <diagram> payload
+
+    Entries are stored gzip-compressed and the least recently used ones
+    are evicted once the cache grows beyond max_size.
+
+    Parameters:
+      cache_dir: directory where the entries are stored
+      max_size: maximum size of the cache on disk, in bytes
+    """
+
+    EXTENSION = ".xml.gz"
+
+    def __init__(self, cache_dir=None, max_size=64 * 1024 * 1024):
+        self.cache_dir = cache_dir or path.join(path.expanduser("~"), ".drawiocodegen", "cache")
+        self.max_size = max_size
+
+    @staticmethod
+    def key(tag_text):
+        return sha256(tag_text.encode('utf8')).hexdigest()
+
+    def entry_path(self, key):
+        return path.join(self.cache_dir, f"{key}{self.EXTENSION}")
+
+    def get(self, tag_text):
+        """
+        Look up the decoded XML of a page
+
+        Parameters:
+          tag_text: the raw text of the <diagram> element
+
+        Returns:
+          decoded_xml: the cached decoded XML, None if the page is not in the cache
+        """
+
+        entry_path = self.entry_path(self.key(tag_text))
+
+        try:
+            with gzip.open(entry_path, "rt", encoding="utf8") as f:
+                decoded_xml = f.read()
+            utime(entry_path)  # mark the entry as recently used
+            return decoded_xml
+        except (OSError, EOFError):  # missing or corrupted entry
+            return None
+
+    def put(self, tag_text, decoded_xml):
+        """
+        Store the decoded XML of a page
+
+        Parameters:
+          tag_text: the raw text of the <diagram> element
+          decoded_xml: the decoded and decompressed XML of the page
+        """
+
+        makedirs(self.cache_dir, exist_ok=True)
+
+        # write to a temporary file first, so concurrent readers never see a partial entry
+        entry_path = self.entry_path(self.key(tag_text))
+        temp_path = f"{entry_path}.{getpid()}.tmp"
+        with gzip.open(temp_path, "wt", encoding="utf8") as f:
+            f.write(decoded_xml)
+        replace(temp_path, entry_path)
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits in max_size
+        """
+
+        if not path.isdir(self.cache_dir): return
+
+        entries = []
+        for filename in listdir(self.cache_dir):
+            if filename.endswith(self.EXTENSION):
+                entry_path = path.join(self.cache_dir, filename)
+                entry_stat = stat(entry_path)
+                entries.append((entry_stat.st_mtime, entry_stat.st_size, entry_path))
+
+        cache_size = sum(entry[1] for entry in entries)
+        for _, entry_size, entry_path in sorted(entries):
+            if cache_size <= self.max_size: break
+            remove(entry_path)
+            cache_size -= entry_size
+
+    def clear(self):
+        """
+        Remove every entry from the cache
+        """
+
+        if not path.isdir(self.cache_dir): return
+
+        for filename in listdir(self.cache_dir):
+            if filename.endswith(self.EXTENSION):
+                remove(path.join(self.cache_dir, filename))
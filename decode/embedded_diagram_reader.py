@@ -0,0 +1,109 @@
+import struct
+
+from io import BytesIO
+from zlib import decompress
+from urllib.parse import unquote
+from lxml import etree
+
+
+class EmbeddedDiagramReader:
+    """
+    Extract the mxfile document embedded in .drawio.svg and .drawio.png exports
+    """
+
+    PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+    PNG_TEXT_KEYWORDS = (b"mxfile", b"mxGraphModel")
+
+    @staticmethod
+    def open(drawio_filepath):
+        """
+        Open the mxfile document of a diagram file as a binary stream
+
+        Parameters:
+          drawio_filepath: file path to a .drawio, .drawio.svg or .drawio.png file
+
+        Returns:
+          source: the file path itself for plain .drawio files, a stream over the embedded mxfile otherwise
+        """
+
+        lower_filepath = drawio_filepath.lower()
+
+        if lower_filepath.endswith(".svg"):
+            mxfile = EmbeddedDiagramReader.read_svg(drawio_filepath)
+        elif lower_filepath.endswith(".png"):
+            mxfile = EmbeddedDiagramReader.read_png(drawio_filepath)
+        else:
+            return drawio_filepath
+
+        if not mxfile.lstrip().startswith("<mxfile"):  # older exports embed a single, possibly compressed, page
+            mxfile = f"<mxfile><diagram>{mxfile}</diagram></mxfile>"
+
+        return BytesIO(mxfile.encode('utf8'))
+
+    @staticmethod
+    def read_svg(svg_filepath):
+        """
+        Read the mxfile document from the content attribute of an SVG export
+
+        Only the start tag of the root element is parsed, the drawing itself is never read.
+
+        Parameters:
+          svg_filepath: file path to the .drawio.svg file
+
+        Returns:
+          mxfile: the embedded mxfile document
+        """
+
+        context = etree.iterparse(svg_filepath, events=("start",), resolve_entities=False, huge_tree=True)
+
+        for _, svg_tag in context:
+            content = svg_tag.get("content")
+            if content:
+                return content
+            break
+
+        raise ValueError(f"No diagram embedded in {svg_filepath}")
+
+    @staticmethod
+    def read_png(png_filepath):
+        """
+        Read the mxfile document from the text chunks of a PNG export
+
+        Chunks are walked one at a time and the image data is skipped without being read.
+
+        Parameters:
+          png_filepath: file path to the .drawio.png file
+
+        Returns:
+          mxfile: the embedded mxfile document
+        """
+
+        with open(png_filepath, "rb") as f:
+            if f.read(8) != EmbeddedDiagramReader.PNG_SIGNATURE:
+                raise ValueError(f"{png_filepath} is not a PNG file")
+
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    break
+
+                length, chunk_type = struct.unpack(">I4s", header)
+
+                match chunk_type:
+                    case b"tEXt":
+                        keyword, _, text = f.read(length).partition(b"\0")
+                    case b"zTXt":
+                        keyword, _, data = f.read(length).partition(b"\0")
+                        text = decompress(data[1:])  # the first byte is the compression method
+                    case b"IEND":
+                        break
+                    case _:
+                        f.seek(length, 1)
+                        keyword = None
+
+                f.seek(4, 1)  # skip the CRC
+
+                if keyword in EmbeddedDiagramReader.PNG_TEXT_KEYWORDS:
+                    return unquote(text.decode('latin-1'))
+
+        raise ValueError(f"No diagram embedded in {png_filepath}")
@@ -0,0 +1,136 @@
+import json
+import sys
+
+from argparse import ArgumentParser
+from multiprocessing import freeze_support
+from os import path
+
+from generators.code_generation import CodeGeneration
+from generators.code_generators import CodeGenerators
+from parsers.diagnostics import DiagnosticError
+from parsers.diagram_parser import DiagramParser
+from parsers.syntax_parser import SyntaxParser
+from parsers.syntax_snapshot import SyntaxSnapshot
+
+
+def read_options(options_path):
+    """
+    Read options from a JSON file, over the default ones
+
+    Parameters:
+        options_path: path of the JSON file, the default options are returned if None
+
+    Returns:
+        options: set of options of the parser and of the code generators
+
+    Raises:
+        ValueError: if the file is not valid JSON or holds unknown or invalid options
+    """
+
+    options = CodeGeneration.default_options()
+
+    if not options_path:
+        return options
+
+    with open(options_path) as f:
+        custom_options = json.load(f)
+
+    if not isinstance(custom_options, dict):
+        raise ValueError("the options must be a JSON object")
+
+    for name, value in custom_options.items():
+        if name not in options:
+            raise ValueError(f"unknown option '{name}'")
+        if name == 'relationship_rules':
+            if not isinstance(value, (dict, list)):
+                raise ValueError(f"option '{name}' must be a JSON object or an array of JSON objects")
+        elif isinstance(options[name], dict) and not isinstance(value, dict):
+            raise ValueError(f"option '{name}' must be a JSON object")
+
+    for language_code, language_options in custom_options.pop('language_specific', {}).items():
+        if language_code not in options['language_specific']:
+            raise ValueError(f"unknown language '{language_code}' in 'language_specific', expected one of "
+                             f"{', '.join(options['language_specific'])}")
+        if not isinstance(language_options, dict):
+            raise ValueError(f"options of language '{language_code}' must be a JSON object")
+
+        options['language_specific'][language_code].update(language_options)
+
+    for name, value in custom_options.pop('generate', {}).items():
+        if name not in options['generate']:
+            raise ValueError(f"unknown option '{name}' in 'generate'")
+
+        options['generate'][name] = value
+
+    options.update(custom_options)
+
+    for name in ('parse_workers', 'generate_workers'):
+        if not isinstance(options[name], int) or options[name] < 1:
+            raise ValueError(f"option '{name}' must be a positive integer")
+
+    relationship_rules = options['relationship_rules']
+
+    if isinstance(relationship_rules, list) and not all(isinstance(rule, dict) for rule in relationship_rules):
+        raise ValueError("option 'relationship_rules' must be a JSON object or an array of JSON objects")
+
+    SyntaxParser.compile_relationship_rules(relationship_rules)
+
+    return options
+
+
+def main(args):
+    argument_parser = ArgumentParser(description="Generate source code from a draw.io UML class diagram, headless")
+    argument_parser.add_argument("diagram", help="path of the draw.io diagram")
+    argument_parser.add_argument("-o", "--output-dir", help="output directory, 'src' next to the diagram by default")
+    argument_parser.add_argument("-l", "--language", action="append", dest="languages",
+                                 help="language to generate, may be repeated, all of them by default")
+    argument_parser.add_argument("--options", help="JSON file of options, overriding the default ones")
+    argument_parser.add_argument("-w", "--workers", type=int,
+                                 help="number of worker processes for the languages, one per language by default")
+    argument_parser.add_argument("--snapshot-dir",
+                                 help="directory of syntax snapshots, to skip parsing a diagram that did not change")
+    args = argument_parser.parse_args(args)
+
+    try:
+        options = read_options(args.options)
+    except (OSError, ValueError) as e:
+        argument_parser.error(f"invalid options file {args.options}: {e}")
+
+    for language in args.languages or ():
+        if CodeGenerators.language_code(language) is None:
+            argument_parser.error(f"unknown language '{language}', expected one of "
+                                  f"{', '.join(CodeGenerators.LANGUAGE_MAPPINGS)}")
+
+    languages = args.languages or list(CodeGenerators.LANGUAGE_NAMES.values())
+    output_dir = args.output_dir or path.join(path.dirname(path.abspath(args.diagram)), "src")
+
+    # only the syntax tree is needed, the pages are parsed as they are inflated
+    snapshot = SyntaxSnapshot(args.snapshot_dir) if args.snapshot_dir else None
+    diagram_parser = DiagramParser(args.diagram, options['parse_workers'], keep_xml=False, keep_style_trees=False,
+                                   relationship_rules=options['relationship_rules'], snapshot=snapshot,
+                                   fail_fast=options['fail_fast'])
+
+    try:
+        syntax_tree = diagram_parser.convert_to_syntax_model()
+    except DiagnosticError as e:
+        print(f"Problem found in the diagram: {e}", file=sys.stderr)
+        return 1
+    except (OSError, SyntaxError, ValueError) as e:  # unreadable file, malformed XML or undecodable page
+        print(f"Failed to decode the diagram: {e}", file=sys.stderr)
+        return 1
+
+    for diagnostic in diagram_parser.diagnostics:
+        print(f"Problem found in the diagram: {diagnostic}", file=sys.stderr)
+
+    if not syntax_tree:
+        print("No class found in the diagram", file=sys.stderr)
+        return 1
+
+    results = CodeGeneration(syntax_tree, options, args.workers).run(languages, output_dir)
+
+    return 1 if any(result.error for result in results) else 0
+
+
+if __name__ == "__main__":
+    freeze_support()
+    sys.exit(main(sys.argv[1:]))
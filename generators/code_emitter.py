@@ -0,0 +1,34 @@
+class CodeEmitter:
+    """
+    Collect the generated code fragment by fragment, to write it out once without joining it into one string
+    """
+
+    def __init__(self):
+        self.fragments = []
+
+    def __bool__(self):
+        return any(self.fragments)
+
+    def emit(self, *fragments):
+        """
+        Emit fragments of code, in order
+
+        Parameters:
+            fragments: the strings to emit
+        """
+
+        self.fragments += fragments
+
+    def emit_to(self, stream):
+        """
+        Write the collected fragments to a stream, and forget them
+
+        Parameters:
+            stream: open text stream
+        """
+
+        stream.writelines(self.fragments)
+        self.fragments.clear()
+
+    def getvalue(self):
+        return "".join(self.fragments)
@@ -0,0 +1,212 @@
+import pickle
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from io import StringIO
+from itertools import repeat
+from os import path
+from time import perf_counter
+
+from generators.code_generators import CodeGenerators
+from parsers.syntax_model import SyntaxModel
+
+
+@dataclass(slots=True, frozen=True)
+class LanguageResult:
+    """
+    Outcome of the generation of the code of a language
+
+    Parameters:
+        language: the language
+        output_dir: the directory the code was written to
+        seconds: the time the generation took
+        files: the paths of the files written
+        diagnostics: the Diagnostic of the problems found
+        log: what the generator printed
+        error: the description of the error that stopped the generation, None if it completed
+    """
+
+    language: str
+    output_dir: str
+    seconds: float
+    files: list
+    diagnostics: list
+    log: str
+    error: str | None = None
+
+
+class CodeGeneration:
+    """
+    Generate the code of a syntax tree in several languages at once, each language in a worker process
+
+    The syntax tree is pickled once, and loaded once by each worker process, whatever the number of languages
+    it generates, so all the generators of a worker share the same read-only SyntaxModel.
+
+    Parameters:
+        syntax_tree: the syntax tree, either as a SyntaxModel or as a plain dictionary
+        options: set of options of the code generators
+        workers: number of worker processes, one per language if omitted,
+                 the languages are generated one after another when lower than 2
+    """
+
+    PICKLE_PROTOCOL = 5
+    worker_syntax_tree = None   # the syntax tree loaded by a worker process
+
+    def __init__(self, syntax_tree, options, workers=None):
+        self.syntax_tree = syntax_tree if isinstance(syntax_tree, SyntaxModel) else SyntaxModel(syntax_tree)
+        self.options = options
+        self.workers = workers
+
+    @staticmethod
+    def default_options():
+        return {
+            'package': "com.example",
+            'generate': {
+                'default_ctor': False,
+                'full_arg_ctor': False,
+                'equal_hashcode': False,
+                'to_string': False
+            },
+            'encapsulate_all_props': False,
+            'infer_keys': False,
+            'pk_pattern': "^(@class)?_?(id|pk|key)$",
+            'parse_workers': 1,
+            'generate_workers': 1,
+            'relationship_rules': {},
+            'fail_fast': False,
+            'language_specific': {
+                'java': {
+                    'use_lombok': False,
+                    'add_builder': False,
+                    'add_jpa': False,
+                    'use_jakarta': False,
+                    'temporal_types': "java8_local",
+                    'imports': {
+                        'java.math': ["BigInteger", "BigDecimal"],
+                        'java.util': ["Objects", "Set", "HashSet", "UUID"],
+                    }
+                },
+                'cs': {
+                    'add_efcore': False,
+                    'imports': {
+                        'System': None,
+                        'System.Collections.Generic': None,
+                        'System.Numerics': None,
+                    }
+                },
+                'cpp': {
+                    'use_boost': False,
+                    'naming': "pascal",
+                    'lbrace_same_line': False,
+                    'imports': {
+                        '<ctime>': None,
+                        '<string>': ["std::string", "std::wstring"],
+                        '<array>': ["std::array"],
+                        '<vector>': ["std::vector"],
+                    },
+                },
+                'python': {
+                    'imports': {},
+                },
+                'ts': {
+                    'optional_props': True,
+                    'imports': {},
+                },
+                'php': {
+                    'imports': {},
+                },
+                'sql': {
+                    'dialect': "ansi",
+                    'single_script': True,
+                    'filename': "database",
+                },
+            },
+        }
+
+    @staticmethod
+    def language_output_dir(output_dir, language, language_count):
+        return path.join(output_dir, language) if language_count > 1 else output_dir
+
+    def run(self, languages, output_dir):
+        """
+        Generate the code of the languages, each one in a sub-directory of the output directory
+        when there are several of them, and print their logs and timings
+
+        Parameters:
+            languages: the names of the languages
+            output_dir: the output directory
+
+        Returns:
+            results: list of LanguageResult, in the order of the languages
+        """
+
+        languages = list(languages)
+        output_dirs = [self.language_output_dir(output_dir, language, len(languages)) for language in languages]
+        workers = len(languages) if self.workers is None else min(self.workers, len(languages))
+        start = perf_counter()
+
+        print(f"<<< GENERATING {len(languages)} LANGUAGE(S) WITH {max(workers, 1)} PROCESS(ES) >>>")
+
+        if workers < 2:
+            results = [self.generate_language(self.syntax_tree, self.options, language, language_dir)
+                       for language, language_dir in zip(languages, output_dirs)]
+        else:
+            pickled_tree = pickle.dumps(dict(self.syntax_tree), self.PICKLE_PROTOCOL)
+
+            with ProcessPoolExecutor(workers, initializer=CodeGeneration.load_syntax_tree,
+                                     initargs=(pickled_tree,)) as executor:
+                results = list(executor.map(CodeGeneration.generate_in_worker,
+                                            languages, output_dirs, repeat(self.options)))
+
+        for result in results:
+            print(result.log, end="")
+            print(f"<<< {result.language}: {len(result.files)} FILE(S), {len(result.diagnostics)} PROBLEM(S)"
+                  f" IN {result.seconds:.2f} S{' - ' + result.error if result.error else ''} >>>")
+
+        print(f"<<< {len(languages)} LANGUAGE(S) GENERATED IN {perf_counter() - start:.2f} S >>>")
+
+        return results
+
+    @staticmethod
+    def load_syntax_tree(pickled_tree):
+        CodeGeneration.worker_syntax_tree = SyntaxModel(pickle.loads(pickled_tree))
+
+    @staticmethod
+    def generate_in_worker(language, output_dir, options):
+        return CodeGeneration.generate_language(CodeGeneration.worker_syntax_tree, options, language, output_dir)
+
+    @staticmethod
+    def generate_language(syntax_tree, options, language, output_dir):
+        """
+        Generate the code of a language, capturing what is printed
+
+        Parameters:
+            syntax_tree: the SyntaxModel
+            options: set of options of the code generators
+            language: the name of the language
+            output_dir: the directory to write the code to
+
+        Returns:
+            result: the LanguageResult
+        """
+
+        code_gen, error = None, None
+        start = perf_counter()
+
+        with redirect_stdout(StringIO()) as log:
+            try:
+                code_gen = CodeGenerators.get(language, syntax_tree, output_dir, options)
+                code_gen.generate_code()
+            except Exception as e:
+                error = str(e)
+
+        return LanguageResult(
+            language,
+            output_dir,
+            perf_counter() - start,
+            code_gen.files if code_gen else [],
+            code_gen.diagnostics.entries if code_gen else [],
+            log.getvalue(),
+            error
+        )
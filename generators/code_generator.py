@@ -1,11 +1,17 @@
 import re
-import traceback
 
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
 from operator import itemgetter
-from copy import deepcopy
 from os import makedirs, path
 from abc import ABC, abstractmethod
 
+from generators.code_emitter import CodeEmitter
+from parsers.diagnostics import Diagnostics, DiagnosticError
+from parsers.syntax_model import SyntaxModel
+
 
 INTEGRAL_TYPE = re.compile(r"^(?:u(?:nsigned\s+)?)?(?:short|int(?:16|32|64|eger)?|long)$", re.IGNORECASE)
 
@@ -15,21 +21,40 @@ class CodeGenerator(ABC):
     Base class of all code generators
 
     Parameters:
-        syntax_tree: syntax tree of the drawio file
+        syntax_tree: syntax tree of the drawio file, either as a SyntaxModel or as a plain dictionary
         file_path: path for the code files to be written to
-        options: set of additional options
+        options: set of additional options, the problems found being collected in diagnostics
+                 unless the 'fail_fast' option is set, which raises a DiagnosticError on the first one,
+                 and the classes being shared among worker processes when the 'generate_workers' option is 2 or more
     """
 
+    SHARDS_PER_WORKER = 4
+    worker = None       # the copy of the generator in a worker process
+    mp_context = None   # the multiprocessing context of the worker processes, the default one if None
+
     def __init__(self, syntax_tree, file_path, options):
-        self.syntax_tree = syntax_tree
+        self.syntax_tree = syntax_tree if isinstance(syntax_tree, SyntaxModel) else SyntaxModel(syntax_tree)
         self.file_path = path.abspath(file_path)
         self.options = options
         self.files = []
+        self.diagnostics = Diagnostics(options.get('fail_fast', False))
 
-        self.defined_types = { class_def['name']: class_id for class_id, class_def in syntax_tree.items() }
+        self.defined_types = self.syntax_tree.class_ids
+        class_names = Counter(class_def['name'] for class_def in self.syntax_tree.values())
+        self.shared_names = {class_name for class_name, count in class_names.items() if count > 1}
 
         if options['infer_keys']:
-            self.infer_keys_from_names(options['pk_pattern'])
+            pk_pattern = options['pk_pattern']
+            self.syntax_tree = self.syntax_tree.overlay_constraints(
+                ('infer_keys', pk_pattern), lambda syntax_model: self.infer_keys_from_names(syntax_model, pk_pattern)
+            )
+
+    def __getstate__(self):
+        # only what the generator is built from is sent to the worker processes, the rest is rebuilt there
+        return {'syntax_tree': self.syntax_tree, 'file_path': self.file_path, 'options': self.options}
+
+    def __setstate__(self, state):
+        self.__init__(state['syntax_tree'], state['file_path'], state['options'])
 
     @staticmethod
     def ensure_dir_exists(dir_path):
@@ -39,102 +64,259 @@ class CodeGenerator(ABC):
     def split_package_name(package_name):
         return re.split(r"[./\\:]+", package_name)
 
-    def infer_keys_from_names(self, pk_pattern):
-        syntax_tree = deepcopy(self.syntax_tree)
+    @staticmethod
+    def infer_keys_from_names(syntax_tree, pk_pattern):
+        """
+        Find the primary keys of the classes without one, from the names of their properties
+
+        The last property whose name matches the pattern becomes the primary key of its class,
+        and an identity when its type is integral.
+
+        Parameters:
+            syntax_tree: the syntax tree, which is not changed
+            pk_pattern: regular expression matching the names of the keys, @class standing for the class name
+
+        Returns:
+            changes: dictionary mapping the class ids to dictionaries mapping the id of their key to its new constraints
+        """
+
+        changes = {}
+        matcher = None if "@class" in pk_pattern else re.compile(pk_pattern, re.IGNORECASE)
 
-        for class_def in syntax_tree.values():
-            matcher = re.compile(pk_pattern.replace("@class", class_def['name']), re.IGNORECASE)
+        for class_id, class_def in syntax_tree.items():
+            class_matcher = matcher or re.compile(pk_pattern.replace("@class", class_def['name']), re.IGNORECASE)
             pk_found, pk_candidate = False, None
 
-            for property_def in class_def['properties'].values():
+            for property_id, property_def in class_def['properties'].items():
                 if property_def['constraints'].get("pk"):
                     pk_found = True
                     break
 
-                if matcher.match(property_def['name']):
-                    pk_candidate = property_def
+                if class_matcher.match(property_def['name']):
+                    pk_candidate = property_id, property_def
 
             if pk_candidate and not pk_found:
-                pk_candidate['constraints']['pk'] = True
-                is_integer = INTEGRAL_TYPE.match(pk_candidate['type'])
-                pk_candidate['constraints']['identity'] = is_integer
+                property_id, property_def = pk_candidate
+                is_integer = INTEGRAL_TYPE.match(property_def['type']) is not None
+                changes[class_id] = {property_id: {'pk': True, 'identity': is_integer}}
 
-        self.syntax_tree = syntax_tree
+        return changes
 
     def generate_code(self):
         """
         Use the syntax tree to generate code files for the UML class diagrams
+
+        The file of each class is written as soon as its code is complete, so only one class is held in memory.
+        Classes whose code cannot be generated are reported in diagnostics and skipped.
         """
 
         print("<<< GENERATING CODE FILES FROM SYNTAX TREE >>>")
 
         try:
             self.ensure_dir_exists(self.file_path)
+            self.report_cycles()
+
+            print(f"<<< WRITING FILES TO {self.file_path} >>>")
+
+            for class_id, (file_path, emitter) in self.iter_outputs([*self.syntax_tree]):
+                try:
+                    if file_path is None:
+                        file_path = self.write_file(self.syntax_tree[class_id]['name'], emitter)
+                    self.files.append(file_path)
+                except DiagnosticError:
+                    raise
+                except Exception as e:
+                    self.diagnostics.report(class_id, "generate", e)
+        except DiagnosticError:
+            raise
+        except Exception as e:
+            self.diagnostics.report(None, "generate", e)
 
-            for class_def in self.syntax_tree.values():
-                get_items = itemgetter("name", "type", "properties")
-                class_name, class_type, properties = get_items(class_def)
-                baseclasses, interfaces, references = self.get_class_dependencies(class_def)
+    def iter_outputs(self, class_ids, workers=None):
+        """
+        Generate the output of classes, serially or in worker processes
 
-                file_contents = self.generate_class_header(class_type, class_name, baseclasses, interfaces, references)
-                file_contents += self.generate_properties(class_type, class_name, properties, references)
-                file_contents += "\n"
+        Parameters:
+            class_ids: the ids of the classes
+            workers: number of worker processes, the 'generate_workers' option if omitted,
+                     the classes are generated serially when lower than 2
 
-                if class_type in ("class", "abstract class"):
-                    inherited_props = []
-                    self.get_inherited_instance_props(class_def, inherited_props)
-                    declared_props = {k: p for k, p in properties.items() if not p['constraints'].get("static")}
-                    has_instance_props = len(declared_props) + len(inherited_props) > 0
-                    should_generate = self.options['generate']
+        Returns:
+            outputs: iterator of (class_id, output), in the order of class_ids, the classes that failed being reported
+                     in diagnostics and left out
+        """
 
-                    if should_generate['default_ctor']:
-                        file_contents += self.generate_default_ctor(class_name, baseclasses)
+        if workers is None:
+            workers = self.options.get('generate_workers', 1)
 
-                    if has_instance_props and should_generate['full_arg_ctor']:
-                        file_contents += self.generate_full_arg_ctor(class_name, baseclasses, declared_props, inherited_props)
+        if workers < 2 or len(class_ids) < 2:
+            # one class at a time, so each output is written out before the next one is generated
+            for class_id in class_ids:
+                yield from self.generate_outputs([class_id])
+        else:
+            shard_size = -(-len(class_ids) // (workers * self.SHARDS_PER_WORKER))
+            shards = [class_ids[i:i + shard_size] for i in range(0, len(class_ids), shard_size)]
 
-                    file_contents += self.generate_property_accessors(class_name, properties, references)
+            with ProcessPoolExecutor(workers, mp_context=self.mp_context,
+                                     initializer=CodeGenerator.init_worker, initargs=(self,)) as executor:
+                for outputs, diagnostics, log in executor.map(CodeGenerator.generate_shard, shards):
+                    print(log, end="")
+                    self.diagnostics.extend(diagnostics)
+                    yield from outputs
 
-                    if has_instance_props and should_generate['equal_hashcode']:
-                        file_contents += self.generate_equal_hashcode(class_name, baseclasses, declared_props)
+    @staticmethod
+    def init_worker(generator):
+        CodeGenerator.worker = generator
 
-                    if has_instance_props and should_generate['to_string']:
-                        file_contents += self.generate_to_string(class_name, baseclasses, declared_props)
+    @staticmethod
+    def generate_shard(class_ids):
+        """
+        Generate the output of classes in a worker process
 
-                if class_type != "enum":
-                    interface_methods = []
-                    self.get_interface_methods(class_def['relationships']['implements'], interface_methods)
-                    file_contents += self.generate_methods(class_type, class_def['methods'], interface_methods)
+        Parameters:
+            class_ids: the ids of the classes
 
-                file_contents += self.generate_class_footer(class_type, class_name)
+        Returns:
+            outputs: list of (class_id, output) of the classes that did not fail
+            diagnostics: the problems found
+            log: what was printed, for the main process to print it
+        """
 
-                self.files.append((class_name, file_contents))
+        generator = CodeGenerator.worker
+        generator.diagnostics = Diagnostics(generator.diagnostics.fail_fast)
 
-            self.generate_files()
-        except Exception as e:
-            print(f"{self.__class__.__name__}.generate_code ERROR: {e}")
-            traceback.print_exception(e)
+        with redirect_stdout(StringIO()) as log:
+            outputs = generator.generate_outputs(class_ids)
 
-    def generate_files(self):
+        return outputs, generator.diagnostics.entries, log.getvalue()
+
+    def generate_outputs(self, class_ids):
         """
-        Write generated code to file
+        Generate the output of classes
+
+        Parameters:
+            class_ids: the ids of the classes
+
+        Returns:
+            outputs: list of (class_id, output) of the classes that did not fail, failures being in diagnostics
         """
 
-        print(f"<<< WRITING FILES TO {self.file_path} >>>")
+        outputs = []
 
-        try:
-            for filename, contents in self.files:
-                file_path = path.join(self.file_path, f"{filename}.{self.get_file_extension()}")
-                with open(file_path, "w") as f:
-                    f.write(contents)
-        except Exception as e:
-            print(f"{self.__class__.__name__}.generate_files ERROR: {e}")
-            traceback.print_exception(e)
+        for class_id in class_ids:
+            try:
+                self.reset_class_state()
+                outputs.append((class_id, self.generate_output(self.syntax_tree[class_id])))
+            except DiagnosticError:
+                raise
+            except Exception as e:
+                self.diagnostics.report(class_id, "generate", e)
+
+        return outputs
+
+    def reset_class_state(self):
+        """
+        Clear the state kept while generating a class, before generating the next one
+        """
+
+        pass
+
+    def generate_output(self, class_def):
+        """
+        Generate the output of a class, from the syntax tree and the options only, so it can be done in any process
+
+        The file of the class is written right away, unless other classes have the same name: the file must then hold
+        the last of them to be generated, so it is written in the main process, in order.
+
+        Parameters:
+            class_def: the class
+
+        Returns:
+            output: tuple of the path of the file written, or None, and the CodeEmitter holding the code to write
+        """
+
+        emitter = CodeEmitter()
+        self.generate_class(class_def, emitter)
+
+        if class_def['name'] in self.shared_names:
+            return None, emitter
+
+        return self.write_file(class_def['name'], emitter), None
+
+    def generate_class(self, class_def, emitter):
+        """
+        Generate the code of a class
+
+        Parameters:
+            class_def: the class
+            emitter: the CodeEmitter the code of the class is emitted to
+        """
+
+        get_items = itemgetter("name", "type", "properties")
+        class_name, class_type, properties = get_items(class_def)
+        baseclasses, interfaces, references = self.get_class_dependencies(class_def)
+
+        emitter.emit(
+            self.generate_class_header(class_type, class_name, baseclasses, interfaces, references),
+            self.generate_properties(class_type, class_name, properties, references),
+            "\n"
+        )
+
+        if class_type in ("class", "abstract class"):
+            inherited_props = []
+            self.get_inherited_instance_props(class_def, inherited_props)
+            declared_props = {k: p for k, p in properties.items() if not p['constraints'].get("static")}
+            has_instance_props = len(declared_props) + len(inherited_props) > 0
+            should_generate = self.options['generate']
+
+            if should_generate['default_ctor']:
+                emitter.emit(self.generate_default_ctor(class_name, baseclasses))
+
+            if has_instance_props and should_generate['full_arg_ctor']:
+                emitter.emit(self.generate_full_arg_ctor(class_name, baseclasses, declared_props, inherited_props))
+
+            emitter.emit(self.generate_property_accessors(class_name, properties, references))
+
+            if has_instance_props and should_generate['equal_hashcode']:
+                emitter.emit(self.generate_equal_hashcode(class_name, baseclasses, declared_props))
+
+            if has_instance_props and should_generate['to_string']:
+                emitter.emit(self.generate_to_string(class_name, baseclasses, declared_props))
+
+        if class_type != "enum":
+            interface_methods = []
+            self.get_interface_methods(class_def['relationships']['implements'], interface_methods)
+            emitter.emit(self.generate_methods(class_type, class_def['methods'], interface_methods))
+
+        emitter.emit(self.generate_class_footer(class_type, class_name))
+
+    def write_file(self, filename, emitter):
+        """
+        Write the code collected by an emitter to file
+
+        Parameters:
+            filename: the name of the file, without extension
+            emitter: the CodeEmitter holding the code
+
+        Returns:
+            file_path: the path of the file written
+        """
+
+        file_path = path.join(self.file_path, f"{filename}.{self.get_file_extension()}")
+        with open(file_path, "w") as f:
+            emitter.emit_to(f)
+
+        return file_path
 
     def get_class_dependencies(self, class_def):
         """
         Get a tuple of all the classes that this class depends on
 
+        Each class used by a property, a method or a method of the implemented interfaces
+        is referenced once, with a 'uses' reference.
+        An enumeration is a value, held through a property of its type, so an association with one
+        gives neither end a reference member: the class only uses the enumeration.
+
         :param class_def: the current class
         :return: a tuple of baseclasses, implemented interfaces and referenced classes
         """
@@ -144,30 +326,40 @@ class CodeGenerator(ABC):
 
         baseclasses = [self.syntax_tree[r]['name'] for r in extends]
         interfaces = [self.syntax_tree[r]['name'] for r in implements]
-        references = [(r[0], self.syntax_tree[r[1]]['name'], False) for r in association]
-        references += [(r[0], self.syntax_tree[r[1]]['name'], False) for r in aggregation]
-        references += [(r[0], self.syntax_tree[r[1]]['name'], True) for r in composition]
+        associations = [(*r, False) for r in association] + [(*r, False) for r in aggregation]
+        associations += [(*r, True) for r in composition]
+
+        if class_def['type'] == "enum":
+            associations = []
+
+        associated_enums = [self.syntax_tree[r[1]]['name'] for r in associations
+                            if self.syntax_tree[r[1]]['type'] == "enum"]
+        references = [(r[0], self.syntax_tree[r[1]]['name'], r[2]) for r in associations
+                      if self.syntax_tree[r[1]]['type'] != "enum"]
 
         class_methods = [*class_def['methods'].values()]
         if class_def['type'] in ("class", "abstract class"):
             self.get_interface_methods(implements, class_methods)
 
-        for other_class in self.syntax_tree.values():
-            other_class_name = other_class['name']
+        # the types used by the members, each one once and in order of first use
+        used_types = dict.fromkeys(property_def['type'] for property_def in class_def['properties'].values())
+        for method_def in class_methods:
+            used_types[method_def['return_type']] = None
+            used_types.update(dict.fromkeys(parameter['type'] for parameter in method_def['parameters']))
+        used_types.update(dict.fromkeys(associated_enums))
 
-            for property_def in class_def['properties'].values():
-                if property_def['type'] == other_class_name:
-                    references.append(('uses', other_class_name, False))
+        references += [('uses', type_name, False) for type_name in used_types if type_name in self.defined_types]
 
-            for method_def in class_methods:
-                if method_def['return_type'] == other_class_name:
-                    references.append(('uses', other_class_name, False))
+        return baseclasses, interfaces, references
 
-                for parameter in method_def['parameters']:
-                    if parameter['type'] == other_class_name:
-                        references.append(('uses', other_class_name, False))
+    def report_cycles(self):
+        """
+        Report the inheritance cycles of the syntax tree, the relationships closing them being ignored
+        """
 
-        return baseclasses, interfaces, references
+        for kind, class_ids in self.syntax_tree.get_hierarchy().cycles:
+            class_names = " -> ".join(self.syntax_tree[class_id]['name'] for class_id in class_ids)
+            self.diagnostics.report(class_ids[-2], "generate", f"'{kind}' cycle {class_names}")
 
     def get_inherited_instance_props(self, class_def, properties):
         """
@@ -178,11 +370,10 @@ class CodeGenerator(ABC):
             properties: list of inherited instance properties
         """
 
-        parents = [self.syntax_tree[r] for r in class_def['relationships']['extends']]
+        instance_properties = self.syntax_tree.get_hierarchy().instance_properties
 
-        for parent in parents:
-            self.get_inherited_instance_props(parent, properties)
-            properties += [p for p in parent['properties'].values() if not p['constraints'].get("static")]
+        for parent_id in class_def['relationships']['extends']:
+            properties += instance_properties.get(parent_id, ())
 
     def get_interface_methods(self, interface_ids, interface_methods):
         """
@@ -193,14 +384,13 @@ class CodeGenerator(ABC):
             interface_methods: list of interface methods
         """
 
+        hierarchy_methods = self.syntax_tree.get_hierarchy().interface_methods
+
         for interface_id in interface_ids:
-            interface = self.syntax_tree[interface_id]
-            interface_methods += interface['methods'].values()
-            self.get_interface_methods(interface['relationships']['implements'], interface_methods)
+            interface_methods += hierarchy_methods.get(interface_id, ())
 
     def get_class_by_name(self, class_name):
-        class_id = self.defined_types.get(class_name)
-        return self.syntax_tree.get(class_id) if class_id else None
+        return self.syntax_tree.get_class_by_name(class_name)
 
     def get_stereotype(self, class_name):
         class_def = self.get_class_by_name(class_name)
@@ -214,15 +404,9 @@ class CodeGenerator(ABC):
             class_name: the class name
         """
 
-        class_def = self.get_class_by_name(class_name)
-        if class_def:
-            pk = [p for p in class_def['properties'].values() if p['constraints'].get("pk")]
-            if len(pk) > 0: return pk
-
-            baseclasses = [self.syntax_tree[r]['name'] for r in class_def['relationships']['extends']]
-            for baseclass in baseclasses:
-                pk = self.get_primary_key(baseclass)
-                if len(pk) > 0: return pk
+        class_id = self.syntax_tree.class_ids.get(class_name)
+        if class_id is not None:
+            return list(self.syntax_tree.get_hierarchy().primary_keys[class_id])
 
         return []
 
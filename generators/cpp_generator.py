@@ -63,6 +63,10 @@ class CppCodeGenerator(CodeGenerator):
         self.baseclass_name = None
         self.initializer_string = ""
 
+    def reset_class_state(self):
+        self.baseclass_name = None
+        self.initializer_string = ""
+
     @staticmethod
     def accessor_name(property_name, naming_conv):
         if naming_conv != "snake" and property_name[0].islower():
@@ -94,12 +98,12 @@ class CppCodeGenerator(CodeGenerator):
 
         if class_type != "enum":
             header_files = set(self.options['imports'].keys())
-            usings = set(symbol for symbols in self.options['imports'].values() for symbol in symbols if symbol)
+            usings = set(symbol for symbols in self.options['imports'].values() for symbol in symbols or () if symbol)
 
             if self.options['use_boost']:
                 boost_dependencies = self.get_boost_dependencies()
                 header_files |= set(boost_dependencies.keys())
-                usings |= set(symbol for symbols in boost_dependencies.values() for symbol in symbols if symbol)
+                usings |= set(symbol for symbols in boost_dependencies.values() for symbol in symbols or () if symbol)
 
             header_files |= set(f"\"{baseclass}.hpp\"" for baseclass in baseclasses)
             header_files |= set(f"\"{interface}.hpp\"" for interface in interfaces)
@@ -1,10 +1,10 @@
-import traceback
-
 from operator import itemgetter
 from os import path
 
+from generators.code_emitter import CodeEmitter
 from generators.code_generator import CodeGenerator
 from generators.sql_dialect.sql_dialects import SQLDialects
+from parsers.diagnostics import DiagnosticError
 
 
 class SqlCodeGenerator(CodeGenerator):
@@ -30,63 +30,26 @@ class SqlCodeGenerator(CodeGenerator):
     def generate_code(self):
         """
         Use the syntax tree to generate code files for the UML class diagrams
+
+        The enums are generated first, since their custom types come before the tables in the script,
+        then each table is written as soon as it is complete, so only one table is held in memory.
+        Classes whose table cannot be generated are reported in diagnostics and skipped.
         """
 
         print("<<< GENERATING CODE FILES FROM SYNTAX TREE >>>")
 
         try:
             self.ensure_dir_exists(self.file_path)
+            self.report_cycles()
 
-            for class_def in self.syntax_tree.values():
-                get_items = itemgetter("name", "type", "properties")
-                class_name, class_type, properties = get_items(class_def)
-                baseclasses, _, references = self.get_class_dependencies(class_def)
-                instance_props = {k: p for k, p in properties.items() if not p['constraints'].get("static")}
-
-                match class_type:
-                    case "enum":
-                        enum_declaration = self.dialect.enum_decl(class_def)
-                        if enum_declaration.strip():
-                            self.custom_types.append(enum_declaration)
-                        continue
-                    case "class" | "abstract class":
-                        if self.get_stereotype(class_name) == "embeddable" or len(instance_props) <= 0:
-                            continue
-
-                        file_contents = self.generate_class_header(class_type, class_name, baseclasses)
-                        file_contents += self.generate_properties(class_type, class_name, instance_props, references)
-                        file_contents += (f",\n\tconstraint {self.dialect.escape(f"pk_{class_name}")} primary key"
-                                          f" ({', '.join(self.table_primary_key)})")
-                        file_contents += self.generate_class_footer(class_type, class_name)
-                    case _:
-                        continue
-
-                self.files.append((class_name, file_contents))
-                self.primary_keys[class_name] = self.table_primary_key
-                self.foreign_keys[class_name] = self.table_foreign_keys
-                self.table_primary_key = []
-                self.table_foreign_keys = {}
-                self.table_constraints = []
-
-            self.generate_files()
-        except Exception as e:
-            print(f"{self.__class__.__name__}.generate_code ERROR: {e}")
-            traceback.print_exception(e)
+            enum_ids = [k for k, c in self.syntax_tree.items() if c['type'] == "enum"]
+            class_ids = [k for k, c in self.syntax_tree.items() if c['type'] != "enum"]
+            self.write_tables(self.iter_outputs(enum_ids, workers=1), None)
 
-    def generate_files(self):
-        """
-        Write generated code to file
+            print(f"<<< WRITING FILES TO {self.file_path} >>>")
 
-        Returns:
-            boolean: True if successful, False if unsuccessful
-        """
-
-        print(f"<<< WRITING FILES TO {self.file_path} >>>")
-
-        try:
             if self.options['single_script']:
-                filename = self.options['filename']
-                file_path = path.join(self.file_path, f"{filename}.{self.get_file_extension()}")
+                file_path = path.join(self.file_path, f"{self.options['filename']}.{self.get_file_extension()}")
 
                 with open(file_path, "w") as f:
                     self.write_package_directive(f)
@@ -96,32 +59,124 @@ class SqlCodeGenerator(CodeGenerator):
                         self.write_custom_types(f)
 
                     f.write("-- TABLES:\n\n")
-                    for table_name, table_def in self.files:
-                        f.write(table_def)
-                        f.write("\n")
+                    self.write_tables(self.iter_outputs(class_ids), f)
 
                     f.write("-- FOREIGN KEYS:\n\n")
                     self.write_foreign_keys(f)
+
+                self.files.append(file_path)
             else:
-                for table_name, table_def in self.files:
-                    file_path = path.join(self.file_path, f"{table_name}.{self.get_file_extension()}")
-                    with open(file_path, "w") as f:
-                        self.write_package_directive(f)
-                        f.write(table_def)
+                self.write_tables(self.iter_outputs(class_ids), None)
 
                 if len(self.custom_types) > 0:
                     file_path = path.join(self.file_path, f"_custom_types.{self.get_file_extension()}")
                     with open(file_path, "w") as f:
                         self.write_package_directive(f)
                         self.write_custom_types(f)
+                    self.files.append(file_path)
 
                 file_path = path.join(self.file_path, f"_foreign_keys.{self.get_file_extension()}")
                 with open(file_path, "w") as f:
                     self.write_package_directive(f)
                     self.write_foreign_keys(f)
+                self.files.append(file_path)
+        except DiagnosticError:
+            raise
         except Exception as e:
-            print(f"{self.__class__.__name__}.generate_files ERROR: {e}")
-            traceback.print_exception(e)
+            self.diagnostics.report(None, "generate", e)
+
+    def write_tables(self, outputs, script):
+        """
+        Write out the tables of classes, and keep their custom types and keys for the end of the script
+
+        Parameters:
+            outputs: iterator of (class_id, output), as returned by iter_outputs
+            script: the open script the tables are appended to, None to write each table to its own file
+        """
+
+        for class_id, (enum_declaration, emitter, primary_key, foreign_keys) in outputs:
+            try:
+                class_name = self.syntax_tree[class_id]['name']
+
+                if enum_declaration is not None:
+                    self.custom_types.append(enum_declaration)
+
+                if not emitter:
+                    continue
+
+                self.primary_keys[class_name] = primary_key
+                self.foreign_keys[class_name] = foreign_keys
+
+                if script is not None:
+                    emitter.emit("\n")
+                    emitter.emit_to(script)
+                else:
+                    file_path = path.join(self.file_path, f"{class_name}.{self.get_file_extension()}")
+                    with open(file_path, "w") as f:
+                        self.write_package_directive(f)
+                        emitter.emit_to(f)
+                    self.files.append(file_path)
+            except DiagnosticError:
+                raise
+            except Exception as e:
+                self.diagnostics.report(class_id, "generate", e)
+
+    def reset_class_state(self):
+        self.table_primary_key = []
+        self.table_foreign_keys = {}
+        self.table_constraints = []
+
+    def generate_output(self, class_def):
+        """
+        Generate the table of a class, or the custom type of an enum
+
+        Parameters:
+            class_def: the class
+
+        Returns:
+            output: tuple of the custom type of the enum, the CodeEmitter holding the table,
+                    and the primary key and foreign keys of the table
+        """
+
+        emitter = CodeEmitter()
+        enum_declaration = self.generate_table(class_def, emitter)
+        return enum_declaration, emitter, self.table_primary_key, self.table_foreign_keys
+
+    def generate_table(self, class_def, emitter):
+        """
+        Generate the table of a class, or the custom type of an enum
+
+        Parameters:
+            class_def: the class
+            emitter: the CodeEmitter the table is emitted to, nothing being emitted for an enum
+
+        Returns:
+            enum_declaration: the custom type of the enum, None if the class is not an enum or has no custom type
+        """
+
+        get_items = itemgetter("name", "type", "properties")
+        class_name, class_type, properties = get_items(class_def)
+        baseclasses, _, references = self.get_class_dependencies(class_def)
+        instance_props = {k: p for k, p in properties.items() if not p['constraints'].get("static")}
+
+        match class_type:
+            case "enum":
+                enum_declaration = self.dialect.enum_decl(class_def)
+                if enum_declaration.strip():
+                    return enum_declaration
+            case "class" | "abstract class":
+                if self.get_stereotype(class_name) == "embeddable" or len(instance_props) <= 0:
+                    return
+
+                emitter.emit(
+                    self.generate_class_header(class_type, class_name, baseclasses),
+                    self.generate_properties(class_type, class_name, instance_props, references),
+                    f",\n\tconstraint {self.dialect.escape(f"pk_{class_name}")} primary key"
+                    f" ({', '.join(self.table_primary_key)})",
+                    self.generate_class_footer(class_type, class_name)
+                )
+
+        return None
 
     def generate_class_header(self, class_type, class_name, baseclasses, interfaces = None, references = None):
         """
@@ -1,8 +1,12 @@
+from multiprocessing import freeze_support
 from wx import App
 from ui.main_frame import MainFrame
 
 
-app = App()
-frame = MainFrame()
-frame.Show()
-app.MainLoop()
+if __name__ == "__main__":
+    freeze_support()
+
+    app = App()
+    frame = MainFrame()
+    frame.Show()
+    app.MainLoop()
@@ -0,0 +1,89 @@
+class ClassHierarchy:
+    """
+    Closure of the inheritance of a syntax model, for the queries of the generators
+
+    The closures are built once for all the classes, in topological order and without recursion,
+    so deep hierarchies do not hit the recursion limit. A relationship closing a cycle is left out
+    of the closures and the cycle is listed instead.
+
+    Closures:
+      instance_properties: class id to the non-static properties of its ancestors, then to its own
+      interface_methods: class id to the methods of the interface, then to those of the interfaces it implements
+      primary_keys: class id to the key properties of the class, or of its first baseclass having some,
+                    the baseclasses being looked up by name
+      cycles: the (kind, class_ids) of the cycles found, kind being 'extends' or 'implements'
+              and class_ids starting and ending with the same class
+
+    Parameters:
+      syntax_model: the SyntaxModel
+    """
+
+    def __init__(self, syntax_model):
+        class_ids = syntax_model.class_ids
+        self.cycles = []
+
+        def get_baseclasses(class_id):
+            return syntax_model[class_id]['relationships']['extends']
+
+        def get_interfaces(class_id):
+            return syntax_model[class_id]['relationships']['implements']
+
+        def get_named_baseclasses(class_id):
+            return [class_ids[syntax_model[r]['name']] for r in get_baseclasses(class_id)]
+
+        def combine_properties(class_id, closures):
+            properties = syntax_model[class_id]['properties'].values()
+            return sum(closures, ()) + tuple(p for p in properties if not p['constraints'].get("static"))
+
+        def combine_methods(class_id, closures):
+            return sum(closures, tuple(syntax_model[class_id]['methods'].values()))
+
+        def combine_keys(class_id, closures):
+            pk = [p for p in syntax_model[class_id]['properties'].values() if p['constraints'].get("pk")]
+            return tuple(pk) or next((c for c in closures if c), ())
+
+        self.instance_properties = self.close(syntax_model, get_baseclasses, combine_properties, 'extends')
+        self.interface_methods = self.close(syntax_model, get_interfaces, combine_methods, 'implements')
+        self.primary_keys = self.close(syntax_model, get_named_baseclasses, combine_keys)
+
+    def close(self, class_ids, get_parents, combine, kind=None):
+        """
+        Compute a closure over the classes, each class after its parents
+
+        Parameters:
+          class_ids: the ids of the classes
+          get_parents: function returning the ids of the parents of a class
+          combine: function of a class id and of the closures of its parents, in order, returning its closure
+          kind: the kind of relationship to list the cycles under, the cycles are not listed if omitted
+
+        Returns:
+          closure: dictionary mapping the class ids to their closure
+        """
+
+        closure = {}
+
+        for root_id in class_ids:
+            if root_id in closure:
+                continue
+
+            # the classes being visited, in order, with their position and the iterator over their parents
+            path = {root_id: 0}
+            stack = [(root_id, iter(get_parents(root_id)))]
+
+            while stack:
+                class_id, parents = stack[-1]
+
+                for parent_id in parents:
+                    if parent_id in path:
+                        if kind is not None:
+                            self.cycles.append((kind, (*[*path][path[parent_id]:], parent_id)))
+                    elif parent_id not in closure:
+                        path[parent_id] = len(path)
+                        stack.append((parent_id, iter(get_parents(parent_id))))
+                        break
+                else:
+                    stack.pop()
+                    del path[class_id]
+                    closure[class_id] = combine(class_id, [closure[p] for p in get_parents(class_id) if p in closure])
+
+        return closure
@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class Diagnostic:
+    """
+    A problem found in a diagram
+
+    Parameters:
+      cell_id: the id of the cell, relationship or class at fault, None if the problem is not tied to one
+      stage: the stage that found the problem, one of "style", "syntax" or "generate"
+      message: the description of the problem
+    """
+
+    cell_id: str | None
+    stage: str
+    message: str
+
+    def __str__(self):
+        if self.cell_id is None:
+            return f"[{self.stage}] {self.message}"
+        else:
+            return f"[{self.stage}] {self.cell_id}: {self.message}"
+
+    def to_dict(self):
+        return {
+            'cell_id': self.cell_id,
+            'stage': self.stage,
+            'message': self.message
+        }
+
+
+class DiagnosticError(ValueError):
+    """
+    Raised on the first problem when failing fast
+
+    Parameters:
+      diagnostic: the Diagnostic of the problem
+    """
+
+    def __init__(self, diagnostic):
+        super().__init__(diagnostic)
+        self.diagnostic = diagnostic
+
+    def __str__(self):
+        return str(self.diagnostic)
+
+
+class Diagnostics:
+    """
+    Collect the problems found while parsing a diagram and generating its code, so they are all reported at once
+
+    Parameters:
+      fail_fast: whether to raise a DiagnosticError on the first problem instead of collecting it
+    """
+
+    def __init__(self, fail_fast=False):
+        self.fail_fast = fail_fast
+        self.entries = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def report(self, cell_id, stage, message):
+        """
+        Record a problem, or raise it when failing fast
+
+        Parameters:
+          cell_id: the id of the cell, relationship or class at fault, None if the problem is not tied to one
+          stage: the stage that found the problem
+          message: the description of the problem, or the exception that was raised
+        """
+
+        if isinstance(message, Exception):
+            message = f"{type(message).__name__}: {message}"
+
+        diagnostic = Diagnostic(cell_id, stage, message)
+
+        if self.fail_fast:
+            raise DiagnosticError(diagnostic)
+
+        self.entries.append(diagnostic)
+        print(diagnostic)
+
+    def extend(self, diagnostics):
+        """
+        Record the problems found elsewhere, in a worker process for instance
+
+        Parameters:
+          diagnostics: iterable of Diagnostic
+        """
+
+        self.entries.extend(diagnostics)
@@ -0,0 +1,209 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from decode.convert_to_readable import DecodeAndDecompress
+from parsers.diagnostics import Diagnostics
+from parsers.style_parser import StyleParser
+from parsers.syntax_model import SyntaxModel
+from parsers.syntax_parser import SyntaxParser
+
+
+class DiagramParser:
+    """
+    Decode and parse every page of a DrawIO file into a single syntax tree
+
+    Parameters:
+      drawio_filepath: file path to the .drawio file
+      workers: number of worker processes, pages are parsed serially when lower than 2
+      max_size: maximum size of an inflated page, in bytes
+      keep_xml: whether to keep the decoded XML of each page, if not the pages are parsed as they are inflated
+      keep_style_trees: whether to keep the style tree of each page, if not the pages are parsed as they are read
+      cache: optional DiagramCache used to skip the decoding of pages that were already seen
+      relationship_rules: optional extra rules to classify the relationships, see SyntaxParser.RELATIONSHIP_RULES
+      snapshot: optional SyntaxSnapshot used to skip the decoding and parsing of a diagram that was already parsed
+      fail_fast: whether to stop on the first problem found in the diagram, raising a DiagnosticError,
+                 instead of collecting them all in diagnostics
+    """
+
+    def __init__(self, drawio_filepath, workers=1, max_size=DecodeAndDecompress.MAX_INFLATED_SIZE, keep_xml=True,
+                 keep_style_trees=True, cache=None, relationship_rules=None, snapshot=None, fail_fast=False):
+        self.drawio_filepath = drawio_filepath
+        self.workers = workers
+        self.max_size = max_size
+        self.keep_xml = keep_xml
+        self.keep_style_trees = keep_style_trees
+        self.cache = cache
+        self.relationship_rules = relationship_rules
+        self.snapshot = snapshot
+        self.fail_fast = fail_fast
+        self.diagnostics = Diagnostics(fail_fast)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.decoded_xmls = None
+        self.style_trees = None
+
+    @staticmethod
+    def parse_page(page, max_size, keep_xml, keep_style_tree, cache, relationship_rules=None, fail_fast=False):
+        """
+        Decode and parse a single page, in a worker process when parsing in parallel
+
+        Parameters:
+          page: tuple of (page_name, page_id, tag_text) as yielded by DecodeAndDecompress.iter_page_texts
+          max_size: maximum size of the inflated page, in bytes
+          keep_xml: whether to return the decoded XML, if not the page is parsed as it is inflated
+          keep_style_tree: whether to return the style tree, if not the syntax tree is built as the XML is read
+          cache: optional DiagramCache to look the decoded XML up in, and to store it into
+          relationship_rules: optional extra rules to classify the relationships
+          fail_fast: whether to raise a DiagnosticError on the first problem found in the page
+
+        Returns:
+          parsed_page: tuple of (page_name, page_id, decoded_xml, cache_hit, style_tree, syntax_tree, diagnostics),
+                       diagnostics being the list of the problems found in the page
+        """
+
+        page_name, page_id, tag_text = page
+        decoded_xml = cache.get(tag_text) if cache else None
+        cache_hit = decoded_xml is not None
+
+        if decoded_xml is None and (keep_xml or cache):
+            decoded_xml = DecodeAndDecompress.decode_tag_text(tag_text, max_size)
+            if cache:
+                cache.put(tag_text, decoded_xml)
+
+        diagnostics = Diagnostics(fail_fast)
+
+        if decoded_xml is not None:
+            style_parser = StyleParser(decoded_xml, diagnostics=diagnostics)
+        else:
+            style_parser = StyleParser(DecodeAndDecompress.open_tag_text(tag_text, max_size), diagnostics=diagnostics)
+
+        if keep_style_tree:
+            style_tree = style_parser.convert_to_style_tree()
+
+            if style_tree is False:  # already reported by the style parser, the page has no classes to parse
+                return page_name, page_id, decoded_xml if keep_xml else None, cache_hit, None, {}, diagnostics.entries
+
+            syntax_parser = SyntaxParser(style_tree, relationship_rules, diagnostics)
+        else:
+            style_tree = None
+            syntax_parser = SyntaxParser(style_parser.iter_events(), relationship_rules, diagnostics)
+
+        syntax_tree = syntax_parser.convert_to_syntax_tree()
+
+        return (page_name, page_id, decoded_xml if keep_xml else None, cache_hit, style_tree, syntax_tree,
+                diagnostics.entries)
+
+    @staticmethod
+    def rename_classes(syntax_tree, new_ids):
+        """
+        Change the ids of some classes of a syntax tree, along with the relationships pointing at them
+
+        Parameters:
+          syntax_tree: the syntax tree of a single page
+          new_ids: dictionary mapping the old class ids to the new ones
+
+        Returns:
+          syntax_tree: a syntax tree with the same classes in the same order
+        """
+
+        for class_def in syntax_tree.values():
+            relationships = class_def['relationships']
+
+            for kind in ('implements', 'extends'):
+                relationships[kind] = [new_ids.get(r, r) for r in relationships[kind]]
+
+            for kind in ('association', 'aggregation', 'composition'):
+                relationships[kind] = [(r[0], new_ids.get(r[1], r[1])) for r in relationships[kind]]
+
+        return {new_ids.get(class_id, class_id): class_def for class_id, class_def in syntax_tree.items()}
+
+    def iter_parsed_pages(self):
+        """
+        Decode and parse the pages of the diagram, fanning them out to a process pool if needed
+
+        Returns:
+          parsed_pages: a generator of (page_name, page_id, decoded_xml, cache_hit, style_tree, syntax_tree,
+                        diagnostics) in document order
+        """
+
+        pages = DecodeAndDecompress.iter_page_texts(self.drawio_filepath)
+        parse_page = partial(self.parse_page, max_size=self.max_size, keep_xml=self.keep_xml,
+                             keep_style_tree=self.keep_style_trees, cache=self.cache,
+                             relationship_rules=self.relationship_rules, fail_fast=self.fail_fast)
+
+        if self.workers > 1:
+            with ProcessPoolExecutor(self.workers) as executor:
+                yield from executor.map(parse_page, pages)
+        else:
+            yield from map(parse_page, pages)
+
+    def convert_to_syntax_tree(self):
+        """
+        Merge the syntax trees of all the pages into one
+
+        A class whose id is already used by a previous page is given an id qualified by its page's id,
+        or by the position of the page when it has no id, so ids only depend on the order of the pages.
+        When the syntax tree is loaded from a snapshot, the decoded XML and the style trees are left empty.
+        The problems found in the pages are collected in diagnostics, and diagrams with problems are not snapshot,
+        so they are reported again on the next run.
+
+        Returns:
+          syntax_tree: the syntax tree that is used by the generators
+        """
+
+        self.decoded_xmls, self.style_trees = [], {}
+        self.diagnostics = Diagnostics(self.fail_fast)
+        self.cache_hits = self.cache_misses = 0
+
+        if self.snapshot:
+            syntax_tree = self.snapshot.load(self.drawio_filepath, self.relationship_rules)
+            if syntax_tree is not None:
+                print("<<< SYNTAX SNAPSHOT LOADED >>>")
+                return syntax_tree
+
+        syntax_tree = {}
+
+        for page_index, parsed_page in enumerate(self.iter_parsed_pages()):
+            page_name, page_id, decoded_xml, cache_hit, style_tree, page_syntax_tree, page_diagnostics = parsed_page
+            page_key = page_id if page_id is not None else page_index
+            self.diagnostics.extend(page_diagnostics)
+
+            if self.cache and cache_hit:
+                self.cache_hits += 1
+            elif self.cache:
+                self.cache_misses += 1
+
+            if decoded_xml is not None:
+                self.decoded_xmls.append(decoded_xml)
+            if style_tree is not None:
+                self.style_trees[f"{page_name} [{page_key}]"] = style_tree
+
+            new_ids = {class_id: f"{page_key}:{class_id}" for class_id in page_syntax_tree if class_id in syntax_tree}
+            if new_ids:
+                page_syntax_tree = self.rename_classes(page_syntax_tree, new_ids)
+
+            syntax_tree.update(page_syntax_tree)
+
+        if self.cache:
+            self.cache.evict()
+            print(f"<<< DIAGRAM CACHE: {self.cache_hits} HIT(S), {self.cache_misses} MISS(ES) >>>")
+
+        if self.diagnostics:
+            print(f"<<< {len(self.diagnostics)} DIAGNOSTIC(S) >>>")
+        elif self.snapshot:
+            try:
+                self.snapshot.save(self.drawio_filepath, syntax_tree, self.relationship_rules)
+            except OSError as e:  # the diagram is still parsed, only the next run is slower
+                print(f"{self.__class__.__name__}.convert_to_syntax_tree ERROR: {e}")
+
+        return syntax_tree
+
+    def convert_to_syntax_model(self):
+        """
+        Merge the syntax trees of all the pages into an indexed, read-only syntax tree
+
+        Returns:
+          syntax_model: the SyntaxModel that is shared by the generators
+        """
+
+        return SyntaxModel(self.convert_to_syntax_tree())
@@ -0,0 +1,160 @@
+from parsers.diagnostics import Diagnostics
+from parsers.style_parser import StyleParser
+from parsers.syntax_parser import SyntaxParser
+
+
+class IncrementalParser:
+    """
+    Parse successive versions of a diagram page, only parsing again what changed since the previous version
+
+    Cells are diffed by id and attribute hash: the unchanged ones are reused as they are, and only
+    the classes with an added, changed or removed cell are built again. Relationships are cheap,
+    so they are all resolved again, but only the classes whose relationships changed are replaced.
+
+    Parameters:
+      relationship_rules: optional extra rules to classify the relationships, see SyntaxParser.RELATIONSHIP_RULES
+      fail_fast: whether to raise a DiagnosticError on the first problem found, instead of collecting them all
+    """
+
+    def __init__(self, relationship_rules=None, fail_fast=False):
+        self.relationship_rules = relationship_rules
+        self.fail_fast = fail_fast
+        self.diagnostics = Diagnostics(fail_fast)
+        self.known_cells = None
+        self.class_cells = {}
+        self.style_tree = None
+        self.syntax_tree = {}
+
+    @staticmethod
+    def group_class_cells(root_parent):
+        """
+        Group the cells of a style tree by the class they belong to
+
+        Parameters:
+          root_parent: the RootParent of the style tree
+
+        Returns:
+          class_cells: dictionary mapping the class ids to the list of their cells, the class cell first,
+                       None if the cells of a class do not follow each other, and the classes cannot be built apart
+        """
+
+        class_cells = {}
+        cells = None
+
+        for cell in root_parent.cells.values():
+            # skip the labels of the relationships, and the relationships drawn as cells
+            if cell.parent_id in root_parent.relationships or "endArrow" in cell.style:
+                continue
+
+            if cell.parent_id == root_parent.id and cell.style['type'].lower() in SyntaxParser.CLASS_CELL_TYPES:
+                cells = class_cells[cell.id] = [cell]
+            elif cells is not None and cell.parent_id == cells[0].id:
+                cells.append(cell)
+            else:
+                return None
+
+        return class_cells
+
+    def update(self, di_xml):
+        """
+        Parse a new version of the page and patch the syntax tree
+
+        The first call parses the whole page. The problems found in this version of the page,
+        including the ones of the classes that did not change, are collected in diagnostics.
+
+        Parameters:
+          di_xml: the decoded and decompressed DrawIO XML, either as a string or as a readable text stream
+
+        Returns:
+          dirty_class_ids: set of the ids of the classes that were added, changed or removed
+        """
+
+        diagnostics = Diagnostics(self.fail_fast)
+        style_parser = StyleParser(di_xml, self.known_cells or {}, diagnostics)
+        style_tree = style_parser.convert_to_style_tree()
+
+        try:
+            class_cells = self.group_class_cells(style_tree['root']) if style_tree else None
+        except KeyError:  # a cell without a type, that the syntax parser will fail on
+            class_cells = None
+
+        syntax_tree = None
+
+        if self.known_cells is not None and class_cells is not None:
+            syntax_tree, dirty_class_ids = self.patch_syntax_tree(style_tree['root'], class_cells, diagnostics)
+
+        if syntax_tree is None:
+            syntax_tree = SyntaxParser(style_tree, self.relationship_rules, diagnostics).convert_to_syntax_tree()
+            dirty_class_ids = set(syntax_tree) | set(self.syntax_tree)
+
+        self.known_cells = style_parser.parsed_cells if style_tree else None
+        self.class_cells = {
+            class_id: tuple(cell.id for cell in cells) for class_id, cells in (class_cells or {}).items()
+        }
+        self.style_tree = style_tree
+        self.syntax_tree = syntax_tree
+        self.diagnostics = diagnostics
+
+        print(f"<<< INCREMENTAL PARSE: {len(dirty_class_ids)} DIRTY CLASS(ES) >>>")
+
+        return dirty_class_ids
+
+    def patch_syntax_tree(self, root_parent, class_cells, diagnostics):
+        """
+        Build the changed classes, and reuse the previous syntax tree for the others
+
+        Parameters:
+          root_parent: the RootParent of the new style tree
+          class_cells: dictionary mapping the class ids to the list of their cells
+          diagnostics: the Diagnostics of the new version, only added to if the syntax tree is patched
+
+        Returns:
+          patch: tuple of (syntax_tree, dirty_class_ids), syntax_tree being None if the
+                 changed classes could not be built and the page must be parsed as a whole
+        """
+
+        changed_class_ids = {
+            class_id for class_id, cells in class_cells.items()
+            if self.class_cells.get(class_id) != tuple(cell.id for cell in cells)
+            or any(self.known_cells.get(cell.id, (None, None))[1] is not cell for cell in cells)
+        }
+
+        events = [("root", root_parent)]
+        for class_id in changed_class_ids:
+            events.extend(("cell", cell) for cell in class_cells[class_id])
+        patch_diagnostics = Diagnostics(self.fail_fast)
+        changed_classes = SyntaxParser(events, self.relationship_rules, patch_diagnostics).convert_to_syntax_tree()
+
+        if changed_classes.keys() != changed_class_ids:  # parsing failed half way
+            return None, None
+
+        events = [("root", root_parent)]
+        events.extend(("edge", edge) for edge in root_parent.relationships.values())
+        relationships = {class_id: {'relationships': SyntaxParser.relationships_template()} for class_id in class_cells}
+        SyntaxParser(events, self.relationship_rules, patch_diagnostics).convert_to_syntax_tree(relationships)
+
+        syntax_tree = {}
+        dirty_class_ids = changed_class_ids | (self.syntax_tree.keys() - class_cells.keys())
+
+        for class_id in class_cells:
+            class_relationships = relationships[class_id]['relationships']
+
+            if class_id in changed_class_ids:
+                class_def = changed_classes[class_id]
+                class_def['relationships'] = class_relationships
+            else:
+                class_def = self.syntax_tree[class_id]
+                if class_def['relationships'] != class_relationships:
+                    class_def = {**class_def, 'relationships': class_relationships}
+                    dirty_class_ids.add(class_id)
+
+            syntax_tree[class_id] = class_def
+
+        # the members in error of the classes that were not parsed again are still in error
+        unchanged_cell_ids = {
+            cell.id for class_id, cells in class_cells.items() if class_id not in changed_class_ids for cell in cells
+        }
+        diagnostics.extend(d for d in self.diagnostics if d.stage == "syntax" and d.cell_id in unchanged_cell_ids)
+        diagnostics.extend(patch_diagnostics)
+
+        return syntax_tree, dirty_class_ids
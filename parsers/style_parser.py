@@ -1,7 +1,10 @@
 import re
-import traceback
-from collections import OrderedDict
-from bs4 import BeautifulSoup as bs
+import sys
+from functools import lru_cache
+from html import unescape
+from lxml import etree
+from parsers.diagnostics import Diagnostics, DiagnosticError
+from parsers.style_tree import Cell, Edge, RootParent, Style
 
 
 class StyleParser:
@@ -9,152 +12,319 @@ class StyleParser:
     Parse the XML into a style tree
 
     Parameters:
-      di_xml: the decoded and decompressed DrawIO XML
+      di_xml: the decoded and decompressed DrawIO XML, either as a string or as a readable text stream
+      known_cells: optional dictionary mapping cell ids to (attributes hash, Cell) tuples from a previous parse,
+                   the cells whose attributes did not change are reused instead of being parsed again
+      diagnostics: optional Diagnostics collecting the problems found, the cells at fault being skipped
     """
 
-    def __init__(self, di_xml):
+    HR_TAG = re.compile(r"<hr .*?>")
+    # comments, script and style elements with their content, then any other tag, closed or not
+    HTML_MARKUP = re.compile(r"<!--.*?(?:-->|$)|<(script|style)\b.*?(?:</\1\s*>|$)|</?[A-Za-z!?/][^>]*(?:>|$)",
+                             re.DOTALL | re.IGNORECASE)
+    HTML_BLANKS = " \t\r\n"
+    # the text before the first access modifier, then each access modifier with the text up to the next one
+    MEMBER_VALUES = re.compile(r"[^-+#]+|[-+#][^-+#]*")
+    STYLE_CACHE_SIZE = 4096
+    FEED_SIZE = 64 * 1024
+
+    def __init__(self, di_xml, known_cells=None, diagnostics=None):
         self.di_xml = di_xml
+        self.known_cells = known_cells
+        self.parsed_cells = {}
         self.style_tree = None
+        self.diagnostics = diagnostics if diagnostics is not None else Diagnostics()
 
     def convert_to_style_tree(self):
         """
         Convert the XML to a style tree
 
         Returns:
-          style_tree: dictionary of the extracted elements from the XML
+          style_tree: dictionary holding the RootParent of the extracted elements under the 'root' key,
+                      False if the XML could not be read
         """
 
         print("<<< CONVERTING XML TO STYLE TREE >>>")
 
         try:
             self.style_tree = {}
-            graph_model = bs(self.di_xml, "lxml")
-            root = graph_model.find('root')
-            root_children = root.children
-
-            grandparent = None
-            root_parent = None
-
-            relationship_list = []
-
-            child = next(root_children, None)
-            while child:
-                child_attrs = child.attrs
-
-                if "parent" in child_attrs:
-                    if child_attrs['parent'] == grandparent:  # found the root parent element
-                        root_parent = child_attrs['id']
-                        self.style_tree['root'] = self.add_root_parent(child_attrs)
-                    elif "source" in child_attrs or "target" in child_attrs:  # found a relationship element
-                        if "source" not in child_attrs:
-                            print(f"'source' not present in {child_attrs['id']} relationship")
-                        elif "target" not in child_attrs:
-                            print(f"'target' not present in {child_attrs['id']} relationship")
-                        else:
-                            relationship_list.append(child_attrs)
-                    else:  # found a cell element
-                        self.style_tree['root']['cells'][child_attrs['id']] = self.add_cells(child_attrs, root_parent)
-                else:  # found the grandparent element
-                    if grandparent is None:
-                        grandparent = child_attrs['id']
-
-                child = next(root_children, None)
 
-            # need to process the relationships at the end to get the right source and target
-            for child_attrs in relationship_list:
-                self.style_tree['root']['relationships'][child_attrs['id']] = self.add_relationships(child_attrs,
-                                                                                                     root_parent)
+            for kind, item in self.iter_events():
+                match kind:
+                    case "root":
+                        self.style_tree['root'] = item
+                    case "cell" | "label":
+                        self.style_tree['root'].cells[item.id] = item
+                    case "edge":
+                        self.style_tree['root'].relationships[item.id] = item
 
             return self.style_tree
+        except DiagnosticError:
+            raise
         except Exception as e:
-            print(f"StyleParser.convert_to_style_tree ERROR: {e}")
-            traceback.print_exception(e)
+            self.diagnostics.report(None, "style", e)
             return False
 
+    def iter_events(self):
+        """
+        Walk the XML and yield the elements of the style tree as they are read, without building the tree
+
+        Cells are yielded in document order, the XML elements being dropped once read.
+        Relationships are only yielded at the end, once every cell they can point at is known.
+        Elements that cannot be read are reported in diagnostics and skipped.
+
+        Returns:
+          events: a generator of (kind, item) tuples, where kind is one of
+                  "root": item is the RootParent, without cells nor relationships
+                  "cell": item is a Cell
+                  "label": item is a Cell whose parent is a relationship
+                  "edge": item is an Edge
+        """
+
+        self.parsed_cells = {}
+        style_cache_info = self.get_style.cache_info()
+
+        grandparent = None
+        root_parent = None
+
+        parent_ids = {}  # only the parent of each cell is kept, to resolve the relationships at the end
+        relationship_list = []
+        relationship_ids = set()
+
+        for child_attrs in self.iter_root_children():
+            if "parent" in child_attrs:
+                if child_attrs['parent'] == grandparent:  # found the root parent element
+                    root_parent = child_attrs['id']
+                    yield "root", self.add_root_parent(child_attrs)
+                elif "source" in child_attrs or "target" in child_attrs:  # found a relationship element
+                    if "source" not in child_attrs:
+                        self.diagnostics.report(child_attrs.get('id'), "style", "'source' not present in relationship")
+                    elif "target" not in child_attrs:
+                        self.diagnostics.report(child_attrs.get('id'), "style", "'target' not present in relationship")
+                    else:
+                        relationship_list.append(dict(child_attrs))
+                        relationship_ids.add(child_attrs['id'])
+                else:  # found a cell element
+                    try:
+                        if self.known_cells is None:
+                            cell = self.add_cells(child_attrs, root_parent)
+                        else:
+                            cell = self.reuse_cell(child_attrs, root_parent)
+                    except (KeyError, ValueError) as e:  # a cell without style or value
+                        self.diagnostics.report(child_attrs.get('id'), "style", e)
+                        continue
+
+                    parent_ids[cell.id] = cell.parent_id
+                    yield "label" if cell.parent_id in relationship_ids else "cell", cell
+            else:  # found the grandparent element
+                if grandparent is None:
+                    grandparent = child_attrs['id']
+
+        # need to process the relationships at the end to get the right source and target
+        root_ancestors = self.index_root_ancestors(parent_ids, root_parent)
+        for child_attrs in relationship_list:
+            try:
+                edge = self.add_relationships(child_attrs, root_ancestors)
+            except KeyError as e:  # a relationship without style
+                self.diagnostics.report(child_attrs['id'], "style", e)
+                continue
+
+            yield "edge", edge
+
+        hits = self.get_style.cache_info().hits - style_cache_info.hits
+        misses = self.get_style.cache_info().misses - style_cache_info.misses
+        print(f"<<< STYLE CACHE: {hits} HIT(S), {misses} MISS(ES) >>>")
+
+    def iter_root_children(self):
+        """
+        Read the attributes of the children of the <root> element, one child at a time
+
+        The XML is fed to a pull parser in pieces, and the children are removed
+        from the document once read, so it is never held in memory as a whole.
+
+        Returns:
+          attrs: a generator of the attributes of each child
+        """
+
+        xml_parser = etree.XMLPullParser(events=("start",), resolve_entities=False, huge_tree=True)
+
+        if isinstance(self.di_xml, str):
+            feed_size = self.FEED_SIZE
+            chunks = (self.di_xml[i:i + feed_size] for i in range(0, len(self.di_xml), feed_size))
+        else:
+            chunks = iter(lambda: self.di_xml.read(self.FEED_SIZE), "")
+
+        root = None
+
+        for chunk in chunks:
+            xml_parser.feed(chunk)
+
+            for _, element in xml_parser.read_events():
+                parent = element.getparent()
+
+                if parent is None:  # the mxGraphModel element
+                    continue
+                elif root is None:
+                    if element.tag == "root" and parent.getparent() is None:
+                        root = element
+                elif parent is root:
+                    # every previous child was read already
+                    while element.getprevious() is not None:
+                        del root[0]
+
+                    yield element.attrib
+
+        xml_parser.close()
+
     def add_root_parent(self, attrs):
         """
-        Format dictionary for the root parent
+        Create the root parent
 
         Parameters:
           attrs: the root_parent element attributes
 
         Returns:
-          root_parent_dict: dictionary containing id, parent_id, cells, connections
+          root_parent: RootParent with id, parent_id and no cells or relationships yet
         """
 
-        return {
-            'id': attrs['id'],
-            'parent_id': attrs['parent'],
-            'cells': OrderedDict(),  # need to keep insertion order to separate the properties and methods
-            'relationships': {}
-        }
+        return RootParent(attrs['id'], attrs['parent'])
 
-    def add_relationships(self, attrs, root_parent):
+    def index_root_ancestors(self, parent_ids, root_parent):
         """
-        Format dictionary for the relationships
+        Find, for every cell, its outermost container below the root parent
+
+        Each parent chain is walked only once: every cell met on the way is given
+        the same ancestor, so the walks of the cells below it stop there.
 
         Parameters:
-          attrs: the relationship element attributes
-          tree: the style tree, needed to find the parent target
+          parent_ids: dictionary mapping cell ids to the id of their parent
           root_parent: the id of the root parent element
 
         Returns:
-          root_parent_dict: dictionary containing id, parent_id, cells, connections
+          root_ancestors: dictionary mapping cell ids to the id of their ancestor,
+                          None when the chain is broken or loops
         """
 
-        source = attrs['source']
-        parent_source = self.style_tree['root']['cells'][source]['parent_id']
-        while parent_source != root_parent:
-            source = parent_source
-            parent_source = self.style_tree['root']['cells'][source]['parent_id']
+        root_ancestors = {}
+
+        for cell_id in parent_ids:
+            chain = {}  # cells met on the way up, kept as a dict for fast cycle detection
+            ancestor = cell_id
+
+            while ancestor not in root_ancestors:
+                if ancestor not in parent_ids or ancestor in chain:  # missing parent or cycle
+                    root_ancestor = None
+                    break
 
-        target = attrs['target']
-        parent_target = self.style_tree['root']['cells'][target]['parent_id']
-        while parent_target != root_parent:
-            target = parent_target
-            parent_target = self.style_tree['root']['cells'][target]['parent_id']
+                chain[ancestor] = None
+                parent_id = parent_ids[ancestor]
+                if parent_id == root_parent:
+                    root_ancestor = ancestor
+                    break
+
+                ancestor = parent_id
+            else:
+                root_ancestor = root_ancestors[ancestor]
+
+            for chained_id in chain:
+                root_ancestors[chained_id] = root_ancestor
+
+        return root_ancestors
+
+    def add_relationships(self, attrs, root_ancestors):
+        """
+        Create a relationship
+
+        Sources or targets that cannot be resolved to a cell are set to None and reported in diagnostics.
+
+        Parameters:
+          attrs: the relationship element attributes
+          root_ancestors: dictionary mapping cell ids to their outermost container, see index_root_ancestors
+
+        Returns:
+          edge: Edge with id, parent_id, source, target, style
+        """
+
+        source = self.resolve_endpoint(attrs, 'source', root_ancestors)
+        target = self.resolve_endpoint(attrs, 'target', root_ancestors)
 
         style = self.get_style(attrs['style'])
 
-        return {
-            'id': attrs['id'],
-            'parent_id': attrs['parent'],
-            'source': source,
-            'target': target,
-            'style': style
-        }
+        return Edge(attrs['id'], attrs['parent'], source, target, style)
+
+    def resolve_endpoint(self, attrs, endpoint, root_ancestors):
+        """
+        Resolve the source or target of a relationship to its outermost container
+
+        Parameters:
+          attrs: the relationship element attributes
+          endpoint: either 'source' or 'target'
+          root_ancestors: dictionary mapping cell ids to their outermost container
+
+        Returns:
+          cell_id: the id of the container, None if the endpoint is dangling
+        """
+
+        cell_id = attrs[endpoint]
+        root_ancestor = root_ancestors.get(cell_id)
+
+        if root_ancestor is None:
+            if cell_id in root_ancestors:
+                message = f"{endpoint} '{cell_id}' is not inside the root parent"
+            else:
+                message = f"{endpoint} '{cell_id}' is not a cell"
+
+            self.diagnostics.report(attrs['id'], "style", f"dangling relationship, {message}")
+
+        return root_ancestor
+
+    def reuse_cell(self, attrs, root_parent):
+        """
+        Reuse the cell of a previous parse if its attributes did not change, parse it otherwise
+
+        Parameters:
+          attrs: the cell element attributes
+          root_parent: the id of the root parent
+
+        Returns:
+          cell: the known Cell, or a new one
+        """
+
+        attrs_hash = hash((root_parent, tuple(attrs.items())))
+        known_cell = self.known_cells.get(attrs['id'])
+
+        if known_cell is not None and known_cell[0] == attrs_hash:
+            cell = known_cell[1]
+        else:
+            cell = self.add_cells(attrs, root_parent)
+
+        self.parsed_cells[cell.id] = attrs_hash, cell
+        return cell
 
     def add_cells(self, attrs, root_parent):
         """
-        Format dictionary for the cells
+        Create a cell
 
         Parameters:
           attrs: the cell element attributes
           root_parent: the id of the root parent
 
         Returns:
-          cell_dict: dictionary containing id, parent_id, style, values
+          cell: Cell with id, parent_id, style, values
         """
 
         style = self.get_style(attrs['style'])
         value = attrs['value']
-        cell_result = {
-            'id': attrs['id'],
-            'parent_id': attrs['parent'],
-            'style': style
-        }
 
         if "type" not in style.keys() and attrs['parent'] == root_parent:  # cell design is html
-            style['type'] = "html"
-            split_values = re.sub("<hr .*?>", "\n<hr>\n", value).lstrip("\n").split("\n")
-            cell_result['values'] = [
-                self.get_text_values(bs(val, 'lxml').text) for val in split_values if val != "<hr>"
-            ]
-            cell_result['style']['type'] = "html"
+            # styles are shared, so the html variant is parsed from its own style string instead of being patched
+            style = self.get_style(f"{attrs['style']};html")
+            split_values = self.HR_TAG.sub("\n<hr>\n", value).lstrip("\n").split("\n")
+            values = [self.get_text_values(self.html_to_text(val)) for val in split_values if val != "<hr>"]
         else:
-            cell_result['values'] = self.get_text_values(value)
+            values = self.get_text_values(value)
 
-        return cell_result
+        return Cell(attrs['id'], attrs['parent'], style, values)
 
     def get_text_values(self, values):
         """
@@ -170,32 +340,44 @@ class StyleParser:
         # Prevent the removal of annotations
         values = values.replace("<<", "&lt;&lt;").replace(">>", "&gt;&gt;")
         # Strip HTML tags
-        values = bs(values, "lxml").text
+        values = self.html_to_text(values)
 
-        vals = []
-        temp_val = ""
+        return [v.strip().replace(" ", "") for v in self.MEMBER_VALUES.findall(values) or [values]]
 
-        for v in values:
-            if v in ['+', '-', "#"]:
-                if temp_val:
-                    vals.append(temp_val.strip().replace(" ", ""))
-                temp_val = ""
+    @staticmethod
+    def html_to_text(html):
+        """
+        Strip the tags of an HTML label and decode its character references
 
-            temp_val += v
+        This is a single regular expression pass, no document is built for the label.
+        Like an HTML parser, blanks at the start of the label are dropped.
 
-        vals.append(temp_val.strip().replace(" ", ""))
+        Parameters:
+          html: the HTML label of a cell
 
-        return vals
+        Returns:
+          text: the text content of the label
+        """
+
+        if "<" not in html and "&" not in html:  # plain text label
+            return html.lstrip(StyleParser.HTML_BLANKS)
 
-    def get_style(self, style_attrs):
+        return unescape(StyleParser.HTML_MARKUP.sub("", html.lstrip(StyleParser.HTML_BLANKS)))
+
+    @staticmethod
+    @lru_cache(maxsize=STYLE_CACHE_SIZE)
+    def get_style(style_attrs):
         """
         Convert the style attribute to a dictionary
 
+        Diagrams reuse the same few style strings for most of their cells, so the
+        result is cached and shared between them. It is therefore read-only.
+
         Parameters:
           style_attrs: style attributes of the element
 
         Returns:
-          style_dict: style attribute as a dictionary
+          style_dict: style attribute as a read-only dictionary
         """
 
         style_list = style_attrs.split(";")
@@ -204,9 +386,23 @@ class StyleParser:
         for s in style_list:
             if "=" in s:
                 s_list = s.split("=")
-                style_dict[s_list[0]] = s_list[1]
+                style_dict[sys.intern(s_list[0])] = s_list[1]
             else:
                 if s:
                     style_dict['type'] = s
 
-        return style_dict
+        return StyleParser.freeze_style(style_dict)
+
+    @staticmethod
+    def freeze_style(style_dict):
+        """
+        Make a style dictionary read-only
+
+        Parameters:
+          style_dict: style attribute as a dictionary
+
+        Returns:
+          style: read-only view of the dictionary
+        """
+
+        return Style(style_dict)
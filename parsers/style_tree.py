@@ -0,0 +1,137 @@
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+
+class Style(Mapping):
+    """
+    Read-only style of a cell or of a relationship, shared by the cells with the same style attribute
+
+    Styles are pickled as the dictionary they wrap, so style trees travel to and from worker processes.
+
+    Parameters:
+      style_dict: the style attribute as a dictionary, which is not copied and must not be changed afterwards
+    """
+
+    __slots__ = ('style_dict',)
+
+    def __init__(self, style_dict):
+        self.style_dict = style_dict
+
+    def __reduce__(self):
+        return Style, (self.style_dict,)
+
+    def __getitem__(self, name):
+        return self.style_dict[name]
+
+    def __contains__(self, name):
+        return name in self.style_dict
+
+    def __iter__(self):
+        return iter(self.style_dict)
+
+    def __len__(self):
+        return len(self.style_dict)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.style_dict!r})"
+
+    def get(self, name, default=None):
+        return self.style_dict.get(name, default)
+
+
+@dataclass(slots=True)
+class Cell:
+    """
+    A vertex of the style tree
+
+    Parameters:
+      id: the id of the mxCell
+      parent_id: the id of the parent mxCell
+      style: the read-only style of the cell, shared by the cells with the same style
+      values: the text values of the cell, one list per section for html cells
+    """
+
+    id: str
+    parent_id: str
+    style: Mapping
+    values: list
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'parent_id': self.parent_id,
+            'style': self.style,
+            'values': self.values
+        }
+
+
+@dataclass(slots=True)
+class Edge:
+    """
+    A relationship of the style tree
+
+    Parameters:
+      id: the id of the mxCell
+      parent_id: the id of the parent mxCell
+      source: the id of the outermost container of the source, None if it is dangling
+      target: the id of the outermost container of the target, None if it is dangling
+      style: the read-only style of the relationship
+    """
+
+    id: str
+    parent_id: str
+    source: str | None
+    target: str | None
+    style: Mapping
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'parent_id': self.parent_id,
+            'source': self.source,
+            'target': self.target,
+            'style': self.style
+        }
+
+
+@dataclass(slots=True)
+class RootParent:
+    """
+    The root parent of the style tree, the layer holding every cell and relationship
+
+    Parameters:
+      id: the id of the mxCell
+      parent_id: the id of the grandparent mxCell
+      cells: the cells by id, in document order to separate the properties and methods
+      relationships: the relationships by id
+    """
+
+    id: str
+    parent_id: str
+    cells: OrderedDict = field(default_factory=OrderedDict)
+    relationships: dict = field(default_factory=dict)
+
+    def iter_events(self):
+        """
+        Replay the style tree as the events of StyleParser.iter_events
+
+        Returns:
+          events: a generator of (kind, item) tuples
+        """
+
+        yield "root", self
+
+        for cell in self.cells.values():
+            yield "label" if cell.parent_id in self.relationships else "cell", cell
+
+        for edge in self.relationships.values():
+            yield "edge", edge
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'parent_id': self.parent_id,
+            'cells': OrderedDict((cell_id, cell.to_dict()) for cell_id, cell in self.cells.items()),
+            'relationships': {edge_id: edge.to_dict() for edge_id, edge in self.relationships.items()}
+        }
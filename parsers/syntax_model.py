@@ -0,0 +1,104 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from parsers.class_hierarchy import ClassHierarchy
+
+
+class SyntaxModel(Mapping):
+    """
+    Read-only syntax tree, indexed for the lookups of the generators
+
+    The model maps the class ids to their definitions like the syntax tree it is built from,
+    and its index and inheritance closures are computed once, so generators running at the same time can share it.
+    The class definitions are not copied and must not be changed, variants of the model
+    with other constraints are made with overlay_constraints instead.
+
+    Indexes:
+      class_ids: class name to class id, the last class defined with a name winning
+
+    Parameters:
+      syntax_tree: the syntax tree, as built by SyntaxParser.convert_to_syntax_tree
+    """
+
+    def __init__(self, syntax_tree):
+        self.classes = MappingProxyType(dict(syntax_tree))
+        self.class_ids = MappingProxyType({class_def['name']: class_id for class_id, class_def in self.classes.items()})
+        self.overlays = {}
+        self.hierarchy = None
+
+    def overlay_constraints(self, key, get_changes):
+        """
+        Get a variant of the model with some property constraints changed, built once per key
+
+        Only the classes, properties and constraints that change are copied, everything else is shared.
+
+        Parameters:
+          key: hashable key of the variant, like the options the changes depend on
+          get_changes: function of the model returning a dictionary mapping the class ids to dictionaries
+                       mapping property ids to the constraints to set
+
+        Returns:
+          syntax_model: the SyntaxModel of the variant
+        """
+
+        syntax_model = self.overlays.get(key)
+
+        if syntax_model is None:
+            classes = dict(self.classes)
+
+            for class_id, property_changes in get_changes(self).items():
+                class_def = classes[class_id]
+                properties = dict(class_def['properties'])
+
+                for property_id, constraint_changes in property_changes.items():
+                    property_def = properties[property_id]
+                    properties[property_id] = {
+                        **property_def,
+                        'constraints': {**property_def['constraints'], **constraint_changes}
+                    }
+
+                classes[class_id] = {**class_def, 'properties': properties}
+
+            # concurrent callers may both build the variant, but they all get the first one stored
+            syntax_model = self.overlays.setdefault(key, SyntaxModel(classes))
+
+        return syntax_model
+
+    def get_hierarchy(self):
+        """
+        Get the closure of the inheritance of the classes, built on first use
+
+        Returns:
+          hierarchy: the ClassHierarchy of the model
+        """
+
+        if self.hierarchy is None:
+            self.hierarchy = ClassHierarchy(self)
+
+        return self.hierarchy
+
+    def __reduce__(self):
+        return SyntaxModel, (dict(self.classes),)
+
+    def __getitem__(self, class_id):
+        return self.classes[class_id]
+
+    def __iter__(self):
+        return iter(self.classes)
+
+    def __len__(self):
+        return len(self.classes)
+
+    def get_class_by_name(self, class_name):
+        """
+        Find a class by its name
+
+        Parameters:
+          class_name: the name of the class, the last class defined with that name being returned
+
+        Returns:
+          class_def: the class definition, None if no class has that name
+        """
+
+        class_id = self.class_ids.get(class_name)
+        return self.classes[class_id] if class_id is not None else None
@@ -1,6 +1,8 @@
-import traceback
+import re
+from functools import lru_cache
 
-from operator import itemgetter
+from parsers.diagnostics import Diagnostics, DiagnosticError
+from parsers.syntax_model import SyntaxModel
 
 
 class SyntaxParser:
@@ -8,7 +10,9 @@ class SyntaxParser:
     Parse the style tree into the syntax tree
 
     Parameters:
-      style_tree: style tree of the drawio file
+      style_tree: style tree of the drawio file, or the events of StyleParser.iter_events to parse it as it is read
+      relationship_rules: optional extra rules to classify the relationships, see RELATIONSHIP_RULES
+      diagnostics: optional Diagnostics collecting the problems found, the cells at fault being skipped
     """
 
     ACCESS_MODIFIER_MAPPINGS = {
@@ -17,6 +21,19 @@ class SyntaxParser:
         '-': "private"
     }
 
+    CLASS_CELL_TYPES = ('swimlane', 'html', 'text')
+
+    SIGNATURE_CACHE_SIZE = 4096
+
+    # everything up to the first opening brace, then the constraints up to the closing brace that ends the member
+    MEMBER_SIGNATURE = re.compile(r"(?P<body>[^{]*)\{(?P<constraints>.*)\}", re.DOTALL)
+    # name: type = default, anything after a second colon or equal sign being ignored, or name = default
+    PROPERTY_SIGNATURE = re.compile(r"(?P<name>[^:]*):(?P<type>[^:=]*)(?:=(?P<default>[^:=]*))?.*"
+                                    r"|(?P<untyped_name>[^=]*)(?:=(?P<untyped_default>[^=]*))?.*", re.DOTALL)
+    # name: return_type, anything after a second colon being ignored
+    METHOD_SIGNATURE = re.compile(r"(?P<name>[^:]*)(?::(?P<return_type>[^:]*))?.*", re.DOTALL)
+    METHOD_NAME = re.compile(r"(?P<name>[^(]*)\((?P<parameters>.*)\)", re.DOTALL)
+
     CONSTRAINT_MAPPINGS = {
         'sealed': "final",
         'const': "final",
@@ -30,8 +47,31 @@ class SyntaxParser:
         'serial': "identity",
     }
 
-    def __init__(self, style_tree):
+    RELATIONSHIP_KINDS = ('implements', 'extends', 'association', 'aggregation', 'composition')
+
+    # (startArrow, endArrow, startFill, endFill, dashed) of a line: the kind of relationship it draws,
+    # arrows being lowercase and None matching any value, the rule with the most values set wins
+    RELATIONSHIP_RULES = {
+        (None, "none", None, None, None): "association",
+        (None, "block", None, True, None): "association",
+        (None, "block", None, False, True): "implements",
+        (None, "block", None, False, False): "extends",
+        (None, "diamondthin", None, True, None): "composition",
+        (None, "diamondthin", None, False, None): "aggregation",
+        ("none", "open", None, None, None): "association",
+        ("diamondthin", "open", True, None, None): "composition",
+        ("diamondthin", "open", False, None, None): "aggregation",
+    }
+
+    def __init__(self, style_tree, relationship_rules=None, diagnostics=None):
         self.style_tree = style_tree
+        self.relationship_rules = self.compile_relationship_rules(relationship_rules)
+        self.rule_masks = sorted(
+            {tuple(value is not None for value in rule) for rule in self.relationship_rules},
+            key=lambda mask: (sum(mask), mask[1], mask[0], mask[3], mask[2], mask[4]), reverse=True
+        )
+        self.relationship_kinds = {}
+        self.diagnostics = diagnostics if diagnostics is not None else Diagnostics()
 
     @staticmethod
     def parse_class_name(class_name):
@@ -52,14 +92,14 @@ class SyntaxParser:
         member_sig = member_sig.strip()
 
         if member_sig.endswith('}'):
-            lbrace = member_sig.find('{')
-            if lbrace < 0:
+            match = SyntaxParser.MEMBER_SIGNATURE.fullmatch(member_sig)
+            if match is None:
                 raise ValueError(f"Member signature: {member_sig}. Missing opening brace")
             else:
-                constraints = [s.strip() for s in member_sig[lbrace + 1:-1].split(',') if s.strip()]
-                member_sig = member_sig[:lbrace].strip()
+                constraints = tuple(s.strip() for s in match['constraints'].split(',') if s.strip())
+                member_sig = match['body'].strip()
         else:
-            constraints = []
+            constraints = ()
 
         access = member_sig[0]
         if access in SyntaxParser.ACCESS_MODIFIER_MAPPINGS.keys():
@@ -67,7 +107,7 @@ class SyntaxParser:
         else:
             access = '-'
 
-        return access, member_sig.split(':'), constraints
+        return access, member_sig, constraints
 
     @staticmethod
     def to_constraint_dict(constraints):
@@ -85,22 +125,35 @@ class SyntaxParser:
         return constraint_dict
 
     @staticmethod
-    def parse_property_signature(property_sig):
-        access, parts, constraints = SyntaxParser.parse_member_signature(property_sig)
-        constraint_dict = SyntaxParser.to_constraint_dict(constraints)
+    @lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
+    def read_property_signature(property_sig):
+        """
+        Split a property signature into its parts, the result is cached and must not be changed
 
-        if len(parts) > 1:
-            name = parts[0].strip()
-            parts = parts[1].split("=")
-            data_type = parts[0].strip()
+        Parameters:
+          property_sig: the raw signature, like "-name: type = default {constraints}"
+
+        Returns:
+          parts: tuple of (access, name, data_type, default_value, constraint_dict)
+        """
+
+        access, property_sig, constraints = SyntaxParser.parse_member_signature(property_sig)
+        match = SyntaxParser.PROPERTY_SIGNATURE.fullmatch(property_sig)
+
+        if match['type'] is not None:
+            name, data_type, default_value = match['name'].strip(), match['type'].strip(), match['default']
         else:
-            data_type = 'unspecified'
-            parts = parts[0].split("=")
-            name = parts[0].strip()
+            name, data_type, default_value = match['untyped_name'].strip(), 'unspecified', match['untyped_default']
 
-        default_value = parts[1].strip() if len(parts) > 1 else None
+        if default_value is not None:
+            default_value = default_value.strip()
 
-        return access, name, data_type, default_value, constraint_dict
+        return access, name, data_type, default_value, SyntaxParser.to_constraint_dict(constraints)
+
+    @staticmethod
+    def parse_property_signature(property_sig):
+        access, name, data_type, default_value, constraints = SyntaxParser.read_property_signature(property_sig)
+        return access, name, data_type, default_value, dict(constraints)
 
     @staticmethod
     def parse_parameter_signature(parameter_sig):
@@ -116,88 +169,145 @@ class SyntaxParser:
         return {'name': param_name, 'type': param_type}
 
     @staticmethod
-    def parse_method_signature(method_sig):
-        access, parts, constraints = SyntaxParser.parse_member_signature(method_sig)
-        name = parts[0].strip()
-        return_type = parts[1].strip() if len(parts) > 1 else "void"
-        constraint_dict = SyntaxParser.to_constraint_dict(constraints)
+    @lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
+    def read_method_signature(method_sig):
+        """
+        Split a method signature into its parts, the result is cached and must not be changed
+
+        Parameters:
+          method_sig: the raw signature, like "+name(parameters): return_type {constraints}"
+
+        Returns:
+          parts: tuple of (access, name, parameters, return_type, constraint_dict),
+                 with parameters as a tuple of (name, type) tuples
+        """
+
+        access, signature, constraints = SyntaxParser.parse_member_signature(method_sig)
+        match = SyntaxParser.METHOD_SIGNATURE.fullmatch(signature)
+        name = match['name'].strip()
+        return_type = match['return_type'].strip() if match['return_type'] is not None else "void"
 
         if name.endswith(")"):
-            lparen = name.find("(")
-            if lparen < 0:
+            match = SyntaxParser.METHOD_NAME.fullmatch(name)
+            if match is None:
                 raise ValueError(f"Malformed method signature: {method_sig}. Missing opening parenthesis")
             else:
-                parameters = [SyntaxParser.parse_parameter_signature(s) for s in name[lparen + 1:-1].split(',') if s.strip()]
-                name = name[:lparen].strip()
-
-                for i in range(len(parameters)):
-                    if not parameters[i]['name']:
-                        parameters[i]['name'] = f"arg{i}"
+                parameters = tuple(
+                    tuple(SyntaxParser.parse_parameter_signature(s).values())
+                    for s in match['parameters'].split(',') if s.strip()
+                )
+                name = match['name'].strip()
         else:
-            parameters = []
+            parameters = ()
 
-        return access, name, parameters, return_type, constraint_dict
+        return access, name, parameters, return_type, SyntaxParser.to_constraint_dict(constraints)
 
-    def convert_to_syntax_tree(self):
+    @staticmethod
+    def parse_method_signature(method_sig):
+        access, name, parameters, return_type, constraints = SyntaxParser.read_method_signature(method_sig)
+        parameters = [
+            {'name': param_name or f"arg{i}", 'type': param_type}
+            for i, (param_name, param_type) in enumerate(parameters)
+        ]
+
+        return access, name, parameters, return_type, dict(constraints)
+
+    def convert_to_syntax_tree(self, syntax_tree=None):
         """
         Convert the style tree to syntax tree
 
+        Cells and relationships that cannot be parsed are reported in diagnostics and skipped,
+        along with the members of a class that could not be parsed.
+
+        Parameters:
+          syntax_tree: optional syntax tree to add the classes and relationships to, a new one by default
+
         Returns:
           syntax_tree: the syntax tree that is used by the generators
         """
 
         print("<<< CONVERTING STYLE TREE TO SYNTAX TREE >>>")
 
-        syntax_tree = {}
+        if syntax_tree is None:
+            syntax_tree = {}
 
         try:
-            get_item = itemgetter('id', 'cells', 'relationships')
-            root_id, cells, relationships = get_item(self.style_tree['root'])
+            if isinstance(self.style_tree, dict):
+                events = self.style_tree['root'].iter_events()
+            else:
+                events = self.style_tree
 
+            root_id = None
             properties_done = False
             child_id = 0
-
-            for key, value in cells.items():
-                parent_id, style = value['parent_id'], value['style']
-
-                # skip the label for relationships
-                if parent_id in relationships.keys() or "endArrow" in style:
-                    continue
-
-                style_type = style['type'].lower()
-
-                if parent_id == root_id and style_type in ('swimlane', 'html', 'text'):
-                    # start of a new cell
-                    syntax_tree[key] = self.tree_template(value)
-                    properties_done = False
-                    child_id = 0
-                elif style_type == 'line' and parent_id in syntax_tree:
-                    # line separating the properties and methods
-                    properties_done = True
-                    child_id = 0
-                elif properties_done:
-                    # methods
-                    syntax_tree[parent_id]['methods'].update(self.methods_template(value, child_id))
-                    child_id += len(value['values'])
-                else:
-                    # properties
-                    syntax_tree[parent_id]['properties'].update(self.properties_template(value, child_id))
-                    child_id += len(value['values'])
-
-            for relationship in relationships.keys():
-                self.add_relationships(syntax_tree, relationships[relationship])
+            failed_class_ids = set()
+
+            for kind, item in events:
+                try:
+                    match kind:  # "label" events, the texts of the relationships, are skipped
+                        case "root":
+                            root_id = item.id
+                        case "cell":
+                            parent_id, style = item.parent_id, item.style
+
+                            # skip the relationships drawn as cells, and the members of the classes in error
+                            if "endArrow" in style or parent_id in failed_class_ids:
+                                continue
+
+                            style_type = style['type'].lower()
+
+                            if parent_id == root_id and style_type in self.CLASS_CELL_TYPES:
+                                # start of a new cell
+                                properties_done = False
+                                child_id = 0
+                                failed_class_ids.add(item.id)  # until it is parsed
+                                syntax_tree[item.id] = self.tree_template(item)
+                                failed_class_ids.discard(item.id)
+                            elif style_type == 'line' and parent_id in syntax_tree:
+                                # line separating the properties and methods
+                                properties_done = True
+                                child_id = 0
+                            elif parent_id not in syntax_tree:
+                                self.diagnostics.report(item.id, "syntax", f"'{style_type}' cell outside of a class")
+                            elif properties_done:
+                                # methods
+                                member_id, child_id = child_id, child_id + len(item.values)
+                                syntax_tree[parent_id]['methods'].update(self.methods_template(item.values,
+                                                                                               member_id))
+                            else:
+                                # properties
+                                member_id, child_id = child_id, child_id + len(item.values)
+                                syntax_tree[parent_id]['properties'].update(self.properties_template(item.values,
+                                                                                                     member_id))
+                        case "edge":
+                            self.add_relationships(syntax_tree, item)
+                except DiagnosticError:
+                    raise
+                except Exception as e:
+                    self.diagnostics.report(item.id, "syntax", e)
+        except DiagnosticError:
+            raise
         except Exception as e:
-            print(f"{self.__class__.__name__}.convert_to_syntax_tree ERROR: {e}")
-            traceback.print_exception(e)
+            self.diagnostics.report(None, "syntax", e)
 
         return syntax_tree
 
+    def convert_to_syntax_model(self):
+        """
+        Convert the style tree to an indexed, read-only syntax tree
+
+        Returns:
+          syntax_model: the SyntaxModel of the syntax tree
+        """
+
+        return SyntaxModel(self.convert_to_syntax_tree())
+
     def tree_template(self, main_cell):
         """
         Create the template that will house each cell
 
         Parameters:
-          main_cell: the starting, parent cell
+          main_cell: the starting, parent Cell
 
         Returns:
           template: the starting template (dictionary)
@@ -205,25 +315,19 @@ class SyntaxParser:
 
         template = {
             'type': "class",
-            'name': main_cell['values'][0] if len(main_cell['values']) > 0 else "",
+            'name': main_cell.values[0] if len(main_cell.values) > 0 else "",
             'stereotype': None,
             'properties': {},
             'methods': {},
-            'relationships': {
-                'implements': [],
-                'extends': [],
-                'association': [],
-                'aggregation': [],
-                'composition': [],
-            }
+            'relationships': self.relationships_template()
         }
 
-        if main_cell['style']['type'] in ("html", "text"):
-            main_cell_values = main_cell['values']
+        if main_cell.style['type'] in ("html", "text"):
+            main_cell_values = main_cell.values
             value_count = len(main_cell_values)
             name = main_cell_values[0] if value_count > 0 else ""
-            properties = {'values': main_cell_values[1] if value_count > 1 else None}
-            methods = {'values': main_cell_values[2] if value_count > 2 else None}
+            properties = main_cell_values[1] if value_count > 1 else None
+            methods = main_cell_values[2] if value_count > 2 else None
 
             template['name'] = name[0]
             template['properties'] = self.properties_template(properties, 0) or {}
@@ -241,24 +345,40 @@ class SyntaxParser:
                 template['type'] = "abstract class"
             case _:
                 template['stereotype'] = stereotype
-                if main_cell['style'].get('fontStyle') == "2":  # itallic
+                if main_cell.style.get('fontStyle') == "2":  # itallic
                     template['type'] = "abstract class"
 
         return template
 
-    def properties_template(self, property_dict, property_id):
+    @staticmethod
+    def relationships_template():
+        """
+        Create the template for the relationships of a cell
+
+        Returns:
+          template: the relationships template (dictionary)
+        """
+
+        return {
+            'implements': [],
+            'extends': [],
+            'association': [],
+            'aggregation': [],
+            'composition': [],
+        }
+
+    def properties_template(self, values, property_id):
         """
         Create the template for properties
 
         Parameters:
-          property_dict: the properties dictionary from the style tree
+          values: the property values of a cell from the style tree
           property_id: id for the keys in the dictionary
 
         Returns:
           template: the properties template (dictionary)
         """
 
-        values = property_dict['values']
         template = {}
 
         if values:
@@ -277,19 +397,18 @@ class SyntaxParser:
 
         return template
 
-    def methods_template(self, method_dict, method_id):
+    def methods_template(self, values, method_id):
         """
         Create the template for methods
 
         Parameters:
-          method_dict: the methods dictionary from the style tree
+          values: the method values of a cell from the style tree
           method_id: id for the keys in the dictionary
 
         Returns:
           template: the methods template (dictionary)
         """
 
-        values = method_dict['values']
         template = {}
 
         if values:
@@ -321,67 +440,165 @@ class SyntaxParser:
 
         return self.ACCESS_MODIFIER_MAPPINGS.get(symbol, 'private')
 
+    @staticmethod
+    def read_relationship_rule(rule):
+        """
+        Read the key of a relationship rule written as a tuple, a "startArrow|endArrow|startFill|endFill|dashed"
+        string or a dictionary of these names, as found in JSON options
+
+        Empty values, "*" and missing names match any value, the fills and dashed are read from booleans, 1/0 or
+        true/false.
+
+        Parameters:
+          rule: the key of the rule
+
+        Returns:
+          rule: tuple of (startArrow, endArrow, startFill, endFill, dashed)
+        """
+
+        match rule:
+            case str():
+                values = rule.split("|")
+            case dict():
+                values = [rule.get(name) for name in ("startArrow", "endArrow", "startFill", "endFill", "dashed")]
+            case _:
+                values = list(rule)
+
+        if len(values) != 5:
+            raise ValueError(f"Relationship rule: {rule}. Expected (startArrow, endArrow, startFill, endFill, dashed)")
+
+        values = [None if value in ("", "*") else value for value in values]
+
+        for i in range(2, 5):
+            match str(values[i]).lower():
+                case "none":
+                    values[i] = None
+                case "true" | "1":
+                    values[i] = True
+                case "false" | "0":
+                    values[i] = False
+                case _:
+                    raise ValueError(f"Relationship rule: {rule}. Expected a boolean, not {values[i]}")
+
+        start_arrow, end_arrow, *flags = values
+
+        return (start_arrow and str(start_arrow).lower(), end_arrow and str(end_arrow).lower(), *flags)
+
+    @staticmethod
+    def compile_relationship_rules(relationship_rules):
+        """
+        Merge extra relationship rules into the default ones
+
+        Parameters:
+          relationship_rules: optional extra rules, overriding the default rules with the same key, either as
+                              a dictionary mapping the keys of the rules (see read_relationship_rule) to a kind of
+                              relationship, or as a list of dictionaries of the key names and of a "kind"
+
+        Returns:
+          rules: the dictionary of the default and extra rules
+        """
+
+        rules = dict(SyntaxParser.RELATIONSHIP_RULES)
+
+        if isinstance(relationship_rules, list):
+            relationship_rules = [(rule, rule.get("kind")) for rule in relationship_rules]
+        else:
+            relationship_rules = (relationship_rules or {}).items()
+
+        for rule, kind in relationship_rules:
+            if kind not in SyntaxParser.RELATIONSHIP_KINDS:
+                raise ValueError(f"Relationship rule: {rule}. Unknown kind of relationship: {kind}")
+
+            rules[SyntaxParser.read_relationship_rule(rule)] = kind
+
+        return rules
+
+    @staticmethod
+    def relationship_key(style):
+        """
+        Read the values the relationships are classified on
+
+        draw.io leaves the start arrow out of the style when the line has none, so it reads as "none",
+        while a missing end arrow reads as "classic", the end arrow of draw.io's default edge style.
+
+        Parameters:
+          style: the style of the relationship
+
+        Returns:
+          key: tuple of (startArrow, endArrow, startFill, endFill, dashed)
+        """
+
+        return (
+            (style.get("startArrow") or "none").lower(),
+            (style.get("endArrow") or "classic").lower(),
+            style.get("startFill") == "1",
+            style.get("endFill") == "1",
+            style.get("dashed") == "1"
+        )
+
+    def classify_relationship(self, key):
+        """
+        Find the kind of relationship a line draws
+
+        Each key is only matched against the rules once, the result is then looked up.
+
+        Parameters:
+          key: tuple of (startArrow, endArrow, startFill, endFill, dashed), see relationship_key
+
+        Returns:
+          kind: the kind of relationship, None if no rule matches
+        """
+
+        try:
+            return self.relationship_kinds[key]
+        except KeyError:
+            pass
+
+        kind = None
+
+        for mask in self.rule_masks:
+            rule = tuple(value if is_set else None for value, is_set in zip(key, mask))
+            if rule in self.relationship_rules:
+                kind = self.relationship_rules[rule]
+                break
+
+        self.relationship_kinds[key] = kind
+
+        return kind
+
     def add_relationships(self, syntax_tree, relationship):
         """
         Add the relationship for the cells in the syntax tree
 
+        Relationships with a cell that is not a class, or whose line matches no rule, are reported in diagnostics.
+
         Parameters:
           syntax_tree: the syntax_tree dictionary
-          relationship: relationship to be added to the syntax tree
+          relationship: Edge to be added to the syntax tree
         """
 
-        get_item = itemgetter('source', 'target', 'style')
-        source, target, style = get_item(relationship)
-
-        source_cell = syntax_tree[source]
-        source_relations = source_cell['relationships']
-
-        target_cell = syntax_tree[target]
-        target_relations = target_cell['relationships']
-
-        start_arrow_style = style.get("startArrow", "").lower()
-        end_arrow_style = style.get("endArrow", "").lower()
-        start_arrow_filled = style.get("startFill") == "1"
-        end_arrow_filled = style.get("endFill") == "1"
-        dashed_line = style.get("dashed") == "1"
-
-        match end_arrow_style:
-            case "none":
-                # association
-                source_relations['association'].append(('to', target))
-                target_relations['association'].append(('from', source))
-            case "block":
-                if end_arrow_filled:
-                    # association
-                    source_relations['association'].append(('to', target))
-                    target_relations['association'].append(('from', source))
-                elif dashed_line:
-                    # implements
-                    source_relations['implements'].append(target)
-                else:
-                    # extends
-                    source_relations['extends'].append(target)
-            case "diamondthin":
-                if end_arrow_filled:
-                    # composition
-                    source_relations['composition'].append(('to', target))
-                    target_relations['composition'].append(('from', source))
-                else:
-                    # aggregation
-                    source_relations['aggregation'].append(('to', target))
-                    target_relations['aggregation'].append(('from', source))
-            case "open":
-                match start_arrow_style:
-                    case "none":
-                        # association
-                        source_relations['association'].append(('to', target))
-                        target_relations['association'].append(('from', source))
-                    case "diamondthin":
-                        if start_arrow_filled:
-                            # composition
-                            source_relations['composition'].append(('to', target))
-                            target_relations['composition'].append(('from', source))
-                        else:
-                            # aggregation
-                            source_relations['aggregation'].append(('to', target))
-                            target_relations['aggregation'].append(('from', source))
+        source, target = relationship.source, relationship.target
+
+        if source is None or target is None:  # dangling relationship, already reported by the style parser
+            return
+
+        if source not in syntax_tree or target not in syntax_tree:
+            endpoint = source if source not in syntax_tree else target
+            self.diagnostics.report(relationship.id, "syntax", f"relationship with '{endpoint}', which is not a class")
+            return
+
+        source_relations = syntax_tree[source]['relationships']
+        target_relations = syntax_tree[target]['relationships']
+
+        key = self.relationship_key(relationship.style)
+        kind = self.classify_relationship(key)
+
+        match kind:
+            case None:
+                self.diagnostics.report(relationship.id, "syntax", "unclassified relationship, no rule for "
+                                        f"(startArrow, endArrow, startFill, endFill, dashed) = {key}")
+            case "implements" | "extends":
+                source_relations[kind].append(target)
+            case _:
+                source_relations[kind].append(('to', target))
+                target_relations[kind].append(('from', source))
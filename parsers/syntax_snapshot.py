@@ -0,0 +1,121 @@
+import pickle
+
+from hashlib import sha256
+from os import path, makedirs, replace, getpid
+
+from parsers.syntax_parser import SyntaxParser
+
+
+class SyntaxSnapshot:
+    """
+    Binary snapshot of the syntax tree of a diagram, to reload it without decoding and parsing the diagram again
+
+    A snapshot is a pickle (protocol 5) of a small header, holding the schema version, a hash of the diagram
+    and of the relationship rules it was parsed with and a hash of the payload, followed by the payload, a pickle
+    of the syntax tree. A snapshot whose header does not match is ignored, so a changed diagram or an older version
+    of the syntax tree is parsed again, and the payload is only unpickled once its hash is checked, so a truncated
+    or corrupted snapshot is parsed again too. Snapshots are plain pickles and must only be loaded from trusted
+    directories.
+
+    Parameters:
+      snapshot_dir: directory where the snapshots are stored, named after the hash of the diagram,
+                    the snapshot is stored next to the diagram if omitted
+    """
+
+    SCHEMA_VERSION = 2
+    EXTENSION = ".syntax.pkl"
+    PICKLE_PROTOCOL = 5
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, snapshot_dir=None):
+        self.snapshot_dir = snapshot_dir
+
+    @staticmethod
+    def source_hash(drawio_filepath, relationship_rules=None):
+        """
+        Hash a diagram file along with the options that change its syntax tree
+
+        Parameters:
+          drawio_filepath: file path to the diagram
+          relationship_rules: optional extra rules to classify the relationships
+
+        Returns:
+          source_hash: hexadecimal sha256 digest
+        """
+
+        digest = sha256()
+
+        with open(drawio_filepath, "rb") as f:
+            while chunk := f.read(SyntaxSnapshot.CHUNK_SIZE):
+                digest.update(chunk)
+
+        rules = sorted(SyntaxParser.compile_relationship_rules(relationship_rules).items(), key=repr)
+        digest.update(repr(rules).encode('utf8'))
+
+        return digest.hexdigest()
+
+    def snapshot_path(self, drawio_filepath, source_hash):
+        if self.snapshot_dir is None:
+            return f"{drawio_filepath}{self.EXTENSION}"
+        else:
+            return path.join(self.snapshot_dir, f"{source_hash}{self.EXTENSION}")
+
+    def load(self, drawio_filepath, relationship_rules=None):
+        """
+        Load the syntax tree of a diagram from its snapshot
+
+        Parameters:
+          drawio_filepath: file path to the diagram
+          relationship_rules: optional extra rules the syntax tree must have been parsed with
+
+        Returns:
+          syntax_tree: the syntax tree, None if there is no snapshot, if it is out of date or if it is corrupted
+        """
+
+        source_hash = self.source_hash(drawio_filepath, relationship_rules)
+
+        # unpickling a corrupted file raises about any exception, so the payload is only unpickled once its hash
+        # is checked, and any exception is still taken for a missing snapshot
+        try:
+            with open(self.snapshot_path(drawio_filepath, source_hash), "rb") as f:
+                header = pickle.load(f)
+                payload = f.read()
+
+            if header != {'schema_version': self.SCHEMA_VERSION, 'source_hash': source_hash,
+                          'payload_hash': sha256(payload).hexdigest()}:
+                return None
+
+            return pickle.loads(payload)
+        except Exception:  # missing or corrupted snapshot
+            return None
+
+    def save(self, drawio_filepath, syntax_tree, relationship_rules=None):
+        """
+        Store the syntax tree of a diagram
+
+        Parameters:
+          drawio_filepath: file path to the diagram
+          syntax_tree: the syntax tree of the diagram, either as a dictionary or as a SyntaxModel
+          relationship_rules: optional extra rules the syntax tree was parsed with
+
+        Returns:
+          snapshot_path: the file path of the snapshot
+        """
+
+        source_hash = self.source_hash(drawio_filepath, relationship_rules)
+        payload = pickle.dumps(dict(syntax_tree), self.PICKLE_PROTOCOL)
+        header = {'schema_version': self.SCHEMA_VERSION, 'source_hash': source_hash,
+                  'payload_hash': sha256(payload).hexdigest()}
+
+        if self.snapshot_dir is not None:
+            makedirs(self.snapshot_dir, exist_ok=True)
+
+        # write to a temporary file first, so concurrent readers never see a partial snapshot
+        snapshot_path = self.snapshot_path(drawio_filepath, source_hash)
+        temp_path = f"{snapshot_path}.{getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump(header, f, self.PICKLE_PROTOCOL)
+            f.write(payload)
+        replace(temp_path, snapshot_path)
+
+        return snapshot_path
@@ -0,0 +1,84 @@
+#pragma once
+
+#include <array>
+#include <ctime>
+#include <string>
+#include <vector>
+#include "Customer.hpp"
+
+using std::array;
+using std::string;
+using std::vector;
+using std::wstring;
+
+namespace com { namespace example
+{
+	class Account
+	{
+		private: int id;
+		private: string number;
+		private: time_t createdAt;
+		private: bool locked{false};
+		private: vector<Customer> customers;
+
+		public: Account()
+		{
+		}
+
+		public: Account(int id, const string& number, time_t createdAt, bool locked):
+			id{id}, number{number}, createdAt{createdAt}, locked{locked}
+		{
+		}
+
+		public: int GetId() const
+		{
+			return id;
+		}
+
+		public: void SetId(int id)
+		{
+			this->id = id;
+		}
+
+		public: string GetNumber() const
+		{
+			return number;
+		}
+
+		public: void SetNumber(const string& number)
+		{
+			this->number = number;
+		}
+
+		public: time_t GetCreatedAt() const
+		{
+			return createdAt;
+		}
+
+		public: void SetCreatedAt(time_t createdAt)
+		{
+			this->createdAt = createdAt;
+		}
+
+		public: bool IsLocked() const
+		{
+			return locked;
+		}
+
+		public: void SetLocked(bool locked)
+		{
+			this->locked = locked;
+		}
+
+		public: vector<Customer> GetCustomers()
+		{
+			return customers;
+		}
+
+		public: void SetCustomers(const vector<Customer>& customers)
+		{
+			this->customers = customers;
+		}
+
+	};
+}}
\ No newline at end of file
@@ -0,0 +1,96 @@
+#pragma once
+
+#include <array>
+#include <ctime>
+#include <string>
+#include <vector>
+#include "Customer.hpp"
+#include "Teller.hpp"
+
+using std::array;
+using std::string;
+using std::vector;
+using std::wstring;
+
+namespace com { namespace example
+{
+	class Bank
+	{
+		private: array<char, 16> bankId;
+		private: string name;
+		private: string address;
+		private: string website;
+		private: vector<Teller> tellers;
+		private: vector<Customer> customers;
+
+		public: Bank()
+		{
+		}
+
+		public: Bank(const array<char, 16>& bankId, const string& name, const string& address, const string& website):
+			bankId{bankId}, name{name}, address{address}, website{website}
+		{
+		}
+
+		public: array<char, 16> GetBankId() const
+		{
+			return bankId;
+		}
+
+		public: void SetBankId(const array<char, 16>& bankId)
+		{
+			this->bankId = bankId;
+		}
+
+		public: string GetName() const
+		{
+			return name;
+		}
+
+		public: void SetName(const string& name)
+		{
+			this->name = name;
+		}
+
+		public: string GetAddress() const
+		{
+			return address;
+		}
+
+		public: void SetAddress(const string& address)
+		{
+			this->address = address;
+		}
+
+		public: string GetWebsite() const
+		{
+			return website;
+		}
+
+		public: void SetWebsite(const string& website)
+		{
+			this->website = website;
+		}
+
+		public: vector<Teller> GetTellers()
+		{
+			return tellers;
+		}
+
+		public: void SetTellers(const vector<Teller>& tellers)
+		{
+			this->tellers = tellers;
+		}
+
+		public: vector<Customer> GetCustomers()
+		{
+			return customers;
+		}
+
+		public: void SetCustomers(const vector<Customer>& customers)
+		{
+			this->customers = customers;
+		}
+
+	};
+}}
\ No newline at end of file
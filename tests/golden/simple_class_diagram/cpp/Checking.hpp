@@ -0,0 +1,51 @@
+#pragma once
+
+#include <array>
+#include <ctime>
+#include <string>
+#include <vector>
+#include "Account.hpp"
+
+using std::array;
+using std::string;
+using std::vector;
+using std::wstring;
+
+namespace com { namespace example
+{
+	class Checking : public Account
+	{
+		private: double interestCost;
+		private: string cardNumber;
+
+		public: Checking(): Account{}
+		{
+		}
+
+		public: Checking(int id, const string& number, time_t createdAt, bool locked, double interestCost, const string& cardNumber):
+			Account{id, number, createdAt, locked}, interestCost{interestCost}, cardNumber{cardNumber}
+		{
+		}
+
+		public: double GetInterestCost() const
+		{
+			return interestCost;
+		}
+
+		public: void SetInterestCost(double interestCost)
+		{
+			this->interestCost = interestCost;
+		}
+
+		public: string GetCardNumber() const
+		{
+			return cardNumber;
+		}
+
+		public: void SetCardNumber(const string& cardNumber)
+		{
+			this->cardNumber = cardNumber;
+		}
+
+	};
+}}
\ No newline at end of file
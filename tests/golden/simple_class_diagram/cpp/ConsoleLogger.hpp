@@ -0,0 +1,44 @@
+#pragma once
+
+#include <array>
+#include <ctime>
+#include <string>
+#include <vector>
+#include "Logger.hpp"
+
+using std::array;
+using std::string;
+using std::vector;
+using std::wstring;
+
+namespace com { namespace example
+{
+	class ConsoleLogger : public virtual Logger
+	{
+
+		public: ConsoleLogger()
+		{
+		}
+
+		public: void debug(const string& arg0) override
+		{
+			// Todo: implement this method!
+		}
+
+		public: void info(const string& arg0) override
+		{
+			// Todo: implement this method!
+		}
+
+		public: void warning(const string& arg0) override
+		{
+			// Todo: implement this method!
+		}
+
+		public: void error(const string& arg0) override
+		{
+			// Todo: implement this method!
+		}
+
+	};
+}}
\ No newline at end of file
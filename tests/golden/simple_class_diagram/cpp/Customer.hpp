@@ -0,0 +1,117 @@
+#pragma once
+
+#include <array>
+#include <ctime>
+#include <string>
+#include <vector>
+#include "Account.hpp"
+#include "Bank.hpp"
+#include "Person.hpp"
+
+using std::array;
+using std::string;
+using std::vector;
+using std::wstring;
+
+namespace com { namespace example
+{
+	class Customer : public Person
+	{
+		private: string address;
+		private: string phoneNum;
+		private: Account account;
+		private: Bank bank;
+
+		public: Customer(): Person{}
+		{
+		}
+
+		public: Customer(int id, const string& name, Gender gender, time_t birthDate, const string& address, const string& phoneNum):
+			Person{id, name, gender, birthDate}, address{address}, phoneNum{phoneNum}
+		{
+		}
+
+		public: string GetAddress() const
+		{
+			return address;
+		}
+
+		public: void SetAddress(const string& address)
+		{
+			this->address = address;
+		}
+
+		public: string GetPhoneNum() const
+		{
+			return phoneNum;
+		}
+
+		public: void SetPhoneNum(const string& phoneNum)
+		{
+			this->phoneNum = phoneNum;
+		}
+
+		public: Account GetAccount()
+		{
+			return account;
+		}
+
+		public: void SetAccount(Account account)
+		{
+			this->account = account;
+		}
+
+		public: Bank GetBank()
+		{
+			return bank;
+		}
+
+		public: void SetBank(Bank bank)
+		{
+			this->bank = bank;
+		}
+
+		public: bool generalInquiry()
+		{
+			// Todo: implement this method!
+			return false;
+		}
+
+		public: bool depositMoney()
+		{
+			// Todo: implement this method!
+			return false;
+		}
+
+		public: bool withdrawMoney()
+		{
+			// Todo: implement this method!
+			return false;
+		}
+
+		public: Account openAccount()
+		{
+			// Todo: implement this method!
+			return Account();
+		}
+
+		public: Account closeAccount()
+		{
+			// Todo: implement this method!
+			return Account();
+		}
+
+		public: bool applyForLoan()
+		{
+			// Todo: implement this method!
+			return false;
+		}
+
+		public: bool requestCard()
+		{
+			// Todo: implement this method!
+			return false;
+		}
+
+	};
+}}
\ No newline at end of file
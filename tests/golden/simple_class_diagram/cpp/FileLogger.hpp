@@ -0,0 +1,71 @@
+#pragma once
+
+#include <array>
+#include <ctime>
+#include <string>
+#include <vector>
+#include "Logger.hpp"
+
+using std::array;
+using std::string;
+using std::vector;
+using std::wstring;
+
+namespace com { namespace example
+{
+	class FileLogger : public virtual Logger
+	{
+		private: string filePath;
+
+		public: FileLogger()
+		{
+		}
+
+		public: FileLogger(const string& filePath):
+			filePath{filePath}
+		{
+		}
+
+		public: string GetFilePath() const
+		{
+			return filePath;
+		}
+
+		public: void SetFilePath(const string& filePath)
+		{
+			this->filePath = filePath;
+		}
+
+		public: const void rotateFile()
+		{
+			// Todo: implement this method!
+		}
+
+		public: static String[] getRotationHistory()
+		{
+			// Todo: implement this method!
+			return {};
+		}
+
+		public: void debug(const string& arg0) override
+		{
+			// Todo: implement this method!
+		}
+
+		public: void info(const string& arg0) override
+		{
+			// Todo: implement this method!
+		}
+
+		public: void warning(const string& arg0) override
+		{
+			// Todo: implement this method!
+		}
+
+		public: void error(const string& arg0) override
+		{
+			// Todo: implement this method!
+		}
+
+	};
+}}
\ No newline at end of file
@@ -0,0 +1,10 @@
+#pragma once
+
+namespace com { namespace example
+{
+	enum class Gender
+	{
+		MALE,
+		FEMALE
+	};
+}}
\ No newline at end of file
@@ -0,0 +1,27 @@
+#pragma once
+
+#include <array>
+#include <ctime>
+#include <string>
+#include <vector>
+
+using std::array;
+using std::string;
+using std::vector;
+using std::wstring;
+
+namespace com { namespace example
+{
+	class Logger
+	{
+
+		public: virtual void debug(const string& arg0) = 0;
+
+		public: virtual void info(const string& arg0) = 0;
+
+		public: virtual void warning(const string& arg0) = 0;
+
+		public: virtual void error(const string& arg0) = 0;
+
+	};
+}}
\ No newline at end of file
@@ -0,0 +1,78 @@
+#pragma once
+
+#include <array>
+#include <ctime>
+#include <string>
+#include <vector>
+#include "Account.hpp"
+#include "Gender.hpp"
+
+using std::array;
+using std::string;
+using std::vector;
+using std::wstring;
+
+namespace com { namespace example
+{
+	class Person
+	{
+		private: int id;
+		private: string name;
+		private: Gender gender;
+		private: time_t birthDate;
+
+		public: Person()
+		{
+		}
+
+		public: Person(int id, const string& name, Gender gender, time_t birthDate):
+			id{id}, name{name}, gender{gender}, birthDate{birthDate}
+		{
+		}
+
+		public: int GetId() const
+		{
+			return id;
+		}
+
+		public: void SetId(int id)
+		{
+			this->id = id;
+		}
+
+		public: string GetName() const
+		{
+			return name;
+		}
+
+		public: void SetName(const string& name)
+		{
+			this->name = name;
+		}
+
+		public: Gender GetGender() const
+		{
+			return gender;
+		}
+
+		public: void SetGender(Gender gender)
+		{
+			this->gender = gender;
+		}
+
+		public: time_t GetBirthDate() const
+		{
+			return birthDate;
+		}
+
+		public: void SetBirthDate(time_t birthDate)
+		{
+			this->birthDate = birthDate;
+		}
+
+		public: virtual Account openAccount() = 0;
+
+		public: virtual Account closeAccount() = 0;
+
+	};
+}}
\ No newline at end of file
@@ -0,0 +1,43 @@
+#pragma once
+
+#include <array>
+#include <ctime>
+#include <string>
+#include <vector>
+#include "Account.hpp"
+
+using std::array;
+using std::string;
+using std::vector;
+using std::wstring;
+
+namespace com { namespace example
+{
+	class Savings : public Account
+	{
+		public: static const double MIN_INTEREST;
+		private: double interestPay;
+
+		public: Savings(): Account{}
+		{
+		}
+
+		public: Savings(int id, const string& number, time_t createdAt, bool locked, double interestPay):
+			Account{id, number, createdAt, locked}, interestPay{interestPay}
+		{
+		}
+
+		public: double GetInterestPay() const
+		{
+			return interestPay;
+		}
+
+		public: void SetInterestPay(double interestPay)
+		{
+			this->interestPay = interestPay;
+		}
+
+	};
+
+	const double Savings::MIN_INTEREST{.33};
+}}
\ No newline at end of file
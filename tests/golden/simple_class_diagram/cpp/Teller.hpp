@@ -0,0 +1,77 @@
+#pragma once
+
+#include <array>
+#include <ctime>
+#include <string>
+#include <vector>
+#include "Account.hpp"
+#include "Bank.hpp"
+#include "Person.hpp"
+
+using std::array;
+using std::string;
+using std::vector;
+using std::wstring;
+
+namespace com { namespace example
+{
+	class Teller : public Person
+	{
+		private: Bank bank;
+
+		public: Teller(): Person{}
+		{
+		}
+
+		public: Teller(int id, const string& name, Gender gender, time_t birthDate):
+			Person{id, name, gender, birthDate}
+		{
+		}
+
+		public: Bank GetBank()
+		{
+			return bank;
+		}
+
+		public: void SetBank(Bank bank)
+		{
+			this->bank = bank;
+		}
+
+		public: bool collectMoney()
+		{
+			// Todo: implement this method!
+			return false;
+		}
+
+		public: Account openAccount()
+		{
+			// Todo: implement this method!
+			return Account();
+		}
+
+		public: Account closeAccount()
+		{
+			// Todo: implement this method!
+			return Account();
+		}
+
+		public: bool loanRequest()
+		{
+			// Todo: implement this method!
+			return false;
+		}
+
+		public: void provideInfo()
+		{
+			// Todo: implement this method!
+		}
+
+		public: bool issueCard()
+		{
+			// Todo: implement this method!
+			return false;
+		}
+
+	};
+}}
\ No newline at end of file
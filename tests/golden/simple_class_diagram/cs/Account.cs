@@ -0,0 +1,78 @@
+using System;
+using System.Collections.Generic;
+using System.ComponentModel.DataAnnotations;
+using System.ComponentModel.DataAnnotations.Schema;
+using System.Numerics;
+
+namespace com.example;
+
+public class Account
+{
+	private int id;
+	private string number;
+	private DateTime createdAt;
+	private bool locked = false;
+
+	public Account()
+	{
+	}
+
+	public Account(int id, string number, DateTime createdAt, bool locked)
+	{
+		this.id = id;
+		this.number = number;
+		this.createdAt = createdAt;
+		this.locked = locked;
+	}
+
+	[Key]
+	[DatabaseGenerated(DatabaseGeneratedOption.Identity)]
+	public int Id
+	{
+		get => id;
+		set => id = value;
+	}
+
+	[Required]
+	public string Number
+	{
+		get => number;
+		set => number = value;
+	}
+
+	[DatabaseGenerated(DatabaseGeneratedOption.Computed)]
+	[DataType(DataType.DateTime)]
+	public DateTime CreatedAt
+	{
+		get => createdAt;
+		set => createdAt = value;
+	}
+
+	public bool Locked
+	{
+		get => locked;
+		set => locked = value;
+	}
+
+	[InverseProperty(nameof(Customer.Account))]
+	public virtual ICollection<Customer> Customers { get; set; } = new HashSet<Customer>()
+
+	public override bool Equals(Object obj)
+	{
+		if (ReferenceEquals(this, obj)) return true;
+		if (obj is Account other) {
+			return Equals(id, other.id) && Equals(number, other.number) && Equals(createdAt, other.createdAt) && Equals(locked, other.locked);
+		}
+		return false;
+	}
+
+	public override int GetHashCode()
+	{
+		return HashCode.Combine(id, number, createdAt, locked);
+	}
+
+	public override string ToString() {
+		return $"Account {{id={id}, number={number}, createdAt={createdAt}, locked={locked}}}";
+	}
+
+}
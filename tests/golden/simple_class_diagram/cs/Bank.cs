@@ -0,0 +1,79 @@
+using System;
+using System.Collections.Generic;
+using System.ComponentModel.DataAnnotations;
+using System.ComponentModel.DataAnnotations.Schema;
+using System.Numerics;
+
+namespace com.example;
+
+public class Bank
+{
+	private Guid bankId;
+	private string name;
+	private string address;
+	private string website;
+
+	public Bank()
+	{
+	}
+
+	public Bank(Guid bankId, string name, string address, string website)
+	{
+		this.bankId = bankId;
+		this.name = name;
+		this.address = address;
+		this.website = website;
+	}
+
+	[Key]
+	public Guid BankId
+	{
+		get => bankId;
+		set => bankId = value;
+	}
+
+	[Required]
+	public string Name
+	{
+		get => name;
+		set => name = value;
+	}
+
+	public string Address
+	{
+		get => address;
+		set => address = value;
+	}
+
+	[DataType(DataType.Url)]
+	public string Website
+	{
+		get => website;
+		set => website = value;
+	}
+
+	[InverseProperty(nameof(Teller.Bank))]
+	public virtual ICollection<Teller> Tellers { get; set; } = new HashSet<Teller>()
+
+	[InverseProperty(nameof(Customer.Bank))]
+	public virtual ICollection<Customer> Customers { get; set; } = new HashSet<Customer>()
+
+	public override bool Equals(Object obj)
+	{
+		if (ReferenceEquals(this, obj)) return true;
+		if (obj is Bank other) {
+			return Equals(bankId, other.bankId) && Equals(name, other.name) && Equals(address, other.address) && Equals(website, other.website);
+		}
+		return false;
+	}
+
+	public override int GetHashCode()
+	{
+		return HashCode.Combine(bankId, name, address, website);
+	}
+
+	public override string ToString() {
+		return $"Bank {{bankId={bankId}, name={name}, address={address}, website={website}}}";
+	}
+
+}
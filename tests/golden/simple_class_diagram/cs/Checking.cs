@@ -0,0 +1,56 @@
+using System;
+using System.Collections.Generic;
+using System.ComponentModel.DataAnnotations;
+using System.ComponentModel.DataAnnotations.Schema;
+using System.Numerics;
+
+namespace com.example;
+
+public class Checking : Account
+{
+	private double interestCost;
+	private string cardNumber;
+
+	public Checking(): base()
+	{
+	}
+
+	public Checking(int id, string number, DateTime createdAt, bool locked, double interestCost, string cardNumber):
+		base(id, number, createdAt, locked)
+	{
+		this.interestCost = interestCost;
+		this.cardNumber = cardNumber;
+	}
+
+	public double InterestCost
+	{
+		get => interestCost;
+		set => interestCost = value;
+	}
+
+	[DataType(DataType.CreditCard)]
+	public string CardNumber
+	{
+		get => cardNumber;
+		set => cardNumber = value;
+	}
+
+	public override bool Equals(Object obj)
+	{
+		if (ReferenceEquals(this, obj)) return true;
+		if (obj is Checking other) {
+			return base.Equals(other) && Equals(interestCost, other.interestCost) && Equals(cardNumber, other.cardNumber);
+		}
+		return false;
+	}
+
+	public override int GetHashCode()
+	{
+		return HashCode.Combine(base.GetHashCode(), interestCost, cardNumber);
+	}
+
+	public override string ToString() {
+		return $"Checking {{{base.ToString()}, interestCost={interestCost}, cardNumber={cardNumber}}}";
+	}
+
+}
@@ -0,0 +1,36 @@
+using System;
+using System.Collections.Generic;
+using System.ComponentModel.DataAnnotations;
+using System.ComponentModel.DataAnnotations.Schema;
+using System.Numerics;
+
+namespace com.example;
+
+public class ConsoleLogger : Logger
+{
+
+	public ConsoleLogger()
+	{
+	}
+
+	public void debug(string arg0)
+	{
+		// Todo: implement this method!
+	}
+
+	public void info(string arg0)
+	{
+		// Todo: implement this method!
+	}
+
+	public void warning(string arg0)
+	{
+		// Todo: implement this method!
+	}
+
+	public void error(string arg0)
+	{
+		// Todo: implement this method!
+	}
+
+}
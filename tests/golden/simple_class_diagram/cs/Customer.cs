@@ -0,0 +1,108 @@
+using System;
+using System.Collections.Generic;
+using System.ComponentModel.DataAnnotations;
+using System.ComponentModel.DataAnnotations.Schema;
+using System.Numerics;
+
+namespace com.example;
+
+public class Customer : Person
+{
+	private string address;
+	private string phoneNum;
+
+	public Customer(): base()
+	{
+	}
+
+	public Customer(int id, string name, Gender gender, DateTime birthDate, string address, string phoneNum):
+		base(id, name, gender, birthDate)
+	{
+		this.address = address;
+		this.phoneNum = phoneNum;
+	}
+
+	public string Address
+	{
+		get => address;
+		set => address = value;
+	}
+
+	[DataType(DataType.PhoneNumber)]
+	public string PhoneNum
+	{
+		get => phoneNum;
+		set => phoneNum = value;
+	}
+
+	public int Accountid { get; set; }
+
+	[ForeignKey(nameof(Accountid))]
+	public virtual Account Account { get; set; }
+
+	public Guid bankId { get; set; }
+
+	[ForeignKey(nameof(bankId))]
+	public virtual Bank Bank { get; set; }
+
+	public override bool Equals(Object obj)
+	{
+		if (ReferenceEquals(this, obj)) return true;
+		if (obj is Customer other) {
+			return base.Equals(other) && Equals(address, other.address) && Equals(phoneNum, other.phoneNum);
+		}
+		return false;
+	}
+
+	public override int GetHashCode()
+	{
+		return HashCode.Combine(base.GetHashCode(), address, phoneNum);
+	}
+
+	public override string ToString() {
+		return $"Customer {{{base.ToString()}, address={address}, phoneNum={phoneNum}}}";
+	}
+
+	public bool generalInquiry()
+	{
+		// Todo: implement this method!
+		return default(bool);
+	}
+
+	public bool depositMoney()
+	{
+		// Todo: implement this method!
+		return default(bool);
+	}
+
+	public bool withdrawMoney()
+	{
+		// Todo: implement this method!
+		return default(bool);
+	}
+
+	public Account openAccount()
+	{
+		// Todo: implement this method!
+		return default(Account);
+	}
+
+	public Account closeAccount()
+	{
+		// Todo: implement this method!
+		return default(Account);
+	}
+
+	public bool applyForLoan()
+	{
+		// Todo: implement this method!
+		return default(bool);
+	}
+
+	public bool requestCard()
+	{
+		// Todo: implement this method!
+		return default(bool);
+	}
+
+}
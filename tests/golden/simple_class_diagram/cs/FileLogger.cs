@@ -0,0 +1,77 @@
+using System;
+using System.Collections.Generic;
+using System.ComponentModel.DataAnnotations;
+using System.ComponentModel.DataAnnotations.Schema;
+using System.Numerics;
+
+namespace com.example;
+
+public class FileLogger : Logger
+{
+	private string filePath;
+
+	public FileLogger()
+	{
+	}
+
+	public FileLogger(string filePath)
+	{
+		this.filePath = filePath;
+	}
+
+	public string FilePath
+	{
+		get => filePath;
+		set => filePath = value;
+	}
+
+	public override bool Equals(Object obj)
+	{
+		if (ReferenceEquals(this, obj)) return true;
+		if (obj is FileLogger other) {
+			return Equals(filePath, other.filePath);
+		}
+		return false;
+	}
+
+	public override int GetHashCode()
+	{
+		return HashCode.Combine(filePath);
+	}
+
+	public override string ToString() {
+		return $"FileLogger {{filePath={filePath}}}";
+	}
+
+	public void rotateFile()
+	{
+		// Todo: implement this method!
+	}
+
+	public static String[] getRotationHistory()
+	{
+		// Todo: implement this method!
+		return default(String[]);
+	}
+
+	public void debug(string arg0)
+	{
+		// Todo: implement this method!
+	}
+
+	public void info(string arg0)
+	{
+		// Todo: implement this method!
+	}
+
+	public void warning(string arg0)
+	{
+		// Todo: implement this method!
+	}
+
+	public void error(string arg0)
+	{
+		// Todo: implement this method!
+	}
+
+}
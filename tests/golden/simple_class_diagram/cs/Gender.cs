@@ -0,0 +1,7 @@
+namespace com.example;
+
+public enum Gender
+{
+	MALE,
+	FEMALE
+}
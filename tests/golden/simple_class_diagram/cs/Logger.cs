@@ -0,0 +1,18 @@
+using System;
+using System.Collections.Generic;
+using System.Numerics;
+
+namespace com.example;
+
+public interface Logger
+{
+
+	void debug(string arg0);
+
+	void info(string arg0);
+
+	void warning(string arg0);
+
+	void error(string arg0);
+
+}
@@ -0,0 +1,78 @@
+using System;
+using System.Collections.Generic;
+using System.ComponentModel.DataAnnotations;
+using System.ComponentModel.DataAnnotations.Schema;
+using System.Numerics;
+
+namespace com.example;
+
+public abstract class Person
+{
+	private int id;
+	private string name;
+	private Gender gender;
+	private DateTime birthDate;
+
+	public Person()
+	{
+	}
+
+	public Person(int id, string name, Gender gender, DateTime birthDate)
+	{
+		this.id = id;
+		this.name = name;
+		this.gender = gender;
+		this.birthDate = birthDate;
+	}
+
+	[Key]
+	[DatabaseGenerated(DatabaseGeneratedOption.Identity)]
+	public int Id
+	{
+		get => id;
+		set => id = value;
+	}
+
+	[Required]
+	public string Name
+	{
+		get => name;
+		set => name = value;
+	}
+
+	public Gender Gender
+	{
+		get => gender;
+		set => gender = value;
+	}
+
+	[DataType(DataType.Date)]
+	public DateTime BirthDate
+	{
+		get => birthDate;
+		set => birthDate = value;
+	}
+
+	public override bool Equals(Object obj)
+	{
+		if (ReferenceEquals(this, obj)) return true;
+		if (obj is Person other) {
+			return Equals(id, other.id) && Equals(name, other.name) && Equals(gender, other.gender) && Equals(birthDate, other.birthDate);
+		}
+		return false;
+	}
+
+	public override int GetHashCode()
+	{
+		return HashCode.Combine(id, name, gender, birthDate);
+	}
+
+	public override string ToString() {
+		return $"Person {{id={id}, name={name}, gender={gender}, birthDate={birthDate}}}";
+	}
+
+	public abstract Account openAccount();
+
+	public abstract Account closeAccount();
+
+}
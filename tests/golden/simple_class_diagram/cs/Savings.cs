@@ -0,0 +1,48 @@
+using System;
+using System.Collections.Generic;
+using System.ComponentModel.DataAnnotations;
+using System.ComponentModel.DataAnnotations.Schema;
+using System.Numerics;
+
+namespace com.example;
+
+public class Savings : Account
+{
+	public const double MIN_INTEREST = .33;
+	private double interestPay;
+
+	public Savings(): base()
+	{
+	}
+
+	public Savings(int id, string number, DateTime createdAt, bool locked, double interestPay):
+		base(id, number, createdAt, locked)
+	{
+		this.interestPay = interestPay;
+	}
+
+	public double InterestPay
+	{
+		get => interestPay;
+		set => interestPay = value;
+	}
+
+	public override bool Equals(Object obj)
+	{
+		if (ReferenceEquals(this, obj)) return true;
+		if (obj is Savings other) {
+			return base.Equals(other) && Equals(interestPay, other.interestPay);
+		}
+		return false;
+	}
+
+	public override int GetHashCode()
+	{
+		return HashCode.Combine(base.GetHashCode(), interestPay);
+	}
+
+	public override string ToString() {
+		return $"Savings {{{base.ToString()}, interestPay={interestPay}}}";
+	}
+
+}
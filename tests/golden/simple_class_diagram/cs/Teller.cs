@@ -0,0 +1,80 @@
+using System;
+using System.Collections.Generic;
+using System.ComponentModel.DataAnnotations;
+using System.ComponentModel.DataAnnotations.Schema;
+using System.Numerics;
+
+namespace com.example;
+
+public class Teller : Person
+{
+
+	public Teller(): base()
+	{
+	}
+
+	public Teller(int id, string name, Gender gender, DateTime birthDate):
+		base(id, name, gender, birthDate)
+	{
+
+	}
+
+	public Guid bankId { get; set; }
+
+	[ForeignKey(nameof(bankId))]
+	public virtual Bank Bank { get; set; }
+
+	public override bool Equals(Object obj)
+	{
+		if (ReferenceEquals(this, obj)) return true;
+		if (obj is Teller other) {
+			return base.Equals(other);
+		}
+		return false;
+	}
+
+	public override int GetHashCode()
+	{
+		return HashCode.Combine(base.GetHashCode());
+	}
+
+	public override string ToString() {
+		return $"Teller {{{base.ToString()}}}";
+	}
+
+	public bool collectMoney()
+	{
+		// Todo: implement this method!
+		return default(bool);
+	}
+
+	public Account openAccount()
+	{
+		// Todo: implement this method!
+		return default(Account);
+	}
+
+	public Account closeAccount()
+	{
+		// Todo: implement this method!
+		return default(Account);
+	}
+
+	public bool loanRequest()
+	{
+		// Todo: implement this method!
+		return default(bool);
+	}
+
+	public void provideInfo()
+	{
+		// Todo: implement this method!
+	}
+
+	public bool issueCard()
+	{
+		// Todo: implement this method!
+		return default(bool);
+	}
+
+}
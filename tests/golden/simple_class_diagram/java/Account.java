@@ -0,0 +1,115 @@
+package com.example;
+
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.time.LocalTime;
+import java.util.HashSet;
+import java.util.Objects;
+import java.util.Set;
+import java.util.UUID;
+import javax.persistence.*;
+import javax.validation.constraints.*;
+import org.hibernate.annotations.Generated;
+import org.hibernate.generator.EventType;
+import org.hibernate.validator.constraints.*;
+
+@Entity
+public class Account {
+	
+	@Id
+	@GeneratedValue(strategy=GenerationType.IDENTITY)
+	private Integer id;
+	
+	@NotNull
+	private String number;
+	
+	@Generated(event={EventType.INSERT})
+	private LocalDateTime createdAt;
+	private boolean locked = false;
+
+	@OneToMany(mappedBy="account")
+	private Set<Customer> customers = new HashSet<>();
+
+	public Account() {
+	}
+
+	public Account(int id, String number, LocalDateTime createdAt, boolean locked) {
+		this.id = id;
+		this.number = number;
+		this.createdAt = createdAt;
+		this.locked = locked;
+	}
+
+	public int getId() {
+		return id;
+	}
+
+	public void setId(int id) {
+		this.id = id;
+	}
+
+	public String getNumber() {
+		return number;
+	}
+
+	public void setNumber(String number) {
+		this.number = number;
+	}
+
+	public LocalDateTime getCreatedAt() {
+		return createdAt;
+	}
+
+	public void setCreatedAt(LocalDateTime createdAt) {
+		this.createdAt = createdAt;
+	}
+
+	public boolean isLocked() {
+		return locked;
+	}
+
+	public void setLocked(boolean locked) {
+		this.locked = locked;
+	}
+
+	public Set<Customer> getCustomers() {
+		return customers;
+	}
+
+	public void setCustomers(Set<Customer> customers) {
+		this.customers = customers;
+	}
+
+	@Override
+	public boolean equals(Object obj) {
+		if (this == obj) return true;
+		if (obj instanceof Account other) {
+			return Objects.equals(id, other.id) &&
+					Objects.equals(number, other.number) &&
+					Objects.equals(createdAt, other.createdAt) &&
+					Objects.equals(locked, other.locked);
+		}
+		return false;
+	}
+
+	@Override
+	public int hashCode() {
+		return Objects.hash(id,
+					number,
+					createdAt,
+					locked);
+	}
+
+	@Override
+	public String toString() {
+		return new StringBuilder("Account {")
+			.append("id=").append(id).append(", ")
+			.append("number=").append(number).append(", ")
+			.append("createdAt=").append(createdAt).append(", ")
+			.append("locked=").append(locked)
+			.append("}").toString();
+	}
+
+}
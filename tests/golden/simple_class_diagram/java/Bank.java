@@ -0,0 +1,127 @@
+package com.example;
+
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.time.LocalTime;
+import java.util.HashSet;
+import java.util.Objects;
+import java.util.Set;
+import java.util.UUID;
+import javax.persistence.*;
+import javax.validation.constraints.*;
+import org.hibernate.annotations.Generated;
+import org.hibernate.generator.EventType;
+import org.hibernate.validator.constraints.*;
+
+@Entity
+public class Bank {
+	
+	@Id
+	private UUID bankId;
+	
+	@NotNull
+	private String name;
+	
+	@Lob
+	private String address;
+	
+	@URL
+	private String website;
+
+	@OneToMany(mappedBy="bank")
+	private Set<Teller> tellers = new HashSet<>();
+
+	@OneToMany(mappedBy="bank")
+	private Set<Customer> customers = new HashSet<>();
+
+	public Bank() {
+	}
+
+	public Bank(UUID bankId, String name, String address, String website) {
+		this.bankId = bankId;
+		this.name = name;
+		this.address = address;
+		this.website = website;
+	}
+
+	public UUID getBankId() {
+		return bankId;
+	}
+
+	public void setBankId(UUID bankId) {
+		this.bankId = bankId;
+	}
+
+	public String getName() {
+		return name;
+	}
+
+	public void setName(String name) {
+		this.name = name;
+	}
+
+	public String getAddress() {
+		return address;
+	}
+
+	public void setAddress(String address) {
+		this.address = address;
+	}
+
+	public String getWebsite() {
+		return website;
+	}
+
+	public void setWebsite(String website) {
+		this.website = website;
+	}
+
+	public Set<Teller> getTellers() {
+		return tellers;
+	}
+
+	public void setTellers(Set<Teller> tellers) {
+		this.tellers = tellers;
+	}
+
+	public Set<Customer> getCustomers() {
+		return customers;
+	}
+
+	public void setCustomers(Set<Customer> customers) {
+		this.customers = customers;
+	}
+
+	@Override
+	public boolean equals(Object obj) {
+		if (this == obj) return true;
+		if (obj instanceof Bank other) {
+			return Objects.equals(bankId, other.bankId) &&
+					Objects.equals(name, other.name) &&
+					Objects.equals(address, other.address) &&
+					Objects.equals(website, other.website);
+		}
+		return false;
+	}
+
+	@Override
+	public int hashCode() {
+		return Objects.hash(bankId,
+					name,
+					address,
+					website);
+	}
+
+	@Override
+	public String toString() {
+		return new StringBuilder("Bank {")
+			.append("bankId=").append(bankId).append(", ")
+			.append("name=").append(name).append(", ")
+			.append("address=").append(address).append(", ")
+			.append("website=").append(website)
+			.append("}").toString();
+	}
+
+}
@@ -0,0 +1,78 @@
+package com.example;
+
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.time.LocalTime;
+import java.util.HashSet;
+import java.util.Objects;
+import java.util.Set;
+import java.util.UUID;
+import javax.persistence.*;
+import javax.persistence.PrimaryKeyJoinColumn;
+import javax.validation.constraints.*;
+import org.hibernate.annotations.Generated;
+import org.hibernate.generator.EventType;
+import org.hibernate.validator.constraints.*;
+
+@Entity
+@PrimaryKeyJoinColumn(name = "id")
+public class Checking extends Account {
+	
+	@Min(0)
+	private double interestCost;
+	
+	@CreditCardNumber
+	private String cardNumber;
+
+	public Checking() {
+		super();
+	}
+
+	public Checking(int id,
+			String number,
+			LocalDateTime createdAt,
+			boolean locked, double interestCost,
+			String cardNumber) {
+		super(id, number, createdAt, locked);
+		this.interestCost = interestCost;
+		this.cardNumber = cardNumber;
+	}
+
+	public double getInterestCost() {
+		return interestCost;
+	}
+
+	public void setInterestCost(double interestCost) {
+		this.interestCost = interestCost;
+	}
+
+	public String getCardNumber() {
+		return cardNumber;
+	}
+
+	public void setCardNumber(String cardNumber) {
+		this.cardNumber = cardNumber;
+	}
+
+	@Override
+	public boolean equals(Object obj) {
+		if (this == obj) return true;
+		if (obj instanceof Checking other) {
+			return super.equals(other) && Objects.equals(interestCost, other.interestCost) && Objects.equals(cardNumber, other.cardNumber);
+		}
+		return false;
+	}
+
+	@Override
+	public int hashCode() {
+		return Objects.hash(super.hashCode(), interestCost, cardNumber);
+	}
+
+	@Override
+	public String toString() {
+		return new StringBuilder("Checking {").append(super.toString()).append(", ").append("interestCost=").append(interestCost).append(", ").append("cardNumber=").append(cardNumber).append("}").toString();
+	}
+
+}
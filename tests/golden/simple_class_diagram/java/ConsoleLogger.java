@@ -0,0 +1,44 @@
+package com.example;
+
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.time.LocalTime;
+import java.util.HashSet;
+import java.util.Objects;
+import java.util.Set;
+import java.util.UUID;
+import javax.persistence.*;
+import javax.validation.constraints.*;
+import org.hibernate.annotations.Generated;
+import org.hibernate.generator.EventType;
+import org.hibernate.validator.constraints.*;
+
+@Entity
+public class ConsoleLogger implements Logger {
+
+	public ConsoleLogger() {
+	}
+
+	@Override
+	public void debug(String arg0) {
+		// Todo: implement this method!
+	}
+
+	@Override
+	public void info(String arg0) {
+		// Todo: implement this method!
+	}
+
+	@Override
+	public void warning(String arg0) {
+		// Todo: implement this method!
+	}
+
+	@Override
+	public void error(String arg0) {
+		// Todo: implement this method!
+	}
+
+}
@@ -0,0 +1,135 @@
+package com.example;
+
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.time.LocalTime;
+import java.util.HashSet;
+import java.util.Objects;
+import java.util.Set;
+import java.util.UUID;
+import javax.persistence.*;
+import javax.persistence.PrimaryKeyJoinColumn;
+import javax.validation.constraints.*;
+import org.hibernate.annotations.Generated;
+import org.hibernate.generator.EventType;
+import org.hibernate.validator.constraints.*;
+
+@Entity
+@PrimaryKeyJoinColumn(name = "id")
+public class Customer extends Person {
+	private String address;
+	
+	@Pattern(regexp="^(((\\+|00)[1-9]+)[ -]?)?((\\(\\d+\\))|\\d)([ -]?\\d)+$")
+	private String phoneNum;
+
+	@ManyToOne
+	@JoinColumn(name="account_id", referencedColumnName="id")
+	private Account account;
+
+	@ManyToOne
+	@JoinColumn(name="bankId", referencedColumnName="bankId")
+	private Bank bank;
+
+	public Customer() {
+		super();
+	}
+
+	public Customer(int id,
+			String name,
+			Gender gender,
+			LocalDate birthDate, String address,
+			String phoneNum) {
+		super(id, name, gender, birthDate);
+		this.address = address;
+		this.phoneNum = phoneNum;
+	}
+
+	public String getAddress() {
+		return address;
+	}
+
+	public void setAddress(String address) {
+		this.address = address;
+	}
+
+	public String getPhoneNum() {
+		return phoneNum;
+	}
+
+	public void setPhoneNum(String phoneNum) {
+		this.phoneNum = phoneNum;
+	}
+
+	public Account getAccount() {
+		return account;
+	}
+
+	public void setAccount(Account account) {
+		this.account = account;
+	}
+
+	public Bank getBank() {
+		return bank;
+	}
+
+	public void setBank(Bank bank) {
+		this.bank = bank;
+	}
+
+	@Override
+	public boolean equals(Object obj) {
+		if (this == obj) return true;
+		if (obj instanceof Customer other) {
+			return super.equals(other) && Objects.equals(address, other.address) && Objects.equals(phoneNum, other.phoneNum);
+		}
+		return false;
+	}
+
+	@Override
+	public int hashCode() {
+		return Objects.hash(super.hashCode(), address, phoneNum);
+	}
+
+	@Override
+	public String toString() {
+		return new StringBuilder("Customer {").append(super.toString()).append(", ").append("address=").append(address).append(", ").append("phoneNum=").append(phoneNum).append("}").toString();
+	}
+
+	public boolean generalInquiry() {
+		// Todo: implement this method!
+		return false;
+	}
+
+	public boolean depositMoney() {
+		// Todo: implement this method!
+		return false;
+	}
+
+	public boolean withdrawMoney() {
+		// Todo: implement this method!
+		return false;
+	}
+
+	public Account openAccount() {
+		// Todo: implement this method!
+		return null;
+	}
+
+	public Account closeAccount() {
+		// Todo: implement this method!
+		return null;
+	}
+
+	public boolean applyForLoan() {
+		// Todo: implement this method!
+		return false;
+	}
+
+	public boolean requestCard() {
+		// Todo: implement this method!
+		return false;
+	}
+
+}
@@ -0,0 +1,85 @@
+package com.example;
+
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.time.LocalTime;
+import java.util.HashSet;
+import java.util.Objects;
+import java.util.Set;
+import java.util.UUID;
+import javax.persistence.*;
+import javax.validation.constraints.*;
+import org.hibernate.annotations.Generated;
+import org.hibernate.generator.EventType;
+import org.hibernate.validator.constraints.*;
+
+@Entity
+public class FileLogger implements Logger {
+	private String filePath;
+
+	public FileLogger() {
+	}
+
+	public FileLogger(String filePath) {
+		this.filePath = filePath;
+	}
+
+	public String getFilePath() {
+		return filePath;
+	}
+
+	public void setFilePath(String filePath) {
+		this.filePath = filePath;
+	}
+
+	@Override
+	public boolean equals(Object obj) {
+		if (this == obj) return true;
+		if (obj instanceof FileLogger other) {
+			return Objects.equals(filePath, other.filePath);
+		}
+		return false;
+	}
+
+	@Override
+	public int hashCode() {
+		return Objects.hash(filePath);
+	}
+
+	@Override
+	public String toString() {
+		return new StringBuilder("FileLogger {").append("filePath=").append(filePath).append("}").toString();
+	}
+
+	public final void rotateFile() {
+		// Todo: implement this method!
+	}
+
+	public static String[] getRotationHistory() {
+		// Todo: implement this method!
+		return null;
+	}
+
+	@Override
+	public void debug(String arg0) {
+		// Todo: implement this method!
+	}
+
+	@Override
+	public void info(String arg0) {
+		// Todo: implement this method!
+	}
+
+	@Override
+	public void warning(String arg0) {
+		// Todo: implement this method!
+	}
+
+	@Override
+	public void error(String arg0) {
+		// Todo: implement this method!
+	}
+
+}
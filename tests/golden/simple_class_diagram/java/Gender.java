@@ -0,0 +1,6 @@
+package com.example;
+
+public enum Gender {
+	MALE,
+	FEMALE
+}
@@ -0,0 +1,23 @@
+package com.example;
+
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.time.LocalTime;
+import java.util.HashSet;
+import java.util.Objects;
+import java.util.Set;
+import java.util.UUID;
+
+public interface Logger {
+
+	void debug(String arg0);
+
+	void info(String arg0);
+
+	void warning(String arg0);
+
+	void error(String arg0);
+
+}
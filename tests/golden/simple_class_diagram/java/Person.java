@@ -0,0 +1,110 @@
+package com.example;
+
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.time.LocalTime;
+import java.util.HashSet;
+import java.util.Objects;
+import java.util.Set;
+import java.util.UUID;
+import javax.persistence.*;
+import javax.validation.constraints.*;
+import org.hibernate.annotations.Generated;
+import org.hibernate.generator.EventType;
+import org.hibernate.validator.constraints.*;
+
+@Entity
+public abstract class Person {
+	
+	@Id
+	@GeneratedValue(strategy=GenerationType.IDENTITY)
+	private Integer id;
+	
+	@NotNull
+	private String name;
+	
+	@Enumerated(EnumType.STRING)
+	private Gender gender;
+	private LocalDate birthDate;
+
+	public Person() {
+	}
+
+	public Person(int id, String name, Gender gender, LocalDate birthDate) {
+		this.id = id;
+		this.name = name;
+		this.gender = gender;
+		this.birthDate = birthDate;
+	}
+
+	public int getId() {
+		return id;
+	}
+
+	public void setId(int id) {
+		this.id = id;
+	}
+
+	public String getName() {
+		return name;
+	}
+
+	public void setName(String name) {
+		this.name = name;
+	}
+
+	public Gender getGender() {
+		return gender;
+	}
+
+	public void setGender(Gender gender) {
+		this.gender = gender;
+	}
+
+	public LocalDate getBirthDate() {
+		return birthDate;
+	}
+
+	public void setBirthDate(LocalDate birthDate) {
+		this.birthDate = birthDate;
+	}
+
+	@Override
+	public boolean equals(Object obj) {
+		if (this == obj) return true;
+		if (obj instanceof Person other) {
+			return Objects.equals(id, other.id) &&
+					Objects.equals(name, other.name) &&
+					Objects.equals(gender, other.gender) &&
+					Objects.equals(birthDate, other.birthDate);
+		}
+		return false;
+	}
+
+	@Override
+	public int hashCode() {
+		return Objects.hash(id,
+					name,
+					gender,
+					birthDate);
+	}
+
+	@Override
+	public String toString() {
+		return new StringBuilder("Person {")
+			.append("id=").append(id).append(", ")
+			.append("name=").append(name).append(", ")
+			.append("gender=").append(gender).append(", ")
+			.append("birthDate=").append(birthDate)
+			.append("}").toString();
+	}
+
+	public abstract Account openAccount();
+
+
+	public abstract Account closeAccount();
+
+
+}
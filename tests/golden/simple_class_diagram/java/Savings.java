@@ -0,0 +1,66 @@
+package com.example;
+
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.time.LocalTime;
+import java.util.HashSet;
+import java.util.Objects;
+import java.util.Set;
+import java.util.UUID;
+import javax.persistence.*;
+import javax.persistence.PrimaryKeyJoinColumn;
+import javax.validation.constraints.*;
+import org.hibernate.annotations.Generated;
+import org.hibernate.generator.EventType;
+import org.hibernate.validator.constraints.*;
+
+@Entity
+@PrimaryKeyJoinColumn(name = "id")
+public class Savings extends Account {
+	public static final double MIN_INTEREST = .33;
+	
+	@Min(0)
+	private double interestPay;
+
+	public Savings() {
+		super();
+	}
+
+	public Savings(int id,
+			String number,
+			LocalDateTime createdAt,
+			boolean locked, double interestPay) {
+		super(id, number, createdAt, locked);
+		this.interestPay = interestPay;
+	}
+
+	public double getInterestPay() {
+		return interestPay;
+	}
+
+	public void setInterestPay(double interestPay) {
+		this.interestPay = interestPay;
+	}
+
+	@Override
+	public boolean equals(Object obj) {
+		if (this == obj) return true;
+		if (obj instanceof Savings other) {
+			return super.equals(other) && Objects.equals(interestPay, other.interestPay);
+		}
+		return false;
+	}
+
+	@Override
+	public int hashCode() {
+		return Objects.hash(super.hashCode(), interestPay);
+	}
+
+	@Override
+	public String toString() {
+		return new StringBuilder("Savings {").append(super.toString()).append(", ").append("interestPay=").append(interestPay).append("}").toString();
+	}
+
+}
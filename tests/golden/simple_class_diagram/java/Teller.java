@@ -0,0 +1,92 @@
+package com.example;
+
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.time.LocalTime;
+import java.util.HashSet;
+import java.util.Objects;
+import java.util.Set;
+import java.util.UUID;
+import javax.persistence.*;
+import javax.persistence.PrimaryKeyJoinColumn;
+import javax.validation.constraints.*;
+import org.hibernate.annotations.Generated;
+import org.hibernate.generator.EventType;
+import org.hibernate.validator.constraints.*;
+
+@Entity
+@PrimaryKeyJoinColumn(name = "id")
+public class Teller extends Person {
+
+	@ManyToOne
+	@JoinColumn(name="bankId", referencedColumnName="bankId")
+	private Bank bank;
+
+	public Teller() {
+		super();
+	}
+
+	public Teller(int id, String name, Gender gender, LocalDate birthDate) {
+		super(id, name, gender, birthDate);
+
+	}
+
+	public Bank getBank() {
+		return bank;
+	}
+
+	public void setBank(Bank bank) {
+		this.bank = bank;
+	}
+
+	@Override
+	public boolean equals(Object obj) {
+		if (this == obj) return true;
+		if (obj instanceof Teller other) {
+			return super.equals(other);
+		}
+		return false;
+	}
+
+	@Override
+	public int hashCode() {
+		return Objects.hash(super.hashCode());
+	}
+
+	@Override
+	public String toString() {
+		return new StringBuilder("Teller {").append(super.toString()).append("}").toString();
+	}
+
+	public boolean collectMoney() {
+		// Todo: implement this method!
+		return false;
+	}
+
+	public Account openAccount() {
+		// Todo: implement this method!
+		return null;
+	}
+
+	public Account closeAccount() {
+		// Todo: implement this method!
+		return null;
+	}
+
+	public boolean loanRequest() {
+		// Todo: implement this method!
+		return false;
+	}
+
+	public void provideInfo() {
+		// Todo: implement this method!
+	}
+
+	public boolean issueCard() {
+		// Todo: implement this method!
+		return false;
+	}
+
+}
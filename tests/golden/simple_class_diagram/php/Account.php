@@ -0,0 +1,79 @@
+<?php
+namespace com\example;
+
+require_once './Customer.php';
+
+class Account {
+	private $id;
+	private $number;
+	private $createdAt;
+	private $locked = false;
+	private $customers;
+
+	public function __construct($id = 0, $number = "", $createdAt = null, $locked = false) {
+		$this->id = $id;
+		$this->number = $number;
+		$this->createdAt = $createdAt;
+		$this->locked = $locked;
+	}
+
+	public function get_id() {
+		return $this->id;
+	}
+
+	public function set_id($id) {
+		$this->id = $id;
+	}
+
+	public function get_number() {
+		return $this->number;
+	}
+
+	public function set_number($number) {
+		$this->number = $number;
+	}
+
+	public function get_createdAt() {
+		return $this->createdAt;
+	}
+
+	public function set_createdAt($createdAt) {
+		$this->createdAt = $createdAt;
+	}
+
+	public function is_locked() {
+		return $this->locked;
+	}
+
+	public function set_locked($locked) {
+		$this->locked = $locked;
+	}
+
+	public function get_customers() {
+		return $this->customers;
+	}
+
+	public function set_customers($customers) {
+		$this->customers = $customers;
+	}
+
+	public function equals($obj) {
+		if ($this === $obj) return true;
+		if (get_class($this) === get_class($obj)) {
+			return $this->id === $obj->id &&
+				$this->number === $obj->number &&
+				$this->createdAt === $obj->createdAt &&
+				$this->locked === $obj->locked;
+		}
+		return false;
+	}
+
+	public function hashCode() {
+		return crc32("$this->id:$this->number:$this->createdAt:$this->locked");
+	}
+
+	public function toString() {
+		return "Account \{id=$this->id, number=$this->number, createdAt=$this->createdAt, locked=$this->locked\}";
+	}
+
+}
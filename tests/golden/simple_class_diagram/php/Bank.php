@@ -0,0 +1,89 @@
+<?php
+namespace com\example;
+
+require_once './Customer.php';
+require_once './Teller.php';
+
+class Bank {
+	private $bankId;
+	private $name;
+	private $address;
+	private $website;
+	private $tellers;
+	private $customers;
+
+	public function __construct($bankId = null, $name = "", $address = "", $website = "") {
+		$this->bankId = $bankId;
+		$this->name = $name;
+		$this->address = $address;
+		$this->website = $website;
+	}
+
+	public function get_bankId() {
+		return $this->bankId;
+	}
+
+	public function set_bankId($bankId) {
+		$this->bankId = $bankId;
+	}
+
+	public function get_name() {
+		return $this->name;
+	}
+
+	public function set_name($name) {
+		$this->name = $name;
+	}
+
+	public function get_address() {
+		return $this->address;
+	}
+
+	public function set_address($address) {
+		$this->address = $address;
+	}
+
+	public function get_website() {
+		return $this->website;
+	}
+
+	public function set_website($website) {
+		$this->website = $website;
+	}
+
+	public function get_tellers() {
+		return $this->tellers;
+	}
+
+	public function set_tellers($tellers) {
+		$this->tellers = $tellers;
+	}
+
+	public function get_customers() {
+		return $this->customers;
+	}
+
+	public function set_customers($customers) {
+		$this->customers = $customers;
+	}
+
+	public function equals($obj) {
+		if ($this === $obj) return true;
+		if (get_class($this) === get_class($obj)) {
+			return $this->bankId === $obj->bankId &&
+				$this->name === $obj->name &&
+				$this->address === $obj->address &&
+				$this->website === $obj->website;
+		}
+		return false;
+	}
+
+	public function hashCode() {
+		return crc32("$this->bankId:$this->name:$this->address:$this->website");
+	}
+
+	public function toString() {
+		return "Bank \{bankId=$this->bankId, name=$this->name, address=$this->address, website=$this->website\}";
+	}
+
+}
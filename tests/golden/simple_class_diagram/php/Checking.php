@@ -0,0 +1,51 @@
+<?php
+namespace com\example;
+
+require_once './Account.php';
+
+class Checking extends Account {
+	private $interestCost;
+	private $cardNumber;
+
+	public function __construct($id = 0, $number = "", $createdAt = null, $locked = false, $interestCost = 0, $cardNumber = "") {
+		parent::__construct($id, $number, $createdAt, $locked);
+		$this->interestCost = $interestCost;
+		$this->cardNumber = $cardNumber;
+	}
+
+	public function get_interestCost() {
+		return $this->interestCost;
+	}
+
+	public function set_interestCost($interestCost) {
+		$this->interestCost = $interestCost;
+	}
+
+	public function get_cardNumber() {
+		return $this->cardNumber;
+	}
+
+	public function set_cardNumber($cardNumber) {
+		$this->cardNumber = $cardNumber;
+	}
+
+	public function equals($obj) {
+		if ($this === $obj) return true;
+		if (get_class($this) === get_class($obj)) {
+			return parent::equals($obj) &&
+				$this->interestCost === $obj->interestCost &&
+				$this->cardNumber === $obj->cardNumber;
+		}
+		return false;
+	}
+
+	public function hashCode() {
+		return crc32("$this->interestCost:$this->cardNumber");
+	}
+
+	public function toString() {
+		$parentString = parent::toString();
+		return "Checking \{$parentString, interestCost=$this->interestCost, cardNumber=$this->cardNumber\}";
+	}
+
+}
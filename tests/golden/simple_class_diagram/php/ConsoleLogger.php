@@ -0,0 +1,24 @@
+<?php
+namespace com\example;
+
+require_once './Logger.php';
+
+class ConsoleLogger implements Logger {
+
+	public function debug($arg0) 	{
+		// Todo: implement this method!
+	}
+
+	public function info($arg0) 	{
+		// Todo: implement this method!
+	}
+
+	public function warning($arg0) 	{
+		// Todo: implement this method!
+	}
+
+	public function error($arg0) 	{
+		// Todo: implement this method!
+	}
+
+}
@@ -0,0 +1,106 @@
+<?php
+namespace com\example;
+
+require_once './Account.php';
+require_once './Bank.php';
+require_once './Person.php';
+
+class Customer extends Person {
+	private $address;
+	private $phoneNum;
+	private $account;
+	private $bank;
+
+	public function __construct($id = 0, $name = "", $gender = null, $birthDate = null, $address = "", $phoneNum = "") {
+		parent::__construct($id, $name, $gender, $birthDate);
+		$this->address = $address;
+		$this->phoneNum = $phoneNum;
+	}
+
+	public function get_address() {
+		return $this->address;
+	}
+
+	public function set_address($address) {
+		$this->address = $address;
+	}
+
+	public function get_phoneNum() {
+		return $this->phoneNum;
+	}
+
+	public function set_phoneNum($phoneNum) {
+		$this->phoneNum = $phoneNum;
+	}
+
+	public function get_account() {
+		return $this->account;
+	}
+
+	public function set_account($account) {
+		$this->account = $account;
+	}
+
+	public function get_bank() {
+		return $this->bank;
+	}
+
+	public function set_bank($bank) {
+		$this->bank = $bank;
+	}
+
+	public function equals($obj) {
+		if ($this === $obj) return true;
+		if (get_class($this) === get_class($obj)) {
+			return parent::equals($obj) &&
+				$this->address === $obj->address &&
+				$this->phoneNum === $obj->phoneNum;
+		}
+		return false;
+	}
+
+	public function hashCode() {
+		return crc32("$this->address:$this->phoneNum");
+	}
+
+	public function toString() {
+		$parentString = parent::toString();
+		return "Customer \{$parentString, address=$this->address, phoneNum=$this->phoneNum\}";
+	}
+
+	public function generalInquiry() 	{
+		// Todo: implement this method!
+		return false;
+	}
+
+	public function depositMoney() 	{
+		// Todo: implement this method!
+		return false;
+	}
+
+	public function withdrawMoney() 	{
+		// Todo: implement this method!
+		return false;
+	}
+
+	public function openAccount() 	{
+		// Todo: implement this method!
+		return null;
+	}
+
+	public function closeAccount() 	{
+		// Todo: implement this method!
+		return null;
+	}
+
+	public function applyForLoan() 	{
+		// Todo: implement this method!
+		return false;
+	}
+
+	public function requestCard() 	{
+		// Todo: implement this method!
+		return false;
+	}
+
+}
@@ -0,0 +1,62 @@
+<?php
+namespace com\example;
+
+require_once './Logger.php';
+
+class FileLogger implements Logger {
+	private $filePath;
+
+	public function __construct($filePath = "") {
+		$this->filePath = $filePath;
+	}
+
+	public function get_filePath() {
+		return $this->filePath;
+	}
+
+	public function set_filePath($filePath) {
+		$this->filePath = $filePath;
+	}
+
+	public function equals($obj) {
+		if ($this === $obj) return true;
+		if (get_class($this) === get_class($obj)) {
+			return $this->filePath === $obj->filePath;
+		}
+		return false;
+	}
+
+	public function hashCode() {
+		return crc32("$this->filePath");
+	}
+
+	public function toString() {
+		return "FileLogger \{filePath=$this->filePath\}";
+	}
+
+	public final function rotateFile() 	{
+		// Todo: implement this method!
+	}
+
+	public static function getRotationHistory() 	{
+		// Todo: implement this method!
+		return null;
+	}
+
+	public function debug($arg0) 	{
+		// Todo: implement this method!
+	}
+
+	public function info($arg0) 	{
+		// Todo: implement this method!
+	}
+
+	public function warning($arg0) 	{
+		// Todo: implement this method!
+	}
+
+	public function error($arg0) 	{
+		// Todo: implement this method!
+	}
+
+}
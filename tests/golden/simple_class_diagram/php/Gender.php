@@ -0,0 +1,8 @@
+<?php
+namespace com\example;
+
+enum Gender {
+	case MALE;
+	case FEMALE;
+
+}
@@ -0,0 +1,14 @@
+<?php
+namespace com\example;
+
+interface Logger {
+
+	public function debug($arg0);
+
+	public function info($arg0);
+
+	public function warning($arg0);
+
+	public function error($arg0);
+
+}
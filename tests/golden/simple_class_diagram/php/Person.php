@@ -0,0 +1,77 @@
+<?php
+namespace com\example;
+
+require_once './Account.php';
+require_once './Gender.php';
+
+abstract class Person {
+	private $id;
+	private $name;
+	private $gender;
+	private $birthDate;
+
+	public function __construct($id = 0, $name = "", $gender = null, $birthDate = null) {
+		$this->id = $id;
+		$this->name = $name;
+		$this->gender = $gender;
+		$this->birthDate = $birthDate;
+	}
+
+	public function get_id() {
+		return $this->id;
+	}
+
+	public function set_id($id) {
+		$this->id = $id;
+	}
+
+	public function get_name() {
+		return $this->name;
+	}
+
+	public function set_name($name) {
+		$this->name = $name;
+	}
+
+	public function get_gender() {
+		return $this->gender;
+	}
+
+	public function set_gender($gender) {
+		$this->gender = $gender;
+	}
+
+	public function get_birthDate() {
+		return $this->birthDate;
+	}
+
+	public function set_birthDate($birthDate) {
+		$this->birthDate = $birthDate;
+	}
+
+	public function equals($obj) {
+		if ($this === $obj) return true;
+		if (get_class($this) === get_class($obj)) {
+			return $this->id === $obj->id &&
+				$this->name === $obj->name &&
+				$this->gender === $obj->gender &&
+				$this->birthDate === $obj->birthDate;
+		}
+		return false;
+	}
+
+	public function hashCode() {
+		return crc32("$this->id:$this->name:$this->gender:$this->birthDate");
+	}
+
+	public function toString() {
+		return "Person \{id=$this->id, name=$this->name, gender=$this->gender, birthDate=$this->birthDate\}";
+	}
+
+	public abstract function openAccount();
+
+
+	public abstract function closeAccount();
+
+
+}
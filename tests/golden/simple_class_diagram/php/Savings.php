@@ -0,0 +1,41 @@
+<?php
+namespace com\example;
+
+require_once './Account.php';
+
+class Savings extends Account {
+	public const MIN_INTEREST = .33;
+	private $interestPay;
+
+	public function __construct($id = 0, $number = "", $createdAt = null, $locked = false, $interestPay = 0) {
+		parent::__construct($id, $number, $createdAt, $locked);
+		$this->interestPay = $interestPay;
+	}
+
+	public function get_interestPay() {
+		return $this->interestPay;
+	}
+
+	public function set_interestPay($interestPay) {
+		$this->interestPay = $interestPay;
+	}
+
+	public function equals($obj) {
+		if ($this === $obj) return true;
+		if (get_class($this) === get_class($obj)) {
+			return parent::equals($obj) &&
+				$this->interestPay === $obj->interestPay;
+		}
+		return false;
+	}
+
+	public function hashCode() {
+		return crc32("$this->interestPay");
+	}
+
+	public function toString() {
+		$parentString = parent::toString();
+		return "Savings \{$parentString, interestPay=$this->interestPay\}";
+	}
+
+}
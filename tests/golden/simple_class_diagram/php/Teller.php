@@ -0,0 +1,70 @@
+<?php
+namespace com\example;
+
+require_once './Account.php';
+require_once './Bank.php';
+require_once './Person.php';
+
+class Teller extends Person {
+	private $bank;
+
+	public function __construct($id = 0, $name = "", $gender = null, $birthDate = null) {
+		parent::__construct($id, $name, $gender, $birthDate);
+
+	}
+
+	public function get_bank() {
+		return $this->bank;
+	}
+
+	public function set_bank($bank) {
+		$this->bank = $bank;
+	}
+
+	public function equals($obj) {
+		if ($this === $obj) return true;
+		if (get_class($this) === get_class($obj)) {
+			return parent::equals($obj);
+		}
+		return false;
+	}
+
+	public function hashCode() {
+		return crc32("");
+	}
+
+	public function toString() {
+		$parentString = parent::toString();
+		return "Teller \{$parentString\}";
+	}
+
+	public function collectMoney() 	{
+		// Todo: implement this method!
+		return false;
+	}
+
+	public function openAccount() 	{
+		// Todo: implement this method!
+		return null;
+	}
+
+	public function closeAccount() 	{
+		// Todo: implement this method!
+		return null;
+	}
+
+	public function loanRequest() 	{
+		// Todo: implement this method!
+		return false;
+	}
+
+	public function provideInfo() 	{
+		// Todo: implement this method!
+	}
+
+	public function issueCard() 	{
+		// Todo: implement this method!
+		return false;
+	}
+
+}
@@ -0,0 +1,84 @@
+from Customer import Customer
+
+
+class Account:
+
+	def __init__(self, *args, **kwargs):
+		self._customers = []
+
+		argc = len(args)
+
+		if argc > 1:
+			self.id = args[1]
+		else:
+			self.id = kwargs.get('id', 0)
+
+		if argc > 2:
+			self.number = args[2]
+		else:
+			self.number = kwargs.get('number', "")
+
+		if argc > 3:
+			self.createdAt = args[3]
+		else:
+			self.createdAt = kwargs.get('createdAt', None)
+
+		if argc > 4:
+			self.locked = args[4]
+		else:
+			self.locked = kwargs.get('locked', false)
+
+	@property
+	def id_property(self):
+		return self.id
+
+	@id_property.setter
+	def id_property(self, arg_id):
+		self.id = arg_id
+
+	@property
+	def number_property(self):
+		return self.number
+
+	@number_property.setter
+	def number_property(self, arg_number):
+		self.number = arg_number
+
+	@property
+	def createdAt_property(self):
+		return self.createdAt
+
+	@createdAt_property.setter
+	def createdAt_property(self, arg_createdAt):
+		self.createdAt = arg_createdAt
+
+	@property
+	def locked_property(self):
+		return self.locked
+
+	@locked_property.setter
+	def locked_property(self, arg_locked):
+		self.locked = arg_locked
+
+	@property
+	def customers(self):
+		return self._customers
+
+	@customers.setter
+	def customers(self, arg_customers):
+		self._customers = arg_customers
+
+	def __members(self):
+		return (self.id, self.number, self.createdAt, self.locked,)
+
+	def __eq__(self, other):
+		if type(other) is type(self):
+			return self.__members() == other.__members()
+		return False
+
+	def __hash__(self):
+		return hash(self.__members())
+
+	def __str__(self):
+		return f"Account {{id={self.id}, number={self.number}, createdAt={self.createdAt}, locked={self.locked}}}"
+
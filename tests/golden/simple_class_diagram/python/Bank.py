@@ -0,0 +1,94 @@
+from Customer import Customer
+from Teller import Teller
+
+
+class Bank:
+
+	def __init__(self, *args, **kwargs):
+		self._tellers = []
+		self._customers = []
+
+		argc = len(args)
+
+		if argc > 2:
+			self.bankId = args[2]
+		else:
+			self.bankId = kwargs.get('bankId', None)
+
+		if argc > 3:
+			self.name = args[3]
+		else:
+			self.name = kwargs.get('name', "")
+
+		if argc > 4:
+			self.address = args[4]
+		else:
+			self.address = kwargs.get('address', "")
+
+		if argc > 5:
+			self.website = args[5]
+		else:
+			self.website = kwargs.get('website', "")
+
+	@property
+	def bankId_property(self):
+		return self.bankId
+
+	@bankId_property.setter
+	def bankId_property(self, arg_bankId):
+		self.bankId = arg_bankId
+
+	@property
+	def name_property(self):
+		return self.name
+
+	@name_property.setter
+	def name_property(self, arg_name):
+		self.name = arg_name
+
+	@property
+	def address_property(self):
+		return self.address
+
+	@address_property.setter
+	def address_property(self, arg_address):
+		self.address = arg_address
+
+	@property
+	def website_property(self):
+		return self.website
+
+	@website_property.setter
+	def website_property(self, arg_website):
+		self.website = arg_website
+
+	@property
+	def tellers(self):
+		return self._tellers
+
+	@tellers.setter
+	def tellers(self, arg_tellers):
+		self._tellers = arg_tellers
+
+	@property
+	def customers(self):
+		return self._customers
+
+	@customers.setter
+	def customers(self, arg_customers):
+		self._customers = arg_customers
+
+	def __members(self):
+		return (self.bankId, self.name, self.address, self.website,)
+
+	def __eq__(self, other):
+		if type(other) is type(self):
+			return self.__members() == other.__members()
+		return False
+
+	def __hash__(self):
+		return hash(self.__members())
+
+	def __str__(self):
+		return f"Bank {{bankId={self.bankId}, name={self.name}, address={self.address}, website={self.website}}}"
+
@@ -0,0 +1,50 @@
+from Account import Account
+
+
+class Checking(Account):
+
+	def __init__(self, *args, **kwargs):
+		Account.__init__(self, args, kwargs)
+
+		argc = len(args)
+
+		if argc > 0:
+			self.interestCost = args[0]
+		else:
+			self.interestCost = kwargs.get('interestCost', 0)
+
+		if argc > 1:
+			self.cardNumber = args[1]
+		else:
+			self.cardNumber = kwargs.get('cardNumber', "")
+
+	@property
+	def interestCost_property(self):
+		return self.interestCost
+
+	@interestCost_property.setter
+	def interestCost_property(self, arg_interestCost):
+		self.interestCost = arg_interestCost
+
+	@property
+	def cardNumber_property(self):
+		return self.cardNumber
+
+	@cardNumber_property.setter
+	def cardNumber_property(self, arg_cardNumber):
+		self.cardNumber = arg_cardNumber
+
+	def __members(self):
+		return (*Account.__members(self), self.interestCost, self.cardNumber,)
+
+	def __eq__(self, other):
+		if type(other) is type(self):
+			return self.__members() == other.__members()
+		return False
+
+	def __hash__(self):
+		return hash(self.__members())
+
+	def __str__(self):
+		return f"Checking {{{Account.__str__(self)}, interestCost={self.interestCost}, cardNumber={self.cardNumber}}}"
+
@@ -0,0 +1,23 @@
+from Logger import Logger
+
+
+class ConsoleLogger(Logger):
+	def __init__(self, *args, **kwargs):
+		pass
+
+	def debug(self, arg0):
+		# Todo: implement this method!
+		pass
+
+	def info(self, arg0):
+		# Todo: implement this method!
+		pass
+
+	def warning(self, arg0):
+		# Todo: implement this method!
+		pass
+
+	def error(self, arg0):
+		# Todo: implement this method!
+		pass
+
@@ -0,0 +1,98 @@
+from Account import Account
+from Bank import Bank
+from Person import Person
+
+
+class Customer(Person):
+
+	def __init__(self, *args, **kwargs):
+		Person.__init__(self, args, kwargs)
+		self._account = None
+		self._bank = None
+
+		argc = len(args)
+
+		if argc > 2:
+			self.address = args[2]
+		else:
+			self.address = kwargs.get('address', "")
+
+		if argc > 3:
+			self.phoneNum = args[3]
+		else:
+			self.phoneNum = kwargs.get('phoneNum', "")
+
+	@property
+	def address_property(self):
+		return self.address
+
+	@address_property.setter
+	def address_property(self, arg_address):
+		self.address = arg_address
+
+	@property
+	def phoneNum_property(self):
+		return self.phoneNum
+
+	@phoneNum_property.setter
+	def phoneNum_property(self, arg_phoneNum):
+		self.phoneNum = arg_phoneNum
+
+	@property
+	def account(self):
+		return self._account
+
+	@account.setter
+	def account(self, arg_account):
+		self._account = arg_account
+
+	@property
+	def bank(self):
+		return self._bank
+
+	@bank.setter
+	def bank(self, arg_bank):
+		self._bank = arg_bank
+
+	def __members(self):
+		return (*Person.__members(self), self.address, self.phoneNum,)
+
+	def __eq__(self, other):
+		if type(other) is type(self):
+			return self.__members() == other.__members()
+		return False
+
+	def __hash__(self):
+		return hash(self.__members())
+
+	def __str__(self):
+		return f"Customer {{{Person.__str__(self)}, address={self.address}, phoneNum={self.phoneNum}}}"
+
+	def generalInquiry(self):
+		# Todo: implement this method!
+		return False
+
+	def depositMoney(self):
+		# Todo: implement this method!
+		return False
+
+	def withdrawMoney(self):
+		# Todo: implement this method!
+		return False
+
+	def openAccount(self):
+		# Todo: implement this method!
+		return None
+
+	def closeAccount(self):
+		# Todo: implement this method!
+		return None
+
+	def applyForLoan(self):
+		# Todo: implement this method!
+		return False
+
+	def requestCard(self):
+		# Todo: implement this method!
+		return False
+
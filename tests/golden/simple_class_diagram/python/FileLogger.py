@@ -0,0 +1,61 @@
+from Logger import Logger
+
+
+class FileLogger(Logger):
+
+	def __init__(self, *args, **kwargs):
+
+		argc = len(args)
+
+		if argc > 0:
+			self.filePath = args[0]
+		else:
+			self.filePath = kwargs.get('filePath', "")
+
+	@property
+	def filePath_property(self):
+		return self.filePath
+
+	@filePath_property.setter
+	def filePath_property(self, arg_filePath):
+		self.filePath = arg_filePath
+
+	def __members(self):
+		return (self.filePath,)
+
+	def __eq__(self, other):
+		if type(other) is type(self):
+			return self.__members() == other.__members()
+		return False
+
+	def __hash__(self):
+		return hash(self.__members())
+
+	def __str__(self):
+		return f"FileLogger {{filePath={self.filePath}}}"
+
+	def rotateFile(self):
+		# Todo: implement this method!
+		pass
+
+	@staticmethod
+	def getRotationHistory():
+		# Todo: implement this method!
+		return None
+
+	def debug(self, arg0):
+		# Todo: implement this method!
+		pass
+
+	def info(self, arg0):
+		# Todo: implement this method!
+		pass
+
+	def warning(self, arg0):
+		# Todo: implement this method!
+		pass
+
+	def error(self, arg0):
+		# Todo: implement this method!
+		pass
+
@@ -0,0 +1,7 @@
+from enum import Enum, auto
+
+
+class Gender(Enum):
+	MALE = auto()
+	FEMALE = auto()
+
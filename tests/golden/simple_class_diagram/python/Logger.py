@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+
+
+class Logger(ABC):
+	def __init__(self, *args, **kwargs):
+		pass
+
+	@abstractmethod
+	def debug(self, arg0):
+		pass
+
+	@abstractmethod
+	def info(self, arg0):
+		pass
+
+	@abstractmethod
+	def warning(self, arg0):
+		pass
+
+	@abstractmethod
+	def error(self, arg0):
+		pass
+
@@ -0,0 +1,85 @@
+from Account import Account
+from Gender import Gender
+from abc import ABC, abstractmethod
+
+
+class Person(ABC):
+
+	def __init__(self, *args, **kwargs):
+
+		argc = len(args)
+
+		if argc > 0:
+			self.id = args[0]
+		else:
+			self.id = kwargs.get('id', 0)
+
+		if argc > 1:
+			self.name = args[1]
+		else:
+			self.name = kwargs.get('name', "")
+
+		if argc > 2:
+			self.gender = args[2]
+		else:
+			self.gender = kwargs.get('gender', None)
+
+		if argc > 3:
+			self.birthDate = args[3]
+		else:
+			self.birthDate = kwargs.get('birthDate', None)
+
+	@property
+	def id_property(self):
+		return self.id
+
+	@id_property.setter
+	def id_property(self, arg_id):
+		self.id = arg_id
+
+	@property
+	def name_property(self):
+		return self.name
+
+	@name_property.setter
+	def name_property(self, arg_name):
+		self.name = arg_name
+
+	@property
+	def gender_property(self):
+		return self.gender
+
+	@gender_property.setter
+	def gender_property(self, arg_gender):
+		self.gender = arg_gender
+
+	@property
+	def birthDate_property(self):
+		return self.birthDate
+
+	@birthDate_property.setter
+	def birthDate_property(self, arg_birthDate):
+		self.birthDate = arg_birthDate
+
+	def __members(self):
+		return (self.id, self.name, self.gender, self.birthDate,)
+
+	def __eq__(self, other):
+		if type(other) is type(self):
+			return self.__members() == other.__members()
+		return False
+
+	def __hash__(self):
+		return hash(self.__members())
+
+	def __str__(self):
+		return f"Person {{id={self.id}, name={self.name}, gender={self.gender}, birthDate={self.birthDate}}}"
+
+	@abstractmethod
+	def openAccount(self):
+		pass
+
+	@abstractmethod
+	def closeAccount(self):
+		pass
+
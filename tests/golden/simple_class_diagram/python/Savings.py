@@ -0,0 +1,38 @@
+from Account import Account
+
+
+class Savings(Account):
+	MIN_INTEREST = .33
+
+	def __init__(self, *args, **kwargs):
+		Account.__init__(self, args, kwargs)
+
+		argc = len(args)
+
+		if argc > 0:
+			self.interestPay = args[0]
+		else:
+			self.interestPay = kwargs.get('interestPay', 0)
+
+	@property
+	def interestPay_property(self):
+		return self.interestPay
+
+	@interestPay_property.setter
+	def interestPay_property(self, arg_interestPay):
+		self.interestPay = arg_interestPay
+
+	def __members(self):
+		return (*Account.__members(self), self.interestPay,)
+
+	def __eq__(self, other):
+		if type(other) is type(self):
+			return self.__members() == other.__members()
+		return False
+
+	def __hash__(self):
+		return hash(self.__members())
+
+	def __str__(self):
+		return f"Savings {{{Account.__str__(self)}, interestPay={self.interestPay}}}"
+
@@ -0,0 +1,59 @@
+from Account import Account
+from Bank import Bank
+from Person import Person
+
+
+class Teller(Person):
+
+	def __init__(self, *args, **kwargs):
+		Person.__init__(self, args, kwargs)
+		self._bank = None
+
+		argc = len(args)
+
+	@property
+	def bank(self):
+		return self._bank
+
+	@bank.setter
+	def bank(self, arg_bank):
+		self._bank = arg_bank
+
+	def __members(self):
+		return (*Person.__members(self),)
+
+	def __eq__(self, other):
+		if type(other) is type(self):
+			return self.__members() == other.__members()
+		return False
+
+	def __hash__(self):
+		return hash(self.__members())
+
+	def __str__(self):
+		return f"Teller {{{Person.__str__(self)}}}"
+
+	def collectMoney(self):
+		# Todo: implement this method!
+		return False
+
+	def openAccount(self):
+		# Todo: implement this method!
+		return None
+
+	def closeAccount(self):
+		# Todo: implement this method!
+		return None
+
+	def loanRequest(self):
+		# Todo: implement this method!
+		return False
+
+	def provideInfo(self):
+		# Todo: implement this method!
+		pass
+
+	def issueCard(self):
+		# Todo: implement this method!
+		return False
+
@@ -0,0 +1,71 @@
+\c example;
+
+-- CUSTOM TYPES:
+
+create type Gender as enum('MALE', 'FEMALE');
+
+-- TABLES:
+
+CREATE TABLE "Account" (
+	"id" serial,
+	"number" character varying(255) not null,
+	"createdAt" datetime,
+	"locked" boolean default false,
+	constraint "pk_Account" primary key ("id"),
+	constraint "un_Account_number" unique ("number")
+);
+
+CREATE TABLE "Person" (
+	"id" serial,
+	"name" character varying(255) not null,
+	"gender" Gender,
+	"birthDate" date,
+	constraint "pk_Person" primary key ("id")
+);
+
+CREATE TABLE "Customer" (
+	"id" integer not null,
+	"address" character varying(255),
+	"phoneNum" character varying(255),
+	"account_id" integer,
+	"bankId" uuid,
+	constraint "pk_Customer" primary key ("id"),
+	constraint "un_Customer_phoneNum" unique ("phoneNum")
+);
+
+CREATE TABLE "Checking" (
+	"id" integer not null,
+	"interestCost" double precision,
+	"cardNumber" character varying(255),
+	constraint "pk_Checking" primary key ("id"),
+	constraint "ch_Checking_interestCost1" check ("interestCost" >= 0)
+);
+
+CREATE TABLE "Savings" (
+	"id" integer not null,
+	"interestPay" double precision,
+	constraint "pk_Savings" primary key ("id"),
+	constraint "ch_Savings_interestPay1" check ("interestPay" >= 0)
+);
+
+CREATE TABLE "Bank" (
+	"bankId" uuid,
+	"name" character varying(255) not null,
+	"address" text,
+	"website" character varying(255),
+	constraint "pk_Bank" primary key ("bankId")
+);
+
+CREATE TABLE "FileLogger" (
+	"id" serial,
+	"filePath" character varying(255),
+	constraint "pk_FileLogger" primary key (id)
+);
+
+-- FOREIGN KEYS:
+
+alter table "Customer" add constraint "fk_Customer_Person" foreign key ("id") references "Person" ("id") on delete cascade;
+alter table "Customer" add constraint "fk_Customer_Account" foreign key ("account_id") references "Account" ("id");
+alter table "Customer" add constraint "fk_Customer_Bank" foreign key ("bankId") references "Bank" ("bankId");
+alter table "Checking" add constraint "fk_Checking_Account" foreign key ("id") references "Account" ("id") on delete cascade;
+alter table "Savings" add constraint "fk_Savings_Account" foreign key ("id") references "Account" ("id") on delete cascade;
@@ -0,0 +1,61 @@
+import { Customer } from './Customer.ts';
+
+export class Account {
+	private id?: number;
+	private number?: string;
+	private createdAt?: Date;
+	private locked?: boolean = false;
+	private _customers: Customer[] = [];
+
+	public constructor(id?: number, number?: string, createdAt?: Date, locked?: boolean) {
+		this.id = id;
+		this.number = number;
+		this.createdAt = createdAt;
+		this.locked = locked;
+	}
+
+	public get idProperty(): number {
+		return this.id!;
+	}
+
+	public set idProperty(argId: number) {
+		this.id = argId;
+	}
+
+	public get numberProperty(): string {
+		return this.number!;
+	}
+
+	public set numberProperty(argNumber: string) {
+		this.number = argNumber;
+	}
+
+	public get createdAtProperty(): Date {
+		return this.createdAt!;
+	}
+
+	public set createdAtProperty(argCreatedat: Date) {
+		this.createdAt = argCreatedat;
+	}
+
+	public get lockedProperty(): boolean {
+		return this.locked!;
+	}
+
+	public set lockedProperty(argLocked: boolean) {
+		this.locked = argLocked;
+	}
+
+	public get customers(): Customer[] {
+		return this._customers;
+	}
+
+	public set customers(argCustomers: Customer[]) {
+		this._customers = argCustomers;
+	}
+
+	public toString(): string {
+		return `Account \{id=${this.id}, number=${this.number}, createdAt=${this.createdAt}, locked=${this.locked}\}`;
+	}
+
+}
@@ -0,0 +1,71 @@
+import { Customer } from './Customer.ts';
+import { Teller } from './Teller.ts';
+
+export class Bank {
+	private bankId?: string;
+	private name?: string;
+	private address?: string;
+	private website?: string;
+	private _tellers: Teller[] = [];
+	private _customers: Customer[] = [];
+
+	public constructor(bankId?: string, name?: string, address?: string, website?: string) {
+		this.bankId = bankId;
+		this.name = name;
+		this.address = address;
+		this.website = website;
+	}
+
+	public get bankIdProperty(): string {
+		return this.bankId!;
+	}
+
+	public set bankIdProperty(argBankid: string) {
+		this.bankId = argBankid;
+	}
+
+	public get nameProperty(): string {
+		return this.name!;
+	}
+
+	public set nameProperty(argName: string) {
+		this.name = argName;
+	}
+
+	public get addressProperty(): string {
+		return this.address!;
+	}
+
+	public set addressProperty(argAddress: string) {
+		this.address = argAddress;
+	}
+
+	public get websiteProperty(): string {
+		return this.website!;
+	}
+
+	public set websiteProperty(argWebsite: string) {
+		this.website = argWebsite;
+	}
+
+	public get tellers(): Teller[] {
+		return this._tellers;
+	}
+
+	public set tellers(argTellers: Teller[]) {
+		this._tellers = argTellers;
+	}
+
+	public get customers(): Customer[] {
+		return this._customers;
+	}
+
+	public set customers(argCustomers: Customer[]) {
+		this._customers = argCustomers;
+	}
+
+	public toString(): string {
+		return `Bank \{bankId=${this.bankId}, name=${this.name}, address=${this.address}, website=${this.website}\}`;
+	}
+
+}
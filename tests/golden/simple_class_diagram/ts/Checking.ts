@@ -0,0 +1,37 @@
+import { Account } from './Account.ts';
+
+export class Checking extends Account {
+	private interestCost?: number;
+	private cardNumber?: string;
+
+	public constructor(id?: number,
+			number?: string,
+			createdAt?: Date,
+			locked?: boolean, interestCost?: number,
+			cardNumber?: string) {
+		super(id, number, createdAt, locked);
+		this.interestCost = interestCost;
+		this.cardNumber = cardNumber;
+	}
+
+	public get interestCostProperty(): number {
+		return this.interestCost!;
+	}
+
+	public set interestCostProperty(argInterestcost: number) {
+		this.interestCost = argInterestcost;
+	}
+
+	public get cardNumberProperty(): string {
+		return this.cardNumber!;
+	}
+
+	public set cardNumberProperty(argCardnumber: string) {
+		this.cardNumber = argCardnumber;
+	}
+
+	public toString(): string {
+		return `Checking \{${super.toString()}, interestCost=${this.interestCost}, cardNumber=${this.cardNumber}\}`;
+	}
+
+}
@@ -0,0 +1,21 @@
+import { Logger } from './Logger.ts';
+
+export class ConsoleLogger implements Logger {
+
+	public debug(arg0: string): void {
+		// Todo: implement this method!
+	}
+
+	public info(arg0: string): void {
+		// Todo: implement this method!
+	}
+
+	public warning(arg0: string): void {
+		// Todo: implement this method!
+	}
+
+	public error(arg0: string): void {
+		// Todo: implement this method!
+	}
+
+}
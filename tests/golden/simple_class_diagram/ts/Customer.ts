@@ -0,0 +1,92 @@
+import { Account } from './Account.ts';
+import { Bank } from './Bank.ts';
+import { Person } from './Person.ts';
+
+export class Customer extends Person {
+	private address?: string;
+	private phoneNum?: string;
+	private _account: Account;
+	private _bank: Bank;
+
+	public constructor(id?: number,
+			name?: string,
+			gender?: Gender,
+			birthDate?: Date, address?: string,
+			phoneNum?: string) {
+		super(id, name, gender, birthDate);
+		this.address = address;
+		this.phoneNum = phoneNum;
+	}
+
+	public get addressProperty(): string {
+		return this.address!;
+	}
+
+	public set addressProperty(argAddress: string) {
+		this.address = argAddress;
+	}
+
+	public get phoneNumProperty(): string {
+		return this.phoneNum!;
+	}
+
+	public set phoneNumProperty(argPhonenum: string) {
+		this.phoneNum = argPhonenum;
+	}
+
+	public get account(): Account {
+		return this._account;
+	}
+
+	public set account(argAccount: Account) {
+		this._account = argAccount;
+	}
+
+	public get bank(): Bank {
+		return this._bank;
+	}
+
+	public set bank(argBank: Bank) {
+		this._bank = argBank;
+	}
+
+	public toString(): string {
+		return `Customer \{${super.toString()}, address=${this.address}, phoneNum=${this.phoneNum}\}`;
+	}
+
+	public generalInquiry(): boolean {
+		// Todo: implement this method!
+		return false;
+	}
+
+	public depositMoney(): boolean {
+		// Todo: implement this method!
+		return false;
+	}
+
+	public withdrawMoney(): boolean {
+		// Todo: implement this method!
+		return false;
+	}
+
+	public openAccount(): Account {
+		// Todo: implement this method!
+		return new Account();
+	}
+
+	public closeAccount(): Account {
+		// Todo: implement this method!
+		return new Account();
+	}
+
+	public applyForLoan(): boolean {
+		// Todo: implement this method!
+		return false;
+	}
+
+	public requestCard(): boolean {
+		// Todo: implement this method!
+		return false;
+	}
+
+}
@@ -0,0 +1,47 @@
+import { Logger } from './Logger.ts';
+
+export class FileLogger implements Logger {
+	private filePath?: string;
+
+	public constructor(filePath?: string) {
+		this.filePath = filePath;
+	}
+
+	public get filePathProperty(): string {
+		return this.filePath!;
+	}
+
+	public set filePathProperty(argFilepath: string) {
+		this.filePath = argFilepath;
+	}
+
+	public toString(): string {
+		return `FileLogger \{filePath=${this.filePath}\}`;
+	}
+
+	public rotateFile(): void {
+		// Todo: implement this method!
+	}
+
+	public static getRotationHistory(): String[] {
+		// Todo: implement this method!
+		return [];
+	}
+
+	public debug(arg0: string): void {
+		// Todo: implement this method!
+	}
+
+	public info(arg0: string): void {
+		// Todo: implement this method!
+	}
+
+	public warning(arg0: string): void {
+		// Todo: implement this method!
+	}
+
+	public error(arg0: string): void {
+		// Todo: implement this method!
+	}
+
+}
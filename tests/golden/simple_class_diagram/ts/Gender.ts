@@ -0,0 +1,4 @@
+export enum Gender {
+	MALE,
+	FEMALE
+}
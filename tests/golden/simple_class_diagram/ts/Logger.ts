@@ -0,0 +1,11 @@
+export interface Logger {
+
+	debug(arg0: string): void;
+
+	info(arg0: string): void;
+
+	warning(arg0: string): void;
+
+	error(arg0: string): void;
+
+}
@@ -0,0 +1,57 @@
+import { Account } from './Account.ts';
+import { Gender } from './Gender.ts';
+
+export abstract class Person {
+	private id?: number;
+	private name?: string;
+	private gender?: Gender;
+	private birthDate?: Date;
+
+	public constructor(id?: number, name?: string, gender?: Gender, birthDate?: Date) {
+		this.id = id;
+		this.name = name;
+		this.gender = gender;
+		this.birthDate = birthDate;
+	}
+
+	public get idProperty(): number {
+		return this.id!;
+	}
+
+	public set idProperty(argId: number) {
+		this.id = argId;
+	}
+
+	public get nameProperty(): string {
+		return this.name!;
+	}
+
+	public set nameProperty(argName: string) {
+		this.name = argName;
+	}
+
+	public get genderProperty(): Gender {
+		return this.gender!;
+	}
+
+	public set genderProperty(argGender: Gender) {
+		this.gender = argGender;
+	}
+
+	public get birthDateProperty(): Date {
+		return this.birthDate!;
+	}
+
+	public set birthDateProperty(argBirthdate: Date) {
+		this.birthDate = argBirthdate;
+	}
+
+	public toString(): string {
+		return `Person \{id=${this.id}, name=${this.name}, gender=${this.gender}, birthDate=${this.birthDate}\}`;
+	}
+
+	public abstract openAccount(): Account;
+
+	public abstract closeAccount(): Account;
+
+}
@@ -0,0 +1,27 @@
+import { Account } from './Account.ts';
+
+export class Savings extends Account {
+	public static readonly MIN_INTEREST?: number = .33;
+	private interestPay?: number;
+
+	public constructor(id?: number,
+			number?: string,
+			createdAt?: Date,
+			locked?: boolean, interestPay?: number) {
+		super(id, number, createdAt, locked);
+		this.interestPay = interestPay;
+	}
+
+	public get interestPayProperty(): number {
+		return this.interestPay!;
+	}
+
+	public set interestPayProperty(argInterestpay: number) {
+		this.interestPay = argInterestpay;
+	}
+
+	public toString(): string {
+		return `Savings \{${super.toString()}, interestPay=${this.interestPay}\}`;
+	}
+
+}
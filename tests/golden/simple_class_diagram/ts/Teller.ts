@@ -0,0 +1,54 @@
+import { Account } from './Account.ts';
+import { Bank } from './Bank.ts';
+import { Person } from './Person.ts';
+
+export class Teller extends Person {
+	private _bank: Bank;
+
+	public constructor(id?: number, name?: string, gender?: Gender, birthDate?: Date) {
+		super(id, name, gender, birthDate);
+
+	}
+
+	public get bank(): Bank {
+		return this._bank;
+	}
+
+	public set bank(argBank: Bank) {
+		this._bank = argBank;
+	}
+
+	public toString(): string {
+		return `Teller \{${super.toString()}\}`;
+	}
+
+	public collectMoney(): boolean {
+		// Todo: implement this method!
+		return false;
+	}
+
+	public openAccount(): Account {
+		// Todo: implement this method!
+		return new Account();
+	}
+
+	public closeAccount(): Account {
+		// Todo: implement this method!
+		return new Account();
+	}
+
+	public loanRequest(): boolean {
+		// Todo: implement this method!
+		return false;
+	}
+
+	public provideInfo(): void {
+		// Todo: implement this method!
+	}
+
+	public issueCard(): boolean {
+		// Todo: implement this method!
+		return false;
+	}
+
+}
@@ -0,0 +1,58 @@
+import unittest
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from tempfile import TemporaryDirectory
+
+from generators.code_generation import CodeGeneration
+from generators.code_generators import CodeGenerators
+from parsers.diagram_parser import DiagramParser
+from parsers.syntax_model import SyntaxModel
+from tests.test_golden import golden_options, read_sources
+
+
+ROOT_DIR = path.dirname(path.dirname(path.abspath(__file__)))
+EXAMPLE_PATH = path.join(ROOT_DIR, "examples", "simple_class_diagram.drawio")
+
+
+class CodeGeneratorTest(unittest.TestCase):
+    def generate(self, syntax_tree, options):
+        sources = {}
+
+        with TemporaryDirectory() as output_dir:
+            for language in CodeGenerators.LANGUAGE_NAMES:
+                code_gen = CodeGenerators.get(language, syntax_tree, path.join(output_dir, language), options)
+
+                with redirect_stdout(StringIO()):
+                    code_gen.generate_code()
+
+                self.assertEqual([str(d) for d in code_gen.diagnostics], [], language)
+                sources[language] = read_sources(path.join(output_dir, language))
+
+        return sources
+
+    def test_associations_with_enums_only_use_them(self):
+        with redirect_stdout(StringIO()):
+            syntax_tree = dict(DiagramParser(EXAMPLE_PATH).convert_to_syntax_model())
+
+        class_ids = {class_def['name']: class_id for class_id, class_def in syntax_tree.items()}
+        person_id, gender_id = class_ids["Person"], class_ids["Gender"]
+
+        # Person already holds a Gender property, the association only draws it
+        for kind in ('association', 'aggregation', 'composition'):
+            with self.subTest(kind=kind):
+                associated_tree = dict(syntax_tree)
+
+                for class_id, reference in ((person_id, ('to', gender_id)), (gender_id, ('from', person_id))):
+                    relationships = {**syntax_tree[class_id]['relationships']}
+                    relationships[kind] = [*relationships[kind], reference]
+                    associated_tree[class_id] = {**syntax_tree[class_id], 'relationships': relationships}
+
+                for options in (golden_options(), CodeGeneration.default_options()):
+                    self.assertEqual(self.generate(SyntaxModel(associated_tree), options),
+                                     self.generate(SyntaxModel(syntax_tree), options))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import base64
+import unittest
+import zlib
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from tempfile import TemporaryDirectory
+from urllib.parse import quote
+
+from decode.convert_to_readable import DecodeAndDecompress
+from parsers.diagram_parser import DiagramParser
+
+
+ROOT_DIR = path.dirname(path.dirname(path.abspath(__file__)))
+EXAMPLE_PATH = path.join(ROOT_DIR, "examples", "simple_class_diagram.drawio")
+
+
+def compress_page(xml):
+    """ Encode a page the way draw.io does, url-encoded, deflated without header and base64-encoded """
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    return base64.b64encode(compressor.compress(quote(xml, safe="~()*!.'").encode()) + compressor.flush()).decode()
+
+
+class DecodeTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+        self.page_xml = "".join(decoded_xml for _, _, decoded_xml in DecodeAndDecompress.iter_pages(EXAMPLE_PATH))
+
+    def write_diagram(self, name, page_text):
+        diagram_path = path.join(self.temp_dir, name)
+
+        with open(diagram_path, "w", encoding="utf8") as f:
+            f.write(f'<mxfile><diagram name="Page-1" id="p1">{page_text}</diagram></mxfile>')
+
+        return diagram_path
+
+    @staticmethod
+    def parse(diagram_path):
+        with redirect_stdout(StringIO()):
+            return DiagramParser(diagram_path).convert_to_syntax_tree()
+
+    def test_compressed_page_round_trip(self):
+        # non-ascii labels, so multibyte characters and their escapes are split across chunks
+        page_xml = self.page_xml.replace('value="Bank"', 'value="Banque générale €"')
+        tag_text = compress_page(page_xml)
+
+        self.assertTrue(DecodeAndDecompress.is_compressed(tag_text))
+        self.assertEqual(DecodeAndDecompress.decode_tag_text(tag_text), page_xml)
+
+        for chunk_size in (4, 7, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                chunks = DecodeAndDecompress.iter_decoded_chunks(tag_text, chunk_size=chunk_size)
+                self.assertEqual("".join(chunks), page_xml)
+
+    def test_compressed_and_uncompressed_pages_parse_alike(self):
+        uncompressed_path = self.write_diagram("uncompressed.drawio", self.page_xml)
+        compressed_path = self.write_diagram("compressed.drawio", compress_page(self.page_xml))
+
+        (_, _, uncompressed_xml), = DecodeAndDecompress.iter_pages(uncompressed_path)
+        (_, _, compressed_xml), = DecodeAndDecompress.iter_pages(compressed_path)
+
+        self.assertFalse(DecodeAndDecompress.is_compressed(self.page_xml))
+        self.assertEqual(compressed_xml, self.page_xml)
+        self.assertEqual(uncompressed_xml, self.page_xml)
+
+        example_tree = self.parse(EXAMPLE_PATH)
+        self.assertEqual(self.parse(uncompressed_path), example_tree)
+        self.assertEqual(self.parse(compressed_path), example_tree)
+
+
+if __name__ == "__main__":
+    unittest.main()
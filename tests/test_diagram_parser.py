@@ -0,0 +1,76 @@
+import base64
+import unittest
+import zlib
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from tempfile import TemporaryDirectory
+from urllib.parse import quote
+
+from decode.convert_to_readable import DecodeAndDecompress
+from parsers.diagram_parser import DiagramParser
+
+
+ROOT_DIR = path.dirname(path.dirname(path.abspath(__file__)))
+EXAMPLE_PATH = path.join(ROOT_DIR, "examples", "simple_class_diagram.drawio")
+
+
+def compress_page(xml):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    return base64.b64encode(compressor.compress(quote(xml).encode()) + compressor.flush()).decode()
+
+
+class DiagramParserTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.diagram_path = path.join(temp_dir.name, "diagram.drawio")
+
+    def parse(self, diagram, **kwargs):
+        with open(self.diagram_path, "w") as f:
+            f.write(diagram)
+
+        diagram_parser = DiagramParser(self.diagram_path, **kwargs)
+
+        with redirect_stdout(StringIO()):
+            syntax_tree = diagram_parser.convert_to_syntax_tree()
+
+        return diagram_parser, syntax_tree
+
+    def test_malformed_page_is_only_reported_once(self):
+        page = compress_page('<mxGraphModel><root><mxCell id="0"/><mxCell id="1" parent="0"></root></mxGraphModel>')
+        diagram = f'<mxfile><diagram name="Page-1" id="p1">{page}</diagram></mxfile>'
+
+        for keep_style_trees, stage in ((True, "style"), (False, "syntax")):
+            with self.subTest(keep_style_trees=keep_style_trees):
+                diagram_parser, syntax_tree = self.parse(diagram, keep_style_trees=keep_style_trees)
+
+                self.assertEqual(syntax_tree, {})
+                self.assertEqual(diagram_parser.style_trees, {})
+                self.assertEqual([d.stage for d in diagram_parser.diagnostics], [stage])
+                self.assertIn("XMLSyntaxError", diagram_parser.diagnostics.entries[0].message)
+
+    def test_pages_without_id_keep_their_classes_apart(self):
+        page_xml = "".join(decoded_xml for _, _, decoded_xml in DecodeAndDecompress.iter_pages(EXAMPLE_PATH))
+        page = f'<diagram name="Page-1">{page_xml}</diagram>'
+
+        example_tree = self.parse(f"<mxfile>{page}</mxfile>")[1]
+        diagram_parser, syntax_tree = self.parse(f"<mxfile>{page * 3}</mxfile>")
+
+        self.assertEqual(diagram_parser.diagnostics.entries, [])
+        self.assertEqual(list(diagram_parser.style_trees), ["Page-1 [0]", "Page-1 [1]", "Page-1 [2]"])
+        self.assertEqual(list(syntax_tree), [*example_tree, *(f"1:{class_id}" for class_id in example_tree),
+                                             *(f"2:{class_id}" for class_id in example_tree)])
+
+        # the relationships of a renamed class point at the classes of its own page
+        for class_id, class_def in example_tree.items():
+            relationships = syntax_tree[f"2:{class_id}"]['relationships']
+
+            self.assertEqual(relationships['extends'], [f"2:{r}" for r in class_def['relationships']['extends']])
+            self.assertEqual(relationships['association'],
+                             [(r[0], f"2:{r[1]}") for r in class_def['relationships']['association']])
+
+
+if __name__ == "__main__":
+    unittest.main()
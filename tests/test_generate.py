@@ -0,0 +1,127 @@
+import json
+import unittest
+
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from os import path
+from tempfile import TemporaryDirectory
+
+from generate import main, read_options
+
+
+ROOT_DIR = path.dirname(path.dirname(path.abspath(__file__)))
+EXAMPLE_PATH = path.join(ROOT_DIR, "examples", "simple_class_diagram.drawio")
+
+
+class GenerateOptionsTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.options_path = path.join(temp_dir.name, "options.json")
+
+    def write_options(self, options):
+        with open(self.options_path, "w") as f:
+            f.write(options if isinstance(options, str) else json.dumps(options))
+
+    def test_options_are_merged_over_the_defaults(self):
+        self.write_options({
+            'generate': {'to_string': True},
+            'language_specific': {'java': {'use_lombok': True}},
+            'relationship_rules': [{'startArrow': "diamond", 'endArrow': "open", 'kind': "composition"}],
+        })
+
+        options = read_options(self.options_path)
+
+        self.assertTrue(options['generate']['to_string'])
+        self.assertFalse(options['generate']['equal_hashcode'])
+        self.assertTrue(options['language_specific']['java']['use_lombok'])
+        self.assertEqual(options['language_specific']['java']['temporal_types'], "java8_local")
+
+    def test_invalid_options_are_rejected(self):
+        for options in ('{bad', [], {'unknown': 1}, {'language_specific': {'rust': {}}},
+                        {'language_specific': {'java': []}}, {'generate': {'unknown': True}}, {'parse_workers': 0},
+                        {'relationship_rules': {"none|open": "association"}}, {'relationship_rules': ["none"]}):
+            with self.subTest(options=options):
+                self.write_options(options)
+
+                with self.assertRaises(ValueError):
+                    read_options(self.options_path)
+
+    def test_invalid_options_exit_with_a_usage_error(self):
+        self.write_options({'language_specific': {'rust': {}}})
+
+        with redirect_stderr(StringIO()) as stderr, self.assertRaises(SystemExit) as exit_context:
+            main([EXAMPLE_PATH, "--options", self.options_path])
+
+        self.assertEqual(exit_context.exception.code, 2)
+        self.assertIn("unknown language 'rust'", stderr.getvalue())
+
+    def test_unknown_language_exits_with_a_usage_error(self):
+        with redirect_stderr(StringIO()) as stderr, self.assertRaises(SystemExit) as exit_context:
+            main([EXAMPLE_PATH, "-l", "java", "-l", "klingon"])
+
+        self.assertEqual(exit_context.exception.code, 2)
+        self.assertIn("unknown language 'klingon', expected one of java, c#, cs", stderr.getvalue())
+
+
+class GenerateDiagramTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+
+    def run_main(self, diagram, *args):
+        diagram_path = path.join(self.temp_dir, "diagram.drawio")
+
+        with open(diagram_path, "w") as f:
+            f.write(diagram)
+
+        with redirect_stdout(StringIO()), redirect_stderr(StringIO()) as stderr:
+            exit_code = main([diagram_path, "-o", path.join(self.temp_dir, "src"), *args])
+
+        return exit_code, stderr.getvalue()
+
+    def test_example_is_generated(self):
+        with open(EXAMPLE_PATH) as f:
+            exit_code, stderr = self.run_main(f.read(), "-l", "java", "-w", "1")
+
+        self.assertEqual((exit_code, stderr), (0, ""))
+        self.assertTrue(path.isfile(path.join(self.temp_dir, "src", "Person.java")))
+
+    def test_snapshot_skips_parsing_an_unchanged_diagram(self):
+        snapshot_dir = path.join(self.temp_dir, "snapshots")
+        args = [EXAMPLE_PATH, "-o", path.join(self.temp_dir, "src"), "-l", "java", "-w", "1",
+                "--snapshot-dir", snapshot_dir]
+
+        for snapshot_loaded in (False, True):
+            with redirect_stdout(StringIO()) as stdout, redirect_stderr(StringIO()) as stderr:
+                exit_code = main(args)
+
+            self.assertEqual((exit_code, stderr.getvalue()), (0, ""))
+            self.assertEqual("<<< SYNTAX SNAPSHOT LOADED >>>" in stdout.getvalue(), snapshot_loaded)
+            self.assertTrue(path.isfile(path.join(self.temp_dir, "src", "Person.java")))
+
+    def test_unreadable_diagrams_fail_with_a_message(self):
+        for diagram, message in (('<mxfile><diagram name="a">', "Failed to decode the diagram"),
+                                 ('<mxfile><diagram name="a">!!!</diagram></mxfile>', "No class found"),
+                                 ('<mxfile></mxfile>', "No class found")):
+            with self.subTest(diagram=diagram):
+                exit_code, stderr = self.run_main(diagram, "-l", "java")
+
+                self.assertEqual(exit_code, 1)
+                self.assertIn(message, stderr)
+
+    def test_problems_fail_fast(self):
+        options_path = path.join(self.temp_dir, "options.json")
+
+        with open(options_path, "w") as f:
+            json.dump({'fail_fast': True}, f)
+
+        exit_code, stderr = self.run_main('<mxfile><diagram name="a">!!!</diagram></mxfile>', "--options", options_path)
+
+        self.assertEqual(exit_code, 1)
+        self.assertIn("Problem found in the diagram: [syntax] ValueError: Malformed diagram", stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+
+from lxml import etree
+
+from decode.convert_to_readable import DecodeAndDecompress
+from parsers.incremental_parser import IncrementalParser
+from parsers.style_parser import StyleParser
+from parsers.syntax_parser import SyntaxParser
+
+
+ROOT_DIR = path.dirname(path.dirname(path.abspath(__file__)))
+EXAMPLE_PATH = path.join(ROOT_DIR, "examples", "simple_class_diagram.drawio")
+
+TELLER_ID = "zkfFHV4jXpPFQw0GAbJ--0"
+CUSTOMER_ID = "2JxM8UlmAFkqMBroLjRq-34"
+CONSOLE_LOGGER_ID = "cBqTgom66K0gsBAUJd20-0"
+
+
+class IncrementalParserTest(unittest.TestCase):
+    def setUp(self):
+        self.page_xml = "".join(decoded_xml for _, _, decoded_xml in DecodeAndDecompress.iter_pages(EXAMPLE_PATH))
+        self.incremental_parser = IncrementalParser()
+
+        with redirect_stdout(StringIO()):
+            self.incremental_parser.update(self.page_xml)
+
+    @staticmethod
+    def full_parse(di_xml):
+        style_parser = StyleParser(di_xml)
+        syntax_parser = SyntaxParser(style_parser.convert_to_style_tree(), diagnostics=style_parser.diagnostics)
+        return syntax_parser.convert_to_syntax_tree(), [str(d) for d in style_parser.diagnostics]
+
+    def edit(self, edit_root):
+        root = etree.fromstring(self.page_xml)
+        edit_root(root.find("root"), {cell.get("id"): cell for cell in root.iter("mxCell")})
+        return etree.tostring(root, encoding="unicode")
+
+    def update(self, di_xml):
+        """ Update the parser, check it against a full parse, and return the names of the dirty classes """
+
+        previous_tree = self.incremental_parser.syntax_tree
+        class_names = {class_id: class_def['name'] for class_id, class_def in previous_tree.items()}
+
+        with redirect_stdout(StringIO()):
+            dirty_class_ids = self.incremental_parser.update(di_xml)
+            syntax_tree, diagnostics = self.full_parse(di_xml)
+
+        self.assertEqual(self.incremental_parser.syntax_tree, syntax_tree)
+        self.assertEqual([str(d) for d in self.incremental_parser.diagnostics], diagnostics)
+        self.assertEqual(self.incremental_parser.diagnostics.entries, [])
+        self.page_xml = di_xml
+
+        class_names.update((class_id, class_def['name']) for class_id, class_def in syntax_tree.items())
+        return {class_names[class_id] for class_id in dirty_class_ids}
+
+    def teller_methods(self):
+        return [method['name'] for method in self.incremental_parser.syntax_tree[TELLER_ID]['methods'].values()]
+
+    def test_unchanged_page(self):
+        self.assertEqual(self.update(self.page_xml), set())
+
+    def test_member_change(self):
+        page_xml = self.page_xml.replace("collectMoney: boolean", "collectMoney: int")
+
+        self.assertEqual(self.update(page_xml), {"Teller"})
+
+    def test_member_add_and_delete(self):
+        def add_member(root, cells):
+            member = etree.Element("mxCell", id="t1", value="+ closeCard: boolean", style="text;", parent=TELLER_ID,
+                                   vertex="1")
+            cells["2JxM8UlmAFkqMBroLjRq-7"].addnext(member)
+
+        self.assertEqual(self.update(self.edit(add_member)), {"Teller"})
+        self.assertIn("closeCard", self.teller_methods())
+
+        self.assertEqual(self.update(self.edit(lambda root, cells: root.remove(cells["t1"]))), {"Teller"})
+        self.assertNotIn("closeCard", self.teller_methods())
+
+    def test_edge_add_and_delete(self):
+        def add_edge(root, cells):
+            root.append(etree.Element("mxCell", id="e1", value="", style="endArrow=none;html=1;",
+                                      parent="WIyWlLk6GJQsqaUBKTNV-1", source=TELLER_ID, target=CUSTOMER_ID, edge="1"))
+
+        self.assertEqual(self.update(self.edit(add_edge)), {"Teller", "Customer"})
+        self.assertEqual(self.update(self.edit(lambda root, cells: root.remove(cells["e1"]))), {"Teller", "Customer"})
+
+        # the Teller - Bank association of the example
+        self.assertEqual(self.update(self.edit(lambda root, cells: root.remove(cells["2JxM8UlmAFkqMBroLjRq-76"]))),
+                         {"Teller", "Bank"})
+
+    def test_class_delete(self):
+        def delete_class(root, cells):
+            for cell_id in (CONSOLE_LOGGER_ID, "cBqTgom66K0gsBAUJd20-2", "cBqTgom66K0gsBAUJd20-4"):
+                root.remove(cells[cell_id])
+
+        self.assertEqual(self.update(self.edit(delete_class)), {"ConsoleLogger"})
+        self.assertNotIn(CONSOLE_LOGGER_ID, self.incremental_parser.syntax_tree)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import json
+import subprocess
+import sys
+import unittest
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from tempfile import TemporaryDirectory
+
+from parsers.diagram_parser import DiagramParser
+from parsers.syntax_snapshot import SyntaxSnapshot
+
+
+ROOT_DIR = path.dirname(path.dirname(path.abspath(__file__)))
+EXAMPLE_PATH = path.join(ROOT_DIR, "examples", "simple_class_diagram.drawio")
+
+# run in a fresh interpreter, so the style parser is never imported
+SPAWN_SCRIPT = """
+import json, sys
+from multiprocessing import get_context
+from os import listdir, path
+from generators.code_generation import CodeGeneration
+from generators.code_generators import CodeGenerators
+from parsers.syntax_snapshot import SyntaxSnapshot
+
+if __name__ == "__main__":
+    diagram_path, snapshot_dir, output_dir = sys.argv[1:]
+    syntax_tree = SyntaxSnapshot(snapshot_dir).load(diagram_path)
+    results = {'style_parser_imported': 'parsers.style_parser' in sys.modules}
+
+    for language in ("java", "sql"):
+        for workers in (1, 2):
+            options = {**CodeGeneration.default_options(), 'generate_workers': workers}
+            code_gen = CodeGenerators.get(language, syntax_tree, path.join(output_dir, f"{language}{workers}"), options)
+            code_gen.mp_context = get_context("spawn")
+            code_gen.generate_code()
+            results[f"{language}{workers}"] = {
+                'diagnostics': [str(d) for d in code_gen.diagnostics],
+                'files': {path.basename(f): open(f).read() for f in code_gen.files},
+            }
+
+    print(json.dumps(results))
+"""
+
+
+class ParallelGenerationTest(unittest.TestCase):
+
+    def test_spawned_workers_match_serial_generation(self):
+        with TemporaryDirectory() as temp_dir:
+            with redirect_stdout(StringIO()):
+                syntax_tree = DiagramParser(EXAMPLE_PATH).convert_to_syntax_tree()
+            SyntaxSnapshot(temp_dir).save(EXAMPLE_PATH, syntax_tree)
+
+            script_path = path.join(temp_dir, "spawn_generation.py")
+            with open(script_path, "w") as f:
+                f.write(SPAWN_SCRIPT)
+
+            process = subprocess.run([sys.executable, script_path, EXAMPLE_PATH, temp_dir, temp_dir],
+                                     cwd=ROOT_DIR, env={'PYTHONPATH': ROOT_DIR}, capture_output=True, text=True)
+            self.assertEqual(process.returncode, 0, process.stderr)
+            results = json.loads(process.stdout.splitlines()[-1])
+
+        self.assertFalse(results['style_parser_imported'])
+
+        for language in ("java", "sql"):
+            serial, parallel = results[f"{language}1"], results[f"{language}2"]
+            self.assertTrue(serial['files'])
+            self.assertEqual(parallel['diagnostics'], serial['diagnostics'])
+            self.assertEqual(parallel['files'], serial['files'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from tempfile import TemporaryDirectory
+
+from parsers.diagram_parser import DiagramParser
+from parsers.syntax_parser import SyntaxParser
+
+
+ROOT_DIR = path.dirname(path.dirname(path.abspath(__file__)))
+EXAMPLE_PATH = path.join(ROOT_DIR, "examples", "simple_class_diagram.drawio")
+
+
+class RelationshipTest(unittest.TestCase):
+    def test_missing_arrows_read_as_drawio_defaults(self):
+        self.assertEqual(SyntaxParser.relationship_key({'endArrow': "open", 'endFill': "1"}),
+                         ("none", "open", False, True, False))
+        self.assertEqual(SyntaxParser.relationship_key({}), ("none", "classic", False, False, False))
+        self.assertEqual(SyntaxParser({}).classify_relationship(SyntaxParser.relationship_key({'endArrow': "open"})),
+                         "association")
+        self.assertIsNone(SyntaxParser({}).classify_relationship(SyntaxParser.relationship_key({'html': "1"})))
+
+    def test_json_rules_match_tuple_rules(self):
+        tuple_rules = SyntaxParser.compile_relationship_rules({("diamond", "open", True, None, False): "composition"})
+        string_rules = SyntaxParser.compile_relationship_rules({"Diamond|open|1|*|false": "composition"})
+        list_rules = SyntaxParser.compile_relationship_rules(
+            [{'startArrow': "diamond", 'endArrow': "open", 'startFill': True, 'dashed': False, 'kind': "composition"}]
+        )
+
+        self.assertEqual(tuple_rules[("diamond", "open", True, None, False)], "composition")
+        self.assertEqual(string_rules, tuple_rules)
+        self.assertEqual(list_rules, tuple_rules)
+
+    def test_invalid_rules_are_rejected(self):
+        for rules in ({"none|open|1": "association"}, {"none|open|maybe|*|*": "association"},
+                      [{'endArrow': "open", 'kind': "uses"}], [{'endArrow': "open"}]):
+            with self.subTest(rules=rules), self.assertRaises(ValueError):
+                SyntaxParser.compile_relationship_rules(rules)
+
+    def parse_example(self, edge_style=None):
+        with open(EXAMPLE_PATH) as f:
+            diagram = f.read()
+
+        if edge_style is not None:  # restyle the edge from Person to the Gender enumeration
+            diagram = diagram.replace('style="endArrow=open;endFill=1;endSize=12;html=1;rounded=0;entryX=1;',
+                                      f'style="{edge_style}entryX=1;')
+
+        with TemporaryDirectory() as temp_dir:
+            diagram_path = path.join(temp_dir, "diagram.drawio")
+
+            with open(diagram_path, "w") as f:
+                f.write(diagram)
+
+            diagram_parser = DiagramParser(diagram_path)
+
+            with redirect_stdout(StringIO()):
+                syntax_tree = diagram_parser.convert_to_syntax_model()
+
+        person_id, gender_id = syntax_tree.class_ids["Person"], syntax_tree.class_ids["Gender"]
+        return diagram_parser, syntax_tree, person_id, gender_id
+
+    def test_example_has_no_diagnostics(self):
+        diagram_parser, syntax_tree, person_id, gender_id = self.parse_example()
+
+        self.assertEqual([str(d) for d in diagram_parser.diagnostics], [])
+        self.assertEqual(syntax_tree[person_id]['relationships']['association'], [('to', gender_id)])
+        self.assertEqual(syntax_tree[gender_id]['relationships']['association'], [('from', person_id)])
+
+    def test_edge_without_end_arrow_is_reported(self):
+        diagram_parser, syntax_tree, person_id, gender_id = self.parse_example("html=1;rounded=0;")
+
+        self.assertEqual([str(d) for d in diagram_parser.diagnostics],
+                         ["[syntax] hERFFzNCHQRFeF2-G3bh-6: unclassified relationship, no rule for (startArrow, "
+                          "endArrow, startFill, endFill, dashed) = ('none', 'classic', False, False, False)"])
+        self.assertEqual(syntax_tree[person_id]['relationships']['association'], [])
+
+    def test_edge_with_no_end_arrow_is_an_association(self):
+        diagram_parser, syntax_tree, person_id, gender_id = self.parse_example("endArrow=none;html=1;rounded=0;")
+
+        self.assertEqual([str(d) for d in diagram_parser.diagnostics], [])
+        self.assertEqual(syntax_tree[person_id]['relationships']['association'], [('to', gender_id)])
+        self.assertEqual(syntax_tree[gender_id]['relationships']['association'], [('from', person_id)])
+
+if __name__ == "__main__":
+    unittest.main()
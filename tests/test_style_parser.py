@@ -0,0 +1,151 @@
+import pickle
+import random
+import unittest
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from tempfile import TemporaryDirectory
+from types import MappingProxyType
+
+from lxml import etree
+
+from decode.convert_to_readable import DecodeAndDecompress
+from parsers.diagram_parser import DiagramParser
+from parsers.style_parser import StyleParser
+
+
+ROOT_DIR = path.dirname(path.dirname(path.abspath(__file__)))
+EXAMPLE_PATH = path.join(ROOT_DIR, "examples", "simple_class_diagram.drawio")
+
+
+# HTML labels of draw.io class cells, with the values they split into, as BeautifulSoup used to read them
+HTML_LABELS = {
+    '<p style="margin:0px;margin-top:4px;text-align:center;"><b>Person</b></p><hr size="1"/>'
+    '<div style="height:2px;"></div><p style="margin:0px;margin-left:4px;">+ name: String<br>- age: int</p>'
+    '<hr size="1"/><p style="margin:0px;margin-left:4px;">+ getName(): String</p>':
+        [['Person'], ['+name:String', '-age:int'], ['+getName():String']],
+    '<p style="margin:0px;margin-top:4px;text-align:center;"><i>&lt;&lt;Interface&gt;&gt;</i><br/><b>Shape</b></p>'
+    '<hr size="1"/><p style="margin:0px;margin-left:4px;">+ area(): double<br/>+ perimeter(): double</p>':
+        [['<<Interface>>Shape'], ['+area():double', '+perimeter():double']],
+    '&lt;&lt;enumeration&gt;&gt;<div>Gender</div>': [['<<enumeration>>Gender']],
+    '<b>Order</b>&nbsp;': [['Order']],
+    '<span style="font-weight: normal;">+ id: int</span>': [['+id:int']],
+    '<font color="#ff0000">- secret: str</font>': [['-secret:str']],
+    '<div><b>Account</b></div><div><br></div>': [['Account']],
+    'Tom &amp; Jerry': [['Tom&Jerry']],
+    '<!-- note --><b>N</b>': [['N']],
+    '<p>&#43; x: int&#10;&#45; y: int</p>': [['+x:int', '-y:int']],
+    '<table><tr><td>+ a: int</td></tr><tr><td>- b: int</td></tr></table>': [['+a:int', '-b:int']],
+}
+
+
+class HtmlLabelTest(unittest.TestCase):
+    def test_html_labels(self):
+        style_parser = StyleParser(None)
+
+        for label, values in HTML_LABELS.items():
+            with self.subTest(label=label):
+                cell = style_parser.add_cells({'id': "c", 'parent': "1", 'style': "", 'value': label}, "1")
+
+                self.assertEqual(cell.values, values)
+                self.assertEqual(cell.style['type'], "html")
+
+    def test_styles_are_read_only_and_pickled_with_the_style_tree(self):
+        page_xml = "".join(decoded_xml for _, _, decoded_xml in DecodeAndDecompress.iter_pages(EXAMPLE_PATH))
+
+        with redirect_stdout(StringIO()):
+            style_tree = StyleParser(page_xml).convert_to_style_tree()
+
+        cells = list(style_tree['root'].cells.values())
+        style = cells[0].style
+
+        with self.assertRaises(TypeError):
+            style['type'] = "text"
+
+        loaded_cells = list(pickle.loads(pickle.dumps(style_tree))['root'].cells.values())
+
+        self.assertEqual([cell.to_dict() for cell in loaded_cells], [cell.to_dict() for cell in cells])
+        # the cells sharing a style still share it
+        self.assertEqual(len({id(cell.style) for cell in loaded_cells}), len({id(cell.style) for cell in cells}))
+
+        # pickling is not changed for the other read-only mappings
+        with self.assertRaises(TypeError):
+            pickle.dumps(MappingProxyType({}))
+
+    def test_html_to_text(self):
+        self.assertEqual(StyleParser.html_to_text("  + a: int"), "+ a: int")
+        self.assertEqual(StyleParser.html_to_text("&amp;lt;"), "&lt;")
+        self.assertEqual(StyleParser.html_to_text("<b>a</b><br>b"), "ab")
+
+
+class FuzzTest(unittest.TestCase):
+    LABEL_FRAGMENTS = ['<b>', '</b>', '<br>', '<hr size="1"/>', '<div style="a:b;">', '</div', '<!-- c', '<script>',
+                       '&lt;', '&gt;', '&amp;', '&nbsp;', '&#43;', '&#xZZ;', '&', '<<', '>>', '<', '>', '"', '\xa0',
+                       '+', '-', '#', '+ ', ' ', '\t', '\n', 'name', ': int', '()', '(', ')', '{pk', '}', '=', ':',
+                       'List<int>']
+    STYLE_FRAGMENTS = ['swimlane', 'text', 'html=1', 'endArrow=', 'startArrow=open', 'endFill=x', 'dashed=1',
+                       'fontStyle=2', 'a=b=c', '=', '==', '']
+
+    @staticmethod
+    def split_label(values):
+        """ The character loop get_text_values replaced, as the reference of its output """
+        values = StyleParser.html_to_text(values.replace("<<", "&lt;&lt;").replace(">>", "&gt;&gt;"))
+        split_values, value = [], ""
+
+        for c in values:
+            if c in ['+', '-', "#"]:
+                if value:
+                    split_values.append(value.strip().replace(" ", ""))
+                value = ""
+            value += c
+
+        split_values.append(value.strip().replace(" ", ""))
+        return split_values
+
+    def random_text(self, rng, fragments, max_count, separator=""):
+        return separator.join(rng.choice(fragments) for _ in range(rng.randint(0, max_count)))
+
+    def test_labels_split_like_the_character_loop(self):
+        style_parser = StyleParser(None)
+        rng = random.Random(11)
+
+        for _ in range(5000):
+            label = self.random_text(rng, self.LABEL_FRAGMENTS, 20)
+            self.assertEqual(style_parser.get_text_values(label), self.split_label(label), label)
+
+    def test_malformed_cells_are_reported(self):
+        page_xml = "".join(decoded_xml for _, _, decoded_xml in DecodeAndDecompress.iter_pages(EXAMPLE_PATH))
+        rng = random.Random(11)
+
+        with TemporaryDirectory() as temp_dir:
+            diagram_path = path.join(temp_dir, "diagram.drawio")
+
+            for _ in range(20):
+                root = etree.fromstring(page_xml)
+
+                for cell in root.iter("mxCell"):
+                    if cell.get("value") is not None and rng.random() < 0.3:
+                        cell.set("value", self.random_text(rng, self.LABEL_FRAGMENTS, 12))
+                    if cell.get("style") is not None and rng.random() < 0.2:
+                        cell.set("style", self.random_text(rng, self.STYLE_FRAGMENTS, 5, ";"))
+
+                with open(diagram_path, "w") as f:
+                    f.write(f'<mxfile><diagram name="Page-1" id="p1">{etree.tostring(root, encoding="unicode")}'
+                            '</diagram></mxfile>')
+
+                # the problems are collected, and reading the page as a stream finds the same ones
+                parsed = []
+                for keep_style_trees in (True, False):
+                    diagram_parser = DiagramParser(diagram_path, keep_style_trees=keep_style_trees)
+
+                    with redirect_stdout(StringIO()):
+                        syntax_tree = diagram_parser.convert_to_syntax_tree()
+
+                    parsed.append((syntax_tree, [str(d) for d in diagram_parser.diagnostics]))
+
+                self.assertEqual(parsed[0], parsed[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import pickle
+import random
+import unittest
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from tempfile import TemporaryDirectory
+
+from parsers.diagram_parser import DiagramParser
+from parsers.syntax_snapshot import SyntaxSnapshot
+
+
+ROOT_DIR = path.dirname(path.dirname(path.abspath(__file__)))
+EXAMPLE_PATH = path.join(ROOT_DIR, "examples", "simple_class_diagram.drawio")
+
+
+class SyntaxSnapshotTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.snapshot = SyntaxSnapshot(temp_dir.name)
+
+        with redirect_stdout(StringIO()):
+            self.syntax_tree = DiagramParser(EXAMPLE_PATH).convert_to_syntax_tree()
+
+        self.snapshot_path = self.snapshot.save(EXAMPLE_PATH, self.syntax_tree)
+
+        with open(self.snapshot_path, "rb") as f:
+            self.snapshot_bytes = f.read()
+
+    def load(self, snapshot_bytes):
+        with open(self.snapshot_path, "wb") as f:
+            f.write(snapshot_bytes)
+
+        return self.snapshot.load(EXAMPLE_PATH)
+
+    def test_snapshot_round_trip(self):
+        self.assertEqual(self.snapshot.load(EXAMPLE_PATH), self.syntax_tree)
+        self.assertIsNone(self.snapshot.load(EXAMPLE_PATH, {("none", "open", False, False, False): "association"}))
+
+    def test_corrupted_snapshots_are_misses(self):
+        rng = random.Random(18)
+        header_size = len(pickle.dumps(pickle.loads(self.snapshot_bytes), SyntaxSnapshot.PICKLE_PROTOCOL))
+
+        for size in (0, 1, header_size // 2, header_size, len(self.snapshot_bytes) - 1):
+            with self.subTest(truncated_to=size):
+                self.assertIsNone(self.load(self.snapshot_bytes[:size]))
+
+        for _ in range(500):
+            snapshot_bytes = bytearray(self.snapshot_bytes)
+            for _ in range(rng.randint(1, 3)):
+                snapshot_bytes[rng.randrange(len(snapshot_bytes))] ^= 1 << rng.randrange(8)
+
+            with self.subTest(snapshot_bytes=snapshot_bytes):
+                self.assertIsNone(self.load(bytes(snapshot_bytes)))
+
+    def test_corrupted_snapshot_is_parsed_again(self):
+        self.load(self.snapshot_bytes[:-16] + bytes(16))
+
+        diagram_parser = DiagramParser(EXAMPLE_PATH, snapshot=self.snapshot)
+        with redirect_stdout(StringIO()) as stdout:
+            self.assertEqual(diagram_parser.convert_to_syntax_tree(), self.syntax_tree)
+
+        self.assertNotIn("<<< SYNTAX SNAPSHOT LOADED >>>", stdout.getvalue())
+        self.assertEqual(self.snapshot.load(EXAMPLE_PATH), self.syntax_tree)
+
+
+if __name__ == "__main__":
+    unittest.main()
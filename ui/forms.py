@@ -35,7 +35,7 @@ class MainFrameBase ( wx.Frame ):
 
         formSizer.Add( self.m_staticText1, 0, wx.ALIGN_CENTER_VERTICAL|wx.ALL, 5 )
 
-        self.fpcDiagramPath = wx.FilePickerCtrl( self, wx.ID_ANY, wx.EmptyString, u"Open a diagram", u"Draw.io diagram files (*.drawio)|*.drawio|All files (*.*)|*.*", wx.DefaultPosition, wx.DefaultSize, wx.FLP_DEFAULT_STYLE|wx.FLP_USE_TEXTCTRL )
+        self.fpcDiagramPath = wx.FilePickerCtrl( self, wx.ID_ANY, wx.EmptyString, u"Open a diagram", u"Draw.io diagram files (*.drawio;*.drawio.svg;*.drawio.png)|*.drawio;*.drawio.svg;*.drawio.png|All files (*.*)|*.*", wx.DefaultPosition, wx.DefaultSize, wx.FLP_DEFAULT_STYLE|wx.FLP_USE_TEXTCTRL )
         self.fpcDiagramPath.SetToolTip( u"Open a file dialog and browse to choose a draw.io class diagram file" )
 
         formSizer.Add( self.fpcDiagramPath, 1, wx.ALIGN_CENTER_VERTICAL|wx.ALL|wx.EXPAND, 5 )
@@ -136,6 +136,13 @@ class MainFrameBase ( wx.Frame ):
         self.btnAbout.SetBitmap( wx.Bitmap( self.asset_path( u"assets/icons/help.png" ), wx.BITMAP_TYPE_ANY ) )
         buttonSizer.Add( self.btnAbout, 0, wx.ALL, 5 )
 
+        self.btnClearCache = wx.Button( self, wx.ID_ANY, u"Clear cache", wx.DefaultPosition, wx.DefaultSize, 0 )
+
+        self.btnClearCache.SetBitmap( wx.Bitmap( self.asset_path( u"assets/icons/delete.png" ), wx.BITMAP_TYPE_ANY ) )
+        self.btnClearCache.SetToolTip( u"Remove the decoded diagrams kept in the cache" )
+
+        buttonSizer.Add( self.btnClearCache, 0, wx.ALL, 5 )
+
 
         buttonSizer.Add( ( 0, 0), 1, wx.EXPAND, 5 )
 
@@ -179,6 +186,7 @@ class MainFrameBase ( wx.Frame ):
         self.fpcDiagramPath.Bind( wx.EVT_FILEPICKER_CHANGED, self.fpcDiagramPathOnFileChanged )
         self.btnLangOptions.Bind( wx.EVT_BUTTON, self.btnLangOptionsOnButtonClick )
         self.btnAbout.Bind( wx.EVT_BUTTON, self.btnAboutOnButtonClick )
+        self.btnClearCache.Bind( wx.EVT_BUTTON, self.btnClearCacheOnButtonClick )
         self.btnParse.Bind( wx.EVT_BUTTON, self.btnParseOnButtonClick )
         self.btnGenerate.Bind( wx.EVT_BUTTON, self.btnGenerateOnButtonClick )
         self.btnExit.Bind( wx.EVT_BUTTON, self.btnExitOnButtonClick )
@@ -200,6 +208,9 @@ class MainFrameBase ( wx.Frame ):
     def btnAboutOnButtonClick( self, event ):
         event.Skip()
 
+    def btnClearCacheOnButtonClick( self, event ):
+        event.Skip()
+
     def btnParseOnButtonClick( self, event ):
         event.Skip()
 
@@ -302,6 +313,16 @@ class OptionDialogBase ( wx.Dialog ):
 
         formSizer.Add( self.m_staticText26, 0, wx.BOTTOM|wx.LEFT|wx.RIGHT, 5 )
 
+        self.m_staticText28 = wx.StaticText( commonOptionsSizer.GetStaticBox(), wx.ID_ANY, u"Parser workers:", wx.DefaultPosition, wx.DefaultSize, 0 )
+        self.m_staticText28.Wrap( -1 )
+
+        formSizer.Add( self.m_staticText28, 0, wx.ALIGN_CENTER_VERTICAL|wx.ALL, 5 )
+
+        self.spnParseWorkers = wx.SpinCtrl( commonOptionsSizer.GetStaticBox(), wx.ID_ANY, wx.EmptyString, wx.DefaultPosition, wx.DefaultSize, wx.SP_ARROW_KEYS, 1, 64, 1 )
+        self.spnParseWorkers.SetToolTip( u"Number of worker processes used to parse the pages of a multi-page diagram" )
+
+        formSizer.Add( self.spnParseWorkers, 0, wx.ALIGN_CENTER_VERTICAL|wx.ALL, 5 )
+
 
         commonOptionsSizer.Add( formSizer, 0, wx.EXPAND, 5 )
 
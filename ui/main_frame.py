@@ -5,10 +5,9 @@ import wx.adv as adv
 from os import path
 from io import StringIO
 from startfile import startfile
-from decode.convert_to_readable import DecodeAndDecompress
-from parsers.style_parser import StyleParser
-from parsers.syntax_parser import SyntaxParser
-from generators.code_generators import CodeGenerators
+from decode.diagram_cache import DiagramCache
+from parsers.diagram_parser import DiagramParser
+from generators.code_generation import CodeGeneration
 from ui.host_platform import FACES, adjust_window_to_display
 from ui.persistent_window import PersistentWindow
 from ui.forms import MainFrameBase
@@ -24,6 +23,7 @@ class MainFrame (MainFrameBase, PersistentWindow):
         PersistentWindow.__init__(self, "main_frame.json")
         self.syntax_tree = None
         self.options = self.default_options()
+        self.diagram_cache = DiagramCache(path.join(self.config_path, "cache"))
         self.original_stdout = sys.stdout
         self.captured_output = sys.stdout = StringIO()
 
@@ -56,66 +56,7 @@ class MainFrame (MainFrameBase, PersistentWindow):
 
     @staticmethod
     def default_options():
-        return {
-            'package': "com.example",
-            'generate': {
-                'default_ctor': False,
-                'full_arg_ctor': False,
-                'equal_hashcode': False,
-                'to_string': False
-            },
-            'encapsulate_all_props': False,
-            'infer_keys': False,
-            'pk_pattern': "^(@class)?_?(id|pk|key)$",
-            'language_specific': {
-                'java': {
-                    'use_lombok': False,
-                    'add_builder': False,
-                    'add_jpa': False,
-                    'use_jakarta': False,
-                    'temporal_types': "java8_local",
-                    'imports': {
-                        'java.math': ["BigInteger", "BigDecimal"],
-                        'java.util': ["Objects", "Set", "HashSet", "UUID"],
-                    }
-                },
-                'cs': {
-                    'add_efcore': False,
-                    'imports': {
-                        'System': None,
-                        'System.Collections.Generic': None,
-                        'System.Numerics': None,
-                    }
-                },
-                'cpp': {
-                    'use_boost': False,
-                    'naming': "pascal",
-                    'lbrace_same_line': False,
-                    'imports': {
-                        '<ctime>': None,
-                        '<string>': ["std::string", "std::wstring"],
-                        '<array>': ["std::array"],
-                        '<vector>': ["std::vector"],
-                    },
-                },
-                'python': {
-                    'imports': {},
-                },
-                'ts': {
-                    'optional_props': True,
-                    'imports': {},
-                },
-                'php': {
-                    'imports': {},
-                },
-                'sql': {
-                    'dialect': "ansi",
-                    'single_script': True,
-                    'filename': "database",
-                },
-            },
-        }
-
+        return CodeGeneration.default_options()
 
     def update_log(self):
         self.rtcStdout.SetValue(self.captured_output.getvalue())
@@ -154,22 +95,34 @@ class MainFrame (MainFrameBase, PersistentWindow):
 
         adv.AboutBox(info)
 
+    def btnClearCacheOnButtonClick(self, event):
+        try:
+            self.diagram_cache.clear()
+            print("<<< DIAGRAM CACHE CLEARED >>>")
+        except Exception as e:
+            wx.MessageBox(f"Something went wrong: {e}", "Cache error", wx.OK | wx.ICON_ERROR)
+        finally:
+            self.update_log()
+
     def btnParseOnButtonClick(self, event):
         message = None
 
         try:
-            decoded_xml = DecodeAndDecompress.convert(self.fpcDiagramPath.GetPath())
-
-            if decoded_xml:
-                self.stcDecodedXml.xml_content = decoded_xml
-
-                style_parser = StyleParser(decoded_xml)
-                style_tree = style_parser.convert_to_style_tree()
-                self.tlcStyle.load_dict(style_tree)
-
-                syntax_parser = SyntaxParser(style_tree)
-                self.syntax_tree = syntax_parser.convert_to_syntax_tree()
+            diagram_parser = DiagramParser(self.fpcDiagramPath.GetPath(), self.options['parse_workers'],
+                                           cache=self.diagram_cache,
+                                           relationship_rules=self.options['relationship_rules'],
+                                           fail_fast=self.options['fail_fast'])
+            syntax_tree = diagram_parser.convert_to_syntax_model()
+            style_trees = diagram_parser.style_trees
+
+            if diagram_parser.decoded_xmls:
+                self.stcDecodedXml.xml_content = "\n".join(diagram_parser.decoded_xmls)
+                self.tlcStyle.load_dict(style_trees if len(style_trees) != 1 else next(iter(style_trees.values())))
+                self.syntax_tree = syntax_tree
                 self.tlcSyntax.load_dict(self.syntax_tree)
+
+                if diagram_parser.diagnostics:
+                    message = f"{len(diagram_parser.diagnostics)} problem(s) found in the diagram, see the log"
             else:
                 message = "Failed to decode diagram's XML"
         except Exception as e:
@@ -200,14 +153,17 @@ class MainFrame (MainFrameBase, PersistentWindow):
             return
 
         try:
-            for language in selected_languages:
-                out_dir = self.dpcOutputDir.GetPath()
-                if selected_language_count > 1:
-                    out_dir = path.join(out_dir, language)
-                code_gen = CodeGenerators.get(language, self.syntax_tree, out_dir, self.options)
-                code_gen.generate_code()
-
-            startfile(path.abspath(self.dpcOutputDir.GetPath()))
+            code_generation = CodeGeneration(self.syntax_tree, self.options)
+            results = code_generation.run(sorted(selected_languages), self.dpcOutputDir.GetPath())
+            errors = [f"{result.language}: {result.error}" for result in results if result.error]
+
+            if errors:
+                wx.MessageBox("Something went wrong:\n" + "\n".join(errors),
+                              "Code generation error",
+                              wx.OK | wx.ICON_ERROR)
+
+            if len(errors) < selected_language_count:
+                startfile(path.abspath(self.dpcOutputDir.GetPath()))
         except Exception as e:
             wx.MessageBox(f"Something went wrong: {e}",
                           "Code generation error",
@@ -32,6 +32,7 @@ class OptionDialog(OptionDialogBase, PersistentWindow):
         self.chkInferKeys.SetValue(options['infer_keys'])
         self.txtPKPattern.SetValue(options['pk_pattern'])
         self.chkInferKeysOnCheckBox(None)
+        self.spnParseWorkers.SetValue(options['parse_workers'])
 
         language_specific = options['language_specific']
         languages = ["java", "cs", "cpp", "python", "ts", "php", "sql"]
@@ -84,6 +85,10 @@ class OptionDialog(OptionDialogBase, PersistentWindow):
             'encapsulate_all_props': self.chkEncapsulateAllProps.IsChecked(),
             'infer_keys': self.chkInferKeys.IsChecked(),
             'pk_pattern': self.txtPKPattern.GetValue(),
+            'parse_workers': self.spnParseWorkers.GetValue(),
+            'generate_workers': self.options['generate_workers'],  # not edited in the dialog
+            'relationship_rules': self.options['relationship_rules'],  # not edited in the dialog
+            'fail_fast': self.options['fail_fast'],
             'language_specific': language_specific,
         }
 
@@ -1,6 +1,8 @@
 import wx
 import wx.lib.gizmos as gizmos
 
+from collections.abc import Mapping
+
 
 class SymbolTreeCtrl(gizmos.TreeListCtrl):
 
@@ -30,7 +32,10 @@ class SymbolTreeCtrl(gizmos.TreeListCtrl):
         for key, value in dictionary.items():
             child_node = self.AppendItem(parent_node, str(key))
 
-            if isinstance(value, dict):
+            if hasattr(value, "to_dict"):  # style tree models
+                value = value.to_dict()
+
+            if isinstance(value, Mapping):  # styles are read-only mappings
                 self.SetItemImage(child_node, self.folder_img_ndx, wx.TreeItemIcon_Normal)
                 self.SetItemImage(child_node, self.folder_open_img_ndx, wx.TreeItemIcon_Expanded)
                 self.create_nodes_from_dict(child_node, value)